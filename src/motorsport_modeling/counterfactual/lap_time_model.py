@@ -44,8 +44,8 @@ Interpretation:
 class ModelValidation:
     """Validation metrics for model quality."""
     r2_score: float                    # R² on training data
-    cv_r2_mean: float                  # Mean R² from cross-validation
-    cv_r2_std: float                   # Std dev of CV R²
+    cv_r2_mean: float                  # Mean R² from cross-validation (NaN if skipped)
+    cv_r2_std: float                   # Std dev of CV R² (NaN if skipped)
     mae: float                         # Mean absolute error (seconds)
     sanity_checks_passed: bool         # Did coefficients pass sanity checks?
     sanity_check_results: Dict[str, bool]
@@ -90,14 +90,15 @@ class LapTimeModel:
         Returns:
             Self for method chaining
         """
-        # Prepare features and target (deviation from baseline)
-        X = features_df[self.feature_names].copy()
-        y = features_df['lap_time_delta'].copy()
-
-        # Remove NaN rows
-        mask = ~(X.isna().any(axis=1) | y.isna())
-        X = X[mask]
-        y = y[mask]
+        # Prepare features and target (deviation from baseline) as a single
+        # float array, then drop NaN rows - one allocation, no intermediate frames
+        cols = features_df[self.feature_names + ['lap_time_delta']].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        mask = ~np.isnan(cols).any(axis=1)
+        n_features = len(self.feature_names)
+        X = cols[mask, :n_features]
+        y = cols[mask, n_features]
 
         if len(X) < 10:
             raise ValueError(f"Insufficient data: only {len(X)} valid samples")
@@ -122,7 +123,10 @@ class LapTimeModel:
             print(self.coefficients.summary())
             print(f"\nModel Performance:")
             print(f"  R² Score: {self.validation.r2_score:.3f}")
-            print(f"  Cross-Val R² (LOO): {self.validation.cv_r2_mean:.3f} ± {self.validation.cv_r2_std:.3f}")
+            if self.validation.sanity_checks_passed:
+                print(f"  Cross-Val R² (LOO): {self.validation.cv_r2_mean:.3f} ± {self.validation.cv_r2_std:.3f}")
+            else:
+                print("  Cross-Val R² (LOO): skipped (sanity checks failed)")
             print(f"  Mean Absolute Error: {self.validation.mae:.3f}s")
             print(f"  Sanity Checks: {'✓ PASSED' if self.validation.sanity_checks_passed else '✗ FAILED'}")
 
@@ -147,10 +151,10 @@ class LapTimeModel:
         if not self.is_fitted:
             raise RuntimeError("Model must be fitted before prediction")
 
-        X = features_df[self.feature_names]
+        X = features_df[self.feature_names].to_numpy(dtype=np.float64, na_value=np.nan)
         return self.model.predict(X)
 
-    def _validate(self, X: pd.DataFrame, y: pd.Series) -> ModelValidation:
+    def _validate(self, X: np.ndarray, y: np.ndarray) -> ModelValidation:
         """
         Validate model with cross-validation and sanity checks.
 
@@ -166,23 +170,30 @@ class LapTimeModel:
         r2 = r2_score(y, y_pred)
         mae = mean_absolute_error(y, y_pred)
 
-        # Cross-validation (Leave-One-Out for small datasets)
-        loo = LeaveOneOut()
-        cv_scores = cross_val_score(self.model, X, y, cv=loo, scoring='r2')
-
         # Sanity checks on coefficients
         sanity_checks = {
             'degradation_positive': self.model.coef_[0] > 0,  # More degradation → slower laps
             'consistency_positive': self.model.coef_[1] > 0,  # Less consistent → slower avg
             'traffic_positive': self.model.coef_[2] > 0,      # More traffic → slower laps
         }
+        sanity_checks_passed = all(sanity_checks.values())
+
+        # Cross-validation (Leave-One-Out for small datasets)
+        # Skipped when the coefficients already fail sanity checks - the model
+        # is rejected anyway and LOO refits once per sample
+        if sanity_checks_passed:
+            loo = LeaveOneOut()
+            cv_scores = cross_val_score(self.model, X, y, cv=loo, scoring='r2')
+            cv_r2_mean, cv_r2_std = cv_scores.mean(), cv_scores.std()
+        else:
+            cv_r2_mean, cv_r2_std = np.nan, np.nan
 
         return ModelValidation(
             r2_score=r2,
-            cv_r2_mean=cv_scores.mean(),
-            cv_r2_std=cv_scores.std(),
+            cv_r2_mean=cv_r2_mean,
+            cv_r2_std=cv_r2_std,
             mae=mae,
-            sanity_checks_passed=all(sanity_checks.values()),
+            sanity_checks_passed=sanity_checks_passed,
             sanity_check_results=sanity_checks
         )
 
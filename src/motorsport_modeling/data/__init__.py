@@ -13,13 +13,15 @@ from .loaders import (
     load_endurance_analysis,
     get_available_vehicles,
     get_available_parameters,
-    validate_data_completeness
+    validate_data_completeness,
+    clear_load_cache
 )
 
 from .gps_analysis import (
     identify_corners_from_gps,
     identify_corners_from_brake,
     get_corner_at_position,
+    get_corners_at_positions,
     extract_corner_telemetry,
     validate_corner_identification
 )
@@ -34,9 +36,11 @@ __all__ = [
     'get_available_vehicles',
     'get_available_parameters',
     'validate_data_completeness',
+    'clear_load_cache',
     'identify_corners_from_gps',
     'identify_corners_from_brake',
     'get_corner_at_position',
+    'get_corners_at_positions',
     'extract_corner_telemetry',
     'validate_corner_identification'
 ]
@@ -0,0 +1,214 @@
+"""
+Numba kernels for GPS corner detection and data loading.
+
+Imported lazily by gps_analysis and loaders; importing this module raises ImportError
+when Numba isn't installed so callers can fall back to scipy.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, cache=True)
+def find_peaks_jagged(values, starts, ends, distances, prominence):
+    """
+    Flag peaks in each lap of a flat, lap-contiguous signal.
+
+    Same rules as scipy.signal.find_peaks with `distance` and `prominence`
+    (plateau midpoints, highest-first distance suppression, prominence over
+    the whole lap), with laps processed in parallel. Equal-height peaks
+    closer than `distance` may be tie-broken differently from scipy.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Signal for all laps, each lap contiguous
+    starts, ends : np.ndarray
+        Slice bounds of each lap within `values`
+    distances : np.ndarray
+        Minimum peak separation (samples) for each lap
+    prominence : float
+        Minimum peak prominence
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask over `values`, True at detected peaks
+    """
+    is_peak = np.zeros(values.shape[0], dtype=np.bool_)
+
+    for lap in numba.prange(starts.shape[0]):
+        x = values[starts[lap]:ends[lap]]
+        n = x.shape[0]
+
+        # Local maxima; flat plateaus resolve to their midpoint
+        peaks = np.empty(n // 2 + 1, dtype=np.int64)
+        n_peaks = 0
+        i = 1
+        while i < n - 1:
+            if x[i - 1] < x[i]:
+                i_ahead = i + 1
+                while i_ahead < n - 1 and x[i_ahead] == x[i]:
+                    i_ahead += 1
+                if x[i_ahead] < x[i]:
+                    peaks[n_peaks] = (i + i_ahead - 1) // 2
+                    n_peaks += 1
+                    i = i_ahead
+            i += 1
+        peaks = peaks[:n_peaks]
+
+        # Minimum distance: keep the highest peaks first and drop
+        # their lower neighbours
+        keep = np.ones(n_peaks, dtype=np.bool_)
+        order = np.argsort(x[peaks])
+        for r in range(n_peaks - 1, -1, -1):
+            j = order[r]
+            if not keep[j]:
+                continue
+            k = j - 1
+            while k >= 0 and peaks[j] - peaks[k] < distances[lap]:
+                keep[k] = False
+                k -= 1
+            k = j + 1
+            while k < n_peaks and peaks[k] - peaks[j] < distances[lap]:
+                keep[k] = False
+                k += 1
+
+        # Prominence over the whole lap
+        for j in range(n_peaks):
+            if not keep[j]:
+                continue
+            peak = peaks[j]
+            left_min = x[peak]
+            k = peak
+            while k >= 0 and x[k] <= x[peak]:
+                if x[k] < left_min:
+                    left_min = x[k]
+                k -= 1
+            right_min = x[peak]
+            k = peak
+            while k < n and x[k] <= x[peak]:
+                if x[k] < right_min:
+                    right_min = x[k]
+                k += 1
+            if x[peak] - max(left_min, right_min) >= prominence:
+                is_peak[starts[lap] + peak] = True
+
+    return is_peak
+
+
+@numba.njit(parallel=True, cache=True)
+def valid_lap_mask(lap, lap_time, min_lap_time, max_lap_time):
+    """
+    Flag laps after the first whose time lies strictly within bounds.
+
+    Parameters
+    ----------
+    lap : np.ndarray
+        Lap numbers
+    lap_time : np.ndarray
+        Lap times in seconds (NaN is never valid)
+    min_lap_time, max_lap_time : float
+        Exclusive bounds on a valid lap time
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask, True for valid laps
+    """
+    out = np.empty(lap.shape[0], dtype=np.bool_)
+    for i in numba.prange(lap.shape[0]):
+        out[i] = (lap[i] > 1) and (lap_time[i] > min_lap_time) and (lap_time[i] < max_lap_time)
+    return out
+
+
+@numba.njit(parallel=True, cache=True)
+def assign_laps(codes, times, time_missing, lap, start_ptr, start_times, start_laps):
+    """
+    Recalculate lap numbers from each vehicle's lap start times.
+
+    A row belongs to the last lap of its vehicle that started strictly
+    before it, or lap 0 before the first start. Rows of vehicles without
+    lap starts keep their lap when it's below 100 and are dropped otherwise.
+    Laps are found in parallel; kept rows are then grouped by vehicle code
+    with a stable counting sort.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Vehicle code of each row (-1 for a missing vehicle, always dropped)
+    times : np.ndarray
+        Row timestamps as int64 nanoseconds
+    time_missing : np.ndarray
+        Boolean mask of rows without a timestamp (lap becomes NaN)
+    lap : np.ndarray
+        Original lap numbers
+    start_ptr : np.ndarray
+        CSR offsets: vehicle c's starts are start_ptr[c]:start_ptr[c + 1]
+    start_times : np.ndarray
+        Lap start times as int64 nanoseconds, sorted within each vehicle
+    start_laps : np.ndarray
+        Lap number of each start
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (positions, laps, counts): kept row positions grouped by vehicle
+        code, their float64 lap numbers, and the kept rows per vehicle
+    """
+    n = codes.shape[0]
+    n_vehicles = start_ptr.shape[0] - 1
+    row_laps = np.empty(n, dtype=np.float64)
+    keep = np.empty(n, dtype=np.bool_)
+
+    for i in numba.prange(n):
+        c = codes[i]
+        if c < 0:
+            keep[i] = False
+            row_laps[i] = np.nan
+            continue
+
+        lo = start_ptr[c]
+        hi = start_ptr[c + 1]
+        if lo == hi:
+            keep[i] = lap[i] < 100
+            row_laps[i] = lap[i]
+            continue
+
+        keep[i] = True
+        if time_missing[i]:
+            row_laps[i] = np.nan
+            continue
+
+        # Number of starts strictly before the row (searchsorted side='left')
+        a = lo
+        b = hi
+        while a < b:
+            m = (a + b) // 2
+            if start_times[m] < times[i]:
+                a = m + 1
+            else:
+                b = m
+        row_laps[i] = 0 if a == lo else start_laps[a - 1]
+
+    counts = np.zeros(n_vehicles, dtype=np.int64)
+    for i in range(n):
+        if keep[i]:
+            counts[codes[i]] += 1
+
+    offsets = np.empty(n_vehicles, dtype=np.int64)
+    total = 0
+    for c in range(n_vehicles):
+        offsets[c] = total
+        total += counts[c]
+
+    positions = np.empty(total, dtype=np.int64)
+    laps = np.empty(total, dtype=np.float64)
+    for i in range(n):
+        if keep[i]:
+            k = offsets[codes[i]]
+            positions[k] = i
+            laps[k] = row_laps[i]
+            offsets[codes[i]] = k + 1
+
+    return positions, laps, counts
@@ -10,9 +10,27 @@ This module provides functions to:
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple, Optional
-from scipy.signal import find_peaks
-from sklearn.cluster import DBSCAN
+from collections import OrderedDict
+import hashlib
 import warnings
+import weakref
+
+
+# Mean Earth radius, used to project GPS positions to meters
+EARTH_RADIUS_M = 6_371_000.0
+
+# Most recent GPS KD-trees, keyed by id() of the source frame
+_GPS_TREE_CACHE = OrderedDict()
+_GPS_TREE_CACHE_SIZE = 4
+
+# Most recent corner-location KD-trees, keyed by id() of the corners frame
+_CORNER_TREE_CACHE = OrderedDict()
+_CORNER_TREE_CACHE_SIZE = 4
+
+# Most recent corner detection results, keyed by input content hash and
+# detection parameters
+_CORNER_CACHE = OrderedDict()
+_CORNER_CACHE_SIZE = 16
 
 
 def identify_corners_from_gps(
@@ -23,7 +41,8 @@ def identify_corners_from_gps(
     min_corners: int = 8,
     max_corners: int = 15,
     speed_threshold_percentile: float = 40,
-    verbose: bool = False
+    verbose: bool = False,
+    backend: str = 'sklearn'
 ) -> pd.DataFrame:
     """
     Identify corners from GPS data by clustering speed minima.
@@ -47,9 +66,14 @@ def identify_corners_from_gps(
     max_corners : int, default=15
         Maximum expected corners per lap
     speed_threshold_percentile : float, default=40
-        Only consider speed minima below this percentile as potential corners
+        Only consider speed minima below this percentile (of speed across all
+        analysed laps) as potential corners
     verbose : bool, default=False
         Print progress and diagnostics
+    backend : {'sklearn', 'cuml'}, default='sklearn'
+        DBSCAN implementation. 'cuml' clusters on the GPU via RAPIDS cuML
+        (useful for season-scale inputs) and falls back to scikit-learn with
+        a warning if cuML isn't installed
 
     Returns
     -------
@@ -68,169 +92,37 @@ def identify_corners_from_gps(
     >>> corners = identify_corners_from_gps(gps, verbose=True)
     >>> print(f"Found {len(corners)} corners")
     """
-    if verbose:
-        print("=" * 60)
-        print("GPS CORNER IDENTIFICATION")
-        print("=" * 60)
-        print(f"Input: {len(gps_data):,} GPS points")
-
     # Ensure we have speed data
     if speed_col not in gps_data.columns:
         # If speed is in wide format, we need to handle it
         # For now, raise error
         raise ValueError(f"Speed column '{speed_col}' not found in GPS data")
 
-    # Step 1: Find speed minima for each lap
-    speed_minima = []
-
-    laps = gps_data['lap'].unique()
-    if verbose:
-        print(f"Analyzing {len(laps)} laps")
-
-    for lap in laps:
-        lap_data = gps_data[gps_data['lap'] == lap].copy()
-
-        if len(lap_data) < 50:
-            # Not enough data points for this lap
-            continue
-
-        # Sort by timestamp to ensure correct order
-        lap_data = lap_data.sort_values('timestamp')
-
-        # Find local minima in speed
-        # Use negative speed to find minima with find_peaks
-        speeds = lap_data[speed_col].values
-
-        # Skip if too many NaN values
-        if np.isnan(speeds).sum() > len(speeds) * 0.5:
-            continue
-
-        # Interpolate NaN values
-        speeds = pd.Series(speeds).interpolate().values
-
-        # Only consider speeds below threshold
-        speed_threshold = np.percentile(speeds, speed_threshold_percentile)
-
-        # Find peaks in -speed (i.e., minima in speed)
-        # Require minimum distance between peaks (avoid detecting same corner twice)
-        min_distance = len(speeds) // (max_corners * 2)  # Rough estimate
-        peaks, properties = find_peaks(
-            -speeds,
-            distance=max(min_distance, 10),
-            prominence=5  # Require at least 5 km/h drop
-        )
-
-        # Filter to only low-speed peaks
-        low_speed_peaks = peaks[speeds[peaks] < speed_threshold]
-
-        # Get GPS coordinates at these minima
-        for peak_idx in low_speed_peaks:
-            if peak_idx < len(lap_data):
-                row = lap_data.iloc[peak_idx]
-                speed_minima.append({
-                    'lap': lap,
-                    'latitude': row[lat_col],
-                    'longitude': row[lon_col],
-                    'speed': row[speed_col],
-                    'vehicle_number': row.get('vehicle_number', None)
-                })
-
-    if len(speed_minima) == 0:
-        raise ValueError("No speed minima found. Check data quality.")
-
-    speed_minima_df = pd.DataFrame(speed_minima)
-
-    if verbose:
-        print(f"Found {len(speed_minima)} speed minima across all laps")
-        print(f"Average: {len(speed_minima) / len(laps):.1f} per lap")
-
-    # Step 2: Cluster minima to identify unique corners
-    # Use DBSCAN to cluster nearby minima (same corner across different laps)
-
-    coords = speed_minima_df[[lat_col, lon_col]].values
-
-    # Epsilon: maximum distance between points in same cluster
-    # For GPS coordinates, ~0.0001 degrees ≈ 11 meters
-    # Corners should be within ~20 meters of each other across laps
-    eps = 0.0002  # ~22 meters
-
-    clustering = DBSCAN(eps=eps, min_samples=max(2, len(laps) // 3)).fit(coords)
-    speed_minima_df['cluster'] = clustering.labels_
-
-    # Remove noise points (cluster = -1)
-    clustered = speed_minima_df[speed_minima_df['cluster'] >= 0].copy()
-
-    if len(clustered) == 0:
-        warnings.warn("DBSCAN found no valid clusters. Trying larger epsilon.")
-        # Retry with larger epsilon
-        eps = 0.0004
-        clustering = DBSCAN(eps=eps, min_samples=2).fit(coords)
-        speed_minima_df['cluster'] = clustering.labels_
-        clustered = speed_minima_df[speed_minima_df['cluster'] >= 0].copy()
-
-    n_clusters = len(clustered['cluster'].unique())
-
-    if verbose:
-        print(f"Clustered into {n_clusters} unique corners")
-
-    # Check if we have reasonable number of corners
-    if n_clusters < min_corners:
-        warnings.warn(
-            f"Found only {n_clusters} corners, expected at least {min_corners}. "
-            "Track may have fewer corners or data quality issues."
-        )
-    elif n_clusters > max_corners:
-        warnings.warn(
-            f"Found {n_clusters} corners, expected at most {max_corners}. "
-            "May need to adjust clustering parameters."
-        )
-
-    # Step 3: Calculate corner statistics
-    corners = []
-
-    for cluster_id in sorted(clustered['cluster'].unique()):
-        cluster_data = clustered[clustered['cluster'] == cluster_id]
-
-        corner_info = {
-            'corner_id': len(corners) + 1,  # 1-indexed
-            'latitude': cluster_data[lat_col].mean(),
-            'longitude': cluster_data[lon_col].mean(),
-            'min_speed': cluster_data[speed_col].median(),
-            'speed_std': cluster_data[speed_col].std(),
-            'n_observations': len(cluster_data),
-        }
-
-        # Classify corner type by speed
-        if corner_info['min_speed'] < 60:
-            corner_info['corner_type'] = 'slow'
-        elif corner_info['min_speed'] < 90:
-            corner_info['corner_type'] = 'medium'
-        else:
-            corner_info['corner_type'] = 'fast'
-
-        corners.append(corner_info)
-
-    corners_df = pd.DataFrame(corners)
-
-    # Sort corners by track position (approximate by latitude + longitude)
-    # This gives a rough ordering around the track
-    # Better would be to use lap distance if available
-    corners_df = corners_df.sort_values(['latitude', 'longitude']).reset_index(drop=True)
-    corners_df['corner_id'] = range(1, len(corners_df) + 1)
-
-    if verbose:
-        print("\nCorner Summary:")
-        print(f"  Slow corners (<60 km/h): {len(corners_df[corners_df['corner_type'] == 'slow'])}")
-        print(f"  Medium corners (60-90 km/h): {len(corners_df[corners_df['corner_type'] == 'medium'])}")
-        print(f"  Fast corners (>90 km/h): {len(corners_df[corners_df['corner_type'] == 'fast'])}")
-        print("\nCorner Details:")
-        for _, corner in corners_df.iterrows():
-            print(f"  Corner {corner['corner_id']}: {corner['corner_type']:6s} "
-                  f"({corner['min_speed']:.1f} km/h) "
-                  f"at ({corner['latitude']:.5f}, {corner['longitude']:.5f})")
-        print("=" * 60)
-
-    return corners_df
+    return _identify_corners_by_extrema(
+        gps_data,
+        signal_col=speed_col,
+        mode='min',
+        lat_col=lat_col,
+        lon_col=lon_col,
+        min_corners=min_corners,
+        max_corners=max_corners,
+        threshold_percentile=speed_threshold_percentile,
+        smooth_window=1,
+        value_name='min_speed',
+        std_name='speed_std',
+        type_bins=[60, 90],
+        type_labels={
+            'slow': 'Slow corners (<60 km/h)',
+            'medium': 'Medium corners (60-90 km/h)',
+            'fast': 'Fast corners (>90 km/h)',
+        },
+        extrema_name='speed minima',
+        unit='km/h',
+        title='GPS CORNER IDENTIFICATION',
+        order_by_position=True,
+        verbose=verbose,
+        backend=backend
+    )
 
 
 def get_corner_at_position(
@@ -265,27 +157,81 @@ def get_corner_at_position(
     >>> if corner_id:
     ...     print(f"Currently at corner {corner_id}")
     """
-    # Calculate distance to each corner
-    distances = np.sqrt(
-        (corners['latitude'] - latitude)**2 +
-        (corners['longitude'] - longitude)**2
+    corner_ids = get_corners_at_positions(
+        corners, [latitude], [longitude], max_distance=max_distance
     )
 
-    min_distance = distances.min()
-
-    if min_distance < max_distance:
-        corner_idx = distances.idxmin()
-        return corners.loc[corner_idx, 'corner_id']
+    if corner_ids[0] >= 0:
+        return corner_ids[0]
 
     return None
 
 
+def get_corners_at_positions(
+    corners: pd.DataFrame,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    max_distance: float = 0.0005
+) -> np.ndarray:
+    """
+    Find which corner (if any) is at each of many GPS positions.
+
+    Batched version of get_corner_at_position(). Corner locations are
+    indexed with a KD-tree, which is cached per corners frame (outside the
+    frame) so repeated calls with the same corners skip the rebuild.
+
+    Parameters
+    ----------
+    corners : pd.DataFrame
+        Output from identify_corners_from_gps()
+    latitudes : array-like
+        GPS latitudes
+    longitudes : array-like
+        GPS longitudes
+    max_distance : float, default=0.0005
+        Maximum distance (in degrees) to consider as "at corner"
+        ~0.0005 degrees ≈ 55 meters
+
+    Returns
+    -------
+    np.ndarray
+        Corner ID of the nearest corner for each position, or -1 where no
+        corner is within max_distance
+
+    Examples
+    --------
+    >>> corner_ids = get_corners_at_positions(
+    ...     corners, gps['latitude'], gps['longitude']
+    ... )
+    >>> gps['corner_id'] = corner_ids
+    """
+    corner_coords = corners[['latitude', 'longitude']].to_numpy(dtype=np.float64)
+    tree = _get_corner_tree(corners, corner_coords)
+
+    points = np.column_stack([
+        np.asarray(latitudes, dtype=np.float64),
+        np.asarray(longitudes, dtype=np.float64)
+    ])
+    if len(corner_coords) == 0:
+        return np.full(len(points), -1)
+
+    distances, idx = tree.query(points, distance_upper_bound=max_distance)
+
+    corner_ids = corners['corner_id'].to_numpy()
+    return np.where(
+        np.isfinite(distances),
+        corner_ids[np.clip(idx, 0, len(corner_ids) - 1)],
+        -1
+    )
+
+
 def extract_corner_telemetry(
     telemetry: pd.DataFrame,
     gps_data: pd.DataFrame,
     corners: pd.DataFrame,
     corner_id: int,
     window_distance: float = 100,  # meters
+    tolerance: pd.Timedelta = pd.Timedelta('50ms'),
     verbose: bool = False
 ) -> pd.DataFrame:
     """
@@ -306,6 +252,9 @@ def extract_corner_telemetry(
     window_distance : float, default=100
         Distance (meters) before/after corner to include
         ~0.001 degrees latitude ≈ 111 meters
+    tolerance : pd.Timedelta, default=50ms
+        Maximum time gap when matching each telemetry sample to its nearest
+        GPS sample (the two streams are logged at different rates)
     verbose : bool, default=False
         Print extraction info
 
@@ -328,24 +277,48 @@ def extract_corner_telemetry(
     # 1 degree latitude ≈ 111 km
     window_deg = window_distance / 111000
 
-    # Find GPS points near corner
-    near_corner = (
-        (np.abs(gps_data['latitude'] - corner['latitude']) < window_deg) &
-        (np.abs(gps_data['longitude'] - corner['longitude']) < window_deg)
-    )
+    # Find GPS points near corner: the spatial index narrows the search to
+    # a handful of points, then the exact distance test runs on those only
+    tree, gps_coords = _get_gps_tree(gps_data)
+    candidates = np.sort(np.asarray(
+        tree.query_ball_point([corner['latitude'], corner['longitude']], r=window_deg),
+        dtype=np.intp
+    ))
+    d_lat = gps_coords[candidates, 0] - corner['latitude']
+    d_lon = gps_coords[candidates, 1] - corner['longitude']
+    near_corner = candidates[(d_lat ** 2 + d_lon ** 2) < window_deg ** 2]
 
-    corner_gps = gps_data[near_corner]
+    corner_gps = gps_data.iloc[near_corner]
 
     if len(corner_gps) == 0:
         raise ValueError(f"No GPS data found near corner {corner_id}")
 
-    # Merge with telemetry based on timestamp
+    # Match each telemetry sample to the nearest GPS sample in time
     # This assumes both dataframes have timestamp column
-    corner_telemetry = telemetry.merge(
-        corner_gps[['timestamp', 'latitude', 'longitude']],
+    if not telemetry['timestamp'].is_monotonic_increasing:
+        telemetry = telemetry.sort_values('timestamp')
+    if not corner_gps['timestamp'].is_monotonic_increasing:
+        corner_gps = corner_gps.sort_values('timestamp')
+
+    by_vehicle = (
+        'vehicle_number'
+        if 'vehicle_number' in telemetry.columns and 'vehicle_number' in corner_gps.columns
+        else None
+    )
+    gps_cols = ['timestamp', 'latitude', 'longitude'] + ([by_vehicle] if by_vehicle else [])
+
+    corner_telemetry = pd.merge_asof(
+        telemetry,
+        corner_gps[gps_cols].assign(_gps_matched=True),
         on='timestamp',
-        how='inner'
+        by=by_vehicle,
+        direction='nearest',
+        tolerance=tolerance
     )
+    # Keep only telemetry that found a GPS sample near the corner
+    corner_telemetry = corner_telemetry[
+        corner_telemetry['_gps_matched'].notna().to_numpy()
+    ].drop(columns='_gps_matched').reset_index(drop=True)
 
     if verbose:
         print(f"Corner {corner_id}: Extracted {len(corner_telemetry)} telemetry points")
@@ -416,7 +389,9 @@ def identify_corners_from_brake(
     min_corners: int = 8,
     max_corners: int = 15,
     brake_threshold_percentile: float = 60,
-    verbose: bool = False
+    smooth_window: int = 5,
+    verbose: bool = False,
+    backend: str = 'sklearn'
 ) -> pd.DataFrame:
     """
     Identify corners from GPS data by clustering brake pressure peaks.
@@ -441,9 +416,18 @@ def identify_corners_from_brake(
     max_corners : int, default=15
         Maximum expected corners per lap
     brake_threshold_percentile : float, default=60
-        Only consider brake peaks above this percentile as potential corners
+        Only consider brake peaks above this percentile (of brake pressure
+        across all usable laps) as potential corners
+    smooth_window : int, default=5
+        Width (in samples) of the per-lap median filter applied to brake
+        pressure before peak detection, to suppress sensor spikes near the
+        true braking point. Set to 1 to disable smoothing
     verbose : bool, default=False
         Print progress information
+    backend : {'sklearn', 'cuml'}, default='sklearn'
+        DBSCAN implementation. 'cuml' clusters on the GPU via RAPIDS cuML
+        (useful for season-scale inputs) and falls back to scikit-learn with
+        a warning if cuML isn't installed
 
     Returns
     -------
@@ -466,158 +450,609 @@ def identify_corners_from_brake(
     >>> corners = identify_corners_from_brake(gps_with_brake, verbose=True)
     >>> print(f"Found {len(corners)} corners")
     """
-    if verbose:
-        print("=" * 60)
-        print("GPS CORNER IDENTIFICATION (BRAKE-BASED)")
-        print("=" * 60)
-        print(f"Input: {len(gps_data):,} GPS points")
-
     # Ensure we have brake data
     if brake_col not in gps_data.columns:
         raise ValueError(f"Brake column '{brake_col}' not found in GPS data")
 
-    # Step 1: Find brake pressure peaks for each lap
-    brake_peaks = []
+    return _identify_corners_by_extrema(
+        gps_data,
+        signal_col=brake_col,
+        mode='max',
+        lat_col=lat_col,
+        lon_col=lon_col,
+        min_corners=min_corners,
+        max_corners=max_corners,
+        threshold_percentile=brake_threshold_percentile,
+        smooth_window=smooth_window,
+        value_name='max_brake',
+        std_name='brake_std',
+        type_bins=[30, 60],
+        type_labels={
+            'light': 'Light braking (<30)',
+            'medium': 'Medium braking (30-60)',
+            'heavy': 'Heavy braking (>60)',
+        },
+        extrema_name='brake pressure peaks',
+        unit='brake',
+        title='GPS CORNER IDENTIFICATION (BRAKE-BASED)',
+        order_by_position=False,
+        verbose=verbose,
+        backend=backend
+    )
+
+
+def _identify_corners_by_extrema(
+    gps_data: pd.DataFrame,
+    signal_col: str,
+    mode: str,
+    lat_col: str,
+    lon_col: str,
+    min_corners: int,
+    max_corners: int,
+    threshold_percentile: float,
+    smooth_window: int,
+    value_name: str,
+    std_name: str,
+    type_bins: List[float],
+    type_labels: Dict[str, str],
+    extrema_name: str,
+    unit: str,
+    title: str,
+    order_by_position: bool,
+    verbose: bool,
+    backend: str
+) -> pd.DataFrame:
+    """
+    Shared corner detector behind the speed- and brake-based entry points.
+
+    Finds per-lap extrema of `signal_col` (minima for mode='min', maxima for
+    mode='max') beyond a global percentile threshold, clusters their GPS
+    positions across laps with DBSCAN and summarises each cluster as a
+    corner. With smooth_window > 1 each lap is median-filtered before peak
+    detection; reported values still come from the raw signal. `type_bins`
+    are the upper bounds of all but the last corner type in `type_labels`,
+    whose values describe each type in the verbose summary.
+
+    Results are memoized on a content hash of the input columns plus every
+    detection parameter, so repeated calls on the same data (including a
+    new DataFrame with identical content) return a copy of the cached
+    corners. Warnings from the original run are not repeated.
+    """
+    if mode not in ('min', 'max'):
+        raise ValueError(f"Unknown extrema mode '{mode}'. Expected 'min' or 'max'")
+    # Minima are found as peaks of the negated signal
+    sign = -1.0 if mode == 'min' else 1.0
+
+    if verbose:
+        print("=" * 60)
+        print(title)
+        print("=" * 60)
+        print(f"Input: {len(gps_data):,} GPS points")
 
+    cache_key = (
+        _frame_digest(gps_data[['lap', 'timestamp', signal_col, lat_col, lon_col]]),
+        signal_col, mode, lat_col, lon_col, min_corners, max_corners,
+        threshold_percentile, smooth_window, value_name, std_name,
+        tuple(type_bins), tuple(type_labels), order_by_position, backend,
+    )
+    cached = _CORNER_CACHE.get(cache_key)
+    if cached is not None:
+        _CORNER_CACHE.move_to_end(cache_key)
+        if verbose:
+            print("Reusing corners detected earlier for identical input")
+            print("=" * 60)
+        return cached.copy()
+
+    # Step 1: Find signal extrema for each lap
     laps = gps_data['lap'].unique()
     if verbose:
         print(f"Analyzing {len(laps)} laps")
 
-    for lap in laps:
-        lap_data = gps_data[gps_data['lap'] == lap].copy()
+    # Prune unusable laps once up front: too few points for peak detection,
+    # or more than half the signal samples missing
+    signal_missing = gps_data[signal_col].isna().groupby(gps_data['lap'])
+    lap_nan_frac = signal_missing.mean()
+    lap_size = signal_missing.size()
+    valid_laps = lap_nan_frac.index[(lap_size >= 50) & (lap_nan_frac <= 0.5)]
+    gps_data = gps_data[gps_data['lap'].isin(valid_laps)]
+
+    # Sort once and slice each lap out by offset rather than masking the
+    # full frame per lap
+    gps_sorted = gps_data.sort_values(['lap', 'timestamp'])
+    lap_all = gps_sorted['lap'].to_numpy()
+    signal_all = gps_sorted[signal_col].to_numpy(dtype=np.float64)
+    lat_all = gps_sorted[lat_col].to_numpy(dtype=np.float64)
+    lon_all = gps_sorted[lon_col].to_numpy(dtype=np.float64)
+
+    lap_ids, starts = np.unique(lap_all, return_index=True)
+    ends = np.r_[starts[1:], len(lap_all)]
+
+    if smooth_window > 1:
+        from scipy.ndimage import median_filter
+
+    # Interpolate NaN values per lap, then find peaks across all laps in
+    # one call
+    signal = signal_all.copy()
+    min_distances = np.empty(len(lap_ids), dtype=np.int64)
+
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        # Interpolate NaN values
+        lap_signal = signal[start:end]
+        _interpolate_nans(lap_signal, np.isnan(lap_signal))
 
-        if len(lap_data) < 50:
-            # Not enough data points for this lap
-            continue
+        # Median filter knocks out single-sample spikes that would otherwise
+        # become extra candidates (and extra DBSCAN input) near a true peak
+        if smooth_window > 1:
+            lap_signal[:] = median_filter(lap_signal, size=smooth_window, mode='nearest')
 
-        # Sort by timestamp to ensure correct order
-        lap_data = lap_data.sort_values('timestamp')
+        # Require minimum distance between peaks (avoid detecting same corner twice)
+        min_distances[i] = max((end - start) // (max_corners * 2), 10)  # Rough estimate
 
-        # Get brake pressure values
-        brake_pressure = lap_data[brake_col].values
+    # Threshold taken over all analysed laps so every lap is held to the
+    # same cut-off
+    threshold = _percentile(signal, threshold_percentile)
 
-        # Skip if too many NaN values
-        if np.isnan(brake_pressure).sum() > len(brake_pressure) * 0.5:
-            continue
+    # Keep only peaks beyond the threshold
+    idx = _find_peaks_jagged(
+        sign * signal, starts, ends, min_distances,
+        prominence=5,  # Require at least 5 units (km/h or brake pressure)
+        min_value=sign * threshold
+    )
 
-        # Interpolate NaN values
-        brake_pressure = pd.Series(brake_pressure).interpolate().values
+    # Signal and GPS coordinates at these extrema; kept as plain arrays
+    # since only the cluster statistics below consume them
+    peak_lat = lat_all[idx]
+    peak_lon = lon_all[idx]
+    peak_value = signal_all[idx]
 
-        # Only consider high brake pressures
-        brake_threshold = np.percentile(brake_pressure, brake_threshold_percentile)
+    if len(idx) == 0:
+        raise ValueError(f"No {extrema_name} found. Check data quality.")
 
-        # Find peaks in brake pressure
-        # Require minimum distance between peaks (avoid detecting same corner twice)
-        min_distance = len(brake_pressure) // (max_corners * 2)  # Rough estimate
-        peaks, properties = find_peaks(
-            brake_pressure,
-            distance=max(min_distance, 10),
-            prominence=5  # Require at least 5 units brake pressure increase
-        )
+    if verbose:
+        print(f"Found {len(idx)} {extrema_name} across all laps")
+        print(f"Average: {len(idx) / len(laps):.1f} per lap")
+
+    # Step 2: Cluster extrema to identify unique corners
+    # Use DBSCAN to cluster nearby extrema (same corner across different laps)
 
-        # Filter to only high-pressure peaks
-        high_pressure_peaks = peaks[brake_pressure[peaks] > brake_threshold]
+    # Project once to a local planar frame in meters so the neighbour search
+    # is plain Euclidean (no trig per pair); the same array is reused for
+    # the larger-epsilon retry below. Stored as float32 (sub-millimetre
+    # resolution over a circuit) to halve the memory traffic of the scan.
+    # Centroids below are still averaged from the float64 coordinates.
+    coords = _local_xy(peak_lat, peak_lon)
 
-        # Get GPS coordinates at these peaks
-        for peak_idx in high_pressure_peaks:
-            if peak_idx < len(lap_data):
-                row = lap_data.iloc[peak_idx]
-                brake_peaks.append({
-                    'lap': lap,
-                    'latitude': row[lat_col],
-                    'longitude': row[lon_col],
-                    'brake_pressure': row[brake_col],
-                    'vehicle_number': row.get('vehicle_number', None)
-                })
+    # Epsilon: maximum distance between points in same cluster
+    # Corners should be within ~20 meters of each other across laps
+    eps_m = 22.0
 
-    if len(brake_peaks) == 0:
-        raise ValueError("No brake pressure peaks found. Check data quality.")
+    labels = _dbscan_labels(
+        coords, eps_m, min_samples=max(2, len(laps) // 3), backend=backend
+    )
 
-    if verbose:
-        print(f"Found {len(brake_peaks)} brake peaks across all laps")
-        print(f"Average: {len(brake_peaks) / len(laps):.1f} per lap")
+    # Remove noise points (cluster = -1)
+    keep = labels >= 0
 
-    # Step 2: Cluster brake peaks by GPS location
-    brake_df = pd.DataFrame(brake_peaks)
-    coords = brake_df[[lat_col, lon_col]].values
+    if not keep.any():
+        warnings.warn("DBSCAN found no valid clusters. Trying larger epsilon.")
+        # Retry with larger epsilon
+        eps_m = 44.0
+        labels = _dbscan_labels(coords, eps_m, min_samples=2, backend=backend)
+        keep = labels >= 0
 
-    # Use DBSCAN to cluster nearby peaks
-    # eps = 0.0002 degrees ≈ 22 meters (appropriate for circuit racing)
-    eps = 0.0002
-    clustering = DBSCAN(eps=eps, min_samples=max(2, len(laps) // 3)).fit(coords)
+    if not keep.any():
+        raise ValueError(
+            f"No consistent corners found. All {extrema_name} were noise. "
+            f"Try adjusting the threshold percentile."
+        )
 
-    brake_df['cluster'] = clustering.labels_
+    # Map the surviving labels to dense ids 0..n_clusters-1 (in label order)
+    _, dense = np.unique(labels[keep], return_inverse=True)
+    n_obs = np.bincount(dense)
+    n_clusters = len(n_obs)
 
-    # Filter out noise points (cluster = -1)
-    brake_df = brake_df[brake_df['cluster'] >= 0]
+    if verbose:
+        print(f"Clustered into {n_clusters} unique corners")
 
-    if len(brake_df) == 0:
-        raise ValueError(
-            f"No consistent corners found. All brake peaks were noise. "
-            f"Try adjusting brake_threshold_percentile or eps parameter."
+    # Check if we have reasonable number of corners
+    if n_clusters < min_corners:
+        warnings.warn(
+            f"Found only {n_clusters} corners, expected at least {min_corners}. "
+            "Track may have fewer corners or data quality issues."
         )
+    elif n_clusters > max_corners:
+        warnings.warn(
+            f"Found {n_clusters} corners, expected at most {max_corners}. "
+            "May need to adjust clustering parameters."
+        )
+
+    # Step 3: Calculate corner statistics
+    # Means/std/counts come from weighted bincounts over dense cluster ids
+    # (one pass per column instead of one filtered copy per cluster)
+    value = peak_value[keep]
+    value_valid = ~np.isnan(value)
+    n_value = np.bincount(dense, weights=value_valid)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value_mean = np.bincount(dense, weights=np.where(value_valid, value, 0.0)) / n_value
+        value_dev = np.where(value_valid, value - value_mean[dense], 0.0)
+        value_var = np.bincount(dense, weights=value_dev ** 2) / (n_value - 1)
+    value_var[n_value < 2] = np.nan
+
+    corners_df = pd.DataFrame({
+        'corner_id': np.arange(1, n_clusters + 1),  # 1-indexed
+        'latitude': np.bincount(dense, weights=peak_lat[keep]) / n_obs,
+        'longitude': np.bincount(dense, weights=peak_lon[keep]) / n_obs,
+        value_name: _grouped_nanmedian(value, dense, n_clusters),
+        std_name: np.sqrt(value_var),
+        'n_observations': n_obs,
+    })
+
+    # Classify corner type by the summarised signal
+    type_names = list(type_labels)
+    corners_df['corner_type'] = np.select(
+        [corners_df[value_name] < bound for bound in type_bins],
+        type_names[:-1],
+        default=type_names[-1]
+    )
 
-    # Step 3: Calculate corner statistics for each cluster
-    corners = []
-    cluster_ids = sorted(brake_df['cluster'].unique())
+    if order_by_position:
+        # Sort corners by track position (approximate by latitude + longitude)
+        # This gives a rough ordering around the track
+        # Better would be to use lap distance if available
+        order = np.lexsort((corners_df['longitude'].to_numpy(), corners_df['latitude'].to_numpy()))
+        corners_df = corners_df.iloc[order].reset_index(drop=True)
+        corners_df['corner_id'] = np.arange(1, len(corners_df) + 1, dtype=np.int32)
 
     if verbose:
-        print(f"Clustered into {len(cluster_ids)} unique corners")
-
-    for cluster_id in cluster_ids:
-        cluster_peaks = brake_df[brake_df['cluster'] == cluster_id]
-
-        corner = {
-            'corner_id': len(corners) + 1,  # 1-indexed
-            'latitude': cluster_peaks[lat_col].mean(),
-            'longitude': cluster_peaks[lon_col].mean(),
-            'max_brake': cluster_peaks['brake_pressure'].median(),
-            'brake_std': cluster_peaks['brake_pressure'].std(),
-            'n_observations': len(cluster_peaks)
-        }
-
-        # Classify corner by brake pressure intensity
-        max_brake = corner['max_brake']
-        if max_brake < 30:
-            corner_type = 'light'
-        elif max_brake < 60:
-            corner_type = 'medium'
+        print("\nCorner Summary:")
+        type_counts = corners_df['corner_type'].value_counts()
+        for corner_type, description in type_labels.items():
+            print(f"  {description}: {type_counts.get(corner_type, 0)}")
+        # Per-corner lines are skipped for pathological outputs
+        if len(corners_df) < 100:
+            print("\nCorner Details:")
+            for corner_id, corner_type, value, lat, lon in zip(
+                corners_df['corner_id'].to_numpy(),
+                corners_df['corner_type'].to_numpy(),
+                corners_df[value_name].to_numpy(),
+                corners_df['latitude'].to_numpy(),
+                corners_df['longitude'].to_numpy()
+            ):
+                print(f"  Corner {corner_id}: {corner_type:6s} "
+                      f"({value:.1f} {unit}) "
+                      f"at ({lat:.5f}, {lon:.5f})")
+        print("=" * 60)
+
+    _CORNER_CACHE[cache_key] = corners_df.copy()
+    _CORNER_CACHE.move_to_end(cache_key)
+    while len(_CORNER_CACHE) > _CORNER_CACHE_SIZE:
+        _CORNER_CACHE.popitem(last=False)
+
+    return corners_df
+
+def _find_peaks_jagged(
+    values: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    distances: np.ndarray,
+    prominence: float,
+    min_value: float = -np.inf
+) -> np.ndarray:
+    """
+    Find peaks independently in each lap of a flat, lap-contiguous signal.
+
+    Matches scipy.signal.find_peaks(values[start:end], distance=d,
+    prominence=prominence) per lap, keeping only peaks above `min_value`.
+    The cut-off is applied after distance/prominence selection, so a
+    discarded peak can still suppress lower neighbours. Laps run in parallel
+    through a Numba kernel when available.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted peak indices into `values`
+    """
+    try:
+        from ._numba_kernels import find_peaks_jagged
+    except ImportError:
+        find_peaks_jagged = None
+
+    if find_peaks_jagged is not None:
+        peaks = np.flatnonzero(find_peaks_jagged(
+            np.ascontiguousarray(values, dtype=np.float64),
+            np.asarray(starts, dtype=np.int64),
+            np.asarray(ends, dtype=np.int64),
+            np.asarray(distances, dtype=np.int64),
+            float(prominence)
+        ))
+        return peaks[values[peaks] > min_value]
+
+    from scipy.signal import find_peaks
+
+    # Vectorised pre-screen over all laps at once: every peak find_peaks can
+    # return (plateau midpoints included) is >= both neighbours, so laps with
+    # no such sample above min_value are skipped without calling it
+    candidate = np.zeros(len(values), dtype=bool)
+    candidate[1:-1] = (
+        (values[1:-1] >= values[:-2])
+        & (values[1:-1] >= values[2:])
+        & (values[1:-1] > min_value)
+    )
+    n_candidates = np.r_[0, np.cumsum(candidate)]
+    has_candidates = n_candidates[ends] > n_candidates[starts]
+
+    peaks = [
+        start + find_peaks(values[start:end], distance=distance, prominence=prominence)[0]
+        for start, end, distance, screened in zip(starts, ends, distances, has_candidates)
+        if screened
+    ]
+    peaks = np.concatenate(peaks) if peaks else np.empty(0, dtype=np.intp)
+    return peaks[values[peaks] > min_value]
+
+
+def _dbscan_labels(
+    coords: np.ndarray,
+    eps_m: float,
+    min_samples: int,
+    backend: str = 'sklearn'
+) -> np.ndarray:
+    """
+    Cluster planar (x, y) points in meters with DBSCAN.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        (n, 2) array of local x/y in meters, as from `_local_xy`
+        (float32 or float64)
+    eps_m : float
+        Neighbourhood radius in meters
+    min_samples : int
+        DBSCAN core-point threshold
+    backend : {'sklearn', 'cuml'}, default='sklearn'
+        DBSCAN implementation to use
+
+    Returns
+    -------
+    np.ndarray
+        Cluster label per point (-1 for noise)
+    """
+    if backend not in ('sklearn', 'cuml'):
+        raise ValueError(f"Unknown DBSCAN backend '{backend}'. Use 'sklearn' or 'cuml'.")
+
+    if backend == 'cuml':
+        try:
+            import cudf
+            from cuml.cluster import DBSCAN as CumlDBSCAN
+        except ImportError:
+            warnings.warn("cuML not available, falling back to scikit-learn DBSCAN.")
         else:
-            corner_type = 'heavy'
+            gdf = cudf.DataFrame({'x': coords[:, 0], 'y': coords[:, 1]})
+            clustering = CumlDBSCAN(eps=eps_m, min_samples=min_samples).fit(gdf)
+            return clustering.labels_.to_numpy()
 
-        corner['corner_type'] = corner_type
+    # Imported here so `import motorsport_modeling.data` doesn't pull in
+    # sklearn for callers that never run corner detection
+    from sklearn.cluster import DBSCAN
 
-        corners.append(corner)
+    clustering = DBSCAN(
+        eps=eps_m,
+        min_samples=min_samples,
+        metric='euclidean',
+        algorithm='kd_tree'
+    ).fit(coords)
+    return clustering.labels_
 
-    corners_df = pd.DataFrame(corners)
 
-    # Step 4: Validate corner count
-    n_corners = len(corners_df)
+def _local_xy(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """
+    Project latitude/longitude to a flat local frame in meters.
 
-    if verbose:
-        print("\nCorner Summary:")
-        print(f"  Light braking (<30): {len(corners_df[corners_df['corner_type'] == 'light'])}")
-        print(f"  Medium braking (30-60): {len(corners_df[corners_df['corner_type'] == 'medium'])}")
-        print(f"  Heavy braking (>60): {len(corners_df[corners_df['corner_type'] == 'heavy'])}")
+    Equirectangular projection about the points' mean position:
+    x = dlon * cos(lat0) * R, y = dlat * R. Over a circuit (a few km across)
+    Euclidean distances in this frame are within ~0.05% of the great-circle
+    distance, i.e. millimetres at clustering radii.
 
-        print("\nCorner Details:")
-        for _, corner in corners_df.iterrows():
-            print(f"  Corner {corner['corner_id']}: {corner['corner_type']:6s} "
-                  f"({corner['max_brake']:.1f} brake) at "
-                  f"({corner['latitude']:.5f}, {corner['longitude']:.5f})")
+    Parameters
+    ----------
+    lat, lon : np.ndarray
+        Latitude and longitude in degrees
 
-        print("=" * 60)
+    Returns
+    -------
+    np.ndarray
+        Row-major (n, 2) float32 array of x (east) and y (north) in meters
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    if len(lat) == 0:
+        return np.empty((0, 2), dtype=np.float32)
 
-    # Warnings for unexpected corner counts
-    if n_corners < min_corners:
-        warnings.warn(
-            f"Found only {n_corners} corners, expected at least {min_corners}. "
-            "Track may have fewer corners or data quality issues."
-        )
-    elif n_corners > max_corners:
-        warnings.warn(
-            f"Found {n_corners} corners, expected at most {max_corners}. "
-            "May need to adjust clustering parameters."
-        )
+    lat0 = lat.mean()
+    xy = np.empty((len(lat), 2), dtype=np.float32)
+    xy[:, 0] = np.radians(lon - lon.mean()) * np.cos(np.radians(lat0)) * EARTH_RADIUS_M
+    xy[:, 1] = np.radians(lat - lat0) * EARTH_RADIUS_M
+    return xy
 
-    return corners_df
+
+def _frame_digest(df: pd.DataFrame) -> str:
+    """
+    Content hash of a DataFrame's values (the index is ignored).
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Frame to hash
+
+    Returns
+    -------
+    str
+        Hex digest that changes whenever any value changes
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+    digest.update(str(len(df)).encode())
+    return digest.hexdigest()
+
+
+def _get_gps_tree(gps_data: pd.DataFrame) -> Tuple["cKDTree", np.ndarray]:
+    """
+    Return a KD-tree over the GPS points of `gps_data`, built once per frame.
+
+    Trees for the last few frames are kept so extracting every corner from
+    the same GPS data pays for one index build. Entries hold only a weak
+    reference to the frame and are rebuilt if its length changes; frames
+    edited in place without changing length are not detected.
+
+    Returns
+    -------
+    tuple
+        (cKDTree, (n, 2) latitude/longitude array it was built from)
+    """
+    from scipy.spatial import cKDTree
+
+    key = id(gps_data)
+    cached = _GPS_TREE_CACHE.get(key)
+    if cached is not None:
+        frame_ref, n_rows, tree, coords = cached
+        if frame_ref() is gps_data and n_rows == len(gps_data):
+            _GPS_TREE_CACHE.move_to_end(key)
+            return tree, coords
+
+    coords = gps_data[['latitude', 'longitude']].to_numpy(dtype=np.float64)
+    tree = cKDTree(coords)
+
+    _GPS_TREE_CACHE[key] = (weakref.ref(gps_data), len(gps_data), tree, coords)
+    _GPS_TREE_CACHE.move_to_end(key)
+    while len(_GPS_TREE_CACHE) > _GPS_TREE_CACHE_SIZE:
+        _GPS_TREE_CACHE.popitem(last=False)
+
+    return tree, coords
+
+
+def _get_corner_tree(corners: pd.DataFrame, corner_coords: np.ndarray) -> "cKDTree":
+    """
+    Return a KD-tree over corner locations, built once per corners frame.
+
+    Like _get_gps_tree, entries hold only a weak reference to the frame.
+    The cached tree is reused only while it still indexes exactly
+    `corner_coords`, so corners edited in place get a new tree.
+
+    Parameters
+    ----------
+    corners : pd.DataFrame
+        Corners frame the coordinates come from
+    corner_coords : np.ndarray
+        (n, 2) float64 latitude/longitude of the corners
+
+    Returns
+    -------
+    cKDTree
+        Tree over `corner_coords`
+    """
+    from scipy.spatial import cKDTree
+
+    key = id(corners)
+    cached = _CORNER_TREE_CACHE.get(key)
+    if cached is not None:
+        frame_ref, tree = cached
+        if frame_ref() is corners and np.array_equal(tree.data, corner_coords):
+            _CORNER_TREE_CACHE.move_to_end(key)
+            return tree
+
+    tree = cKDTree(corner_coords)
+
+    _CORNER_TREE_CACHE[key] = (weakref.ref(corners), tree)
+    _CORNER_TREE_CACHE.move_to_end(key)
+    while len(_CORNER_TREE_CACHE) > _CORNER_TREE_CACHE_SIZE:
+        _CORNER_TREE_CACHE.popitem(last=False)
+
+    return tree
+
+
+def _grouped_nanmedian(values: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Median of `values` per dense group id, ignoring NaNs.
+
+    Sorts once by (group, value) and reads the middle one or two valid
+    entries of each group, so no per-group copies are made.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Float values
+    groups : np.ndarray
+        Dense group id (0..n_groups-1) per value
+    n_groups : int
+        Number of groups
+
+    Returns
+    -------
+    np.ndarray
+        Median per group (NaN for groups without valid values)
+    """
+    # NaNs sort to the end of each group, after its valid values
+    order = np.lexsort((values, groups))
+    sorted_values = values[order]
+
+    group_start = np.r_[0, np.cumsum(np.bincount(groups, minlength=n_groups))[:-1]]
+    n_valid = np.bincount(groups, weights=~np.isnan(values), minlength=n_groups).astype(np.int64)
+
+    medians = np.full(n_groups, np.nan)
+    has_valid = n_valid > 0
+    lower = (group_start + (n_valid - 1) // 2)[has_valid]
+    upper = (group_start + n_valid // 2)[has_valid]
+    medians[has_valid] = (sorted_values[lower] + sorted_values[upper]) / 2
+    return medians
+
+
+def _percentile(values: np.ndarray, q: float) -> float:
+    """
+    Linearly interpolated percentile via partial sort.
+
+    Matches np.percentile's default (linear) method, but partitions around
+    the two bracketing ranks in O(n) instead of sorting.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        1-D float array without NaNs
+    q : float
+        Percentile in [0, 100]
+
+    Returns
+    -------
+    float
+        The q-th percentile of `values`, or NaN if `values` is empty
+    """
+    n = values.size
+    if n == 0:
+        return np.nan
+
+    position = q / 100.0 * (n - 1)
+    k = int(np.floor(position))
+    if k >= n - 1:
+        return float(values.max())
+
+    lower, upper = np.partition(values, (k, k + 1))[[k, k + 1]]
+    return float(lower + (upper - lower) * (position - k))
+
+
+def _interpolate_nans(values: np.ndarray, missing: np.ndarray) -> None:
+    """
+    Linearly interpolate NaN samples in place.
+
+    NaNs at either end take the nearest valid value.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Float array to fill (modified in place)
+    missing : np.ndarray
+        Boolean mask of NaN positions in `values`
+    """
+    if missing.any() and not missing.all():
+        values[missing] = np.interp(
+            np.flatnonzero(missing),
+            np.flatnonzero(~missing),
+            values[~missing]
+        )
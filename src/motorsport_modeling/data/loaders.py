@@ -8,17 +8,60 @@ CSV files in long format (one row per measurement).
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Optional, Union, List, Dict
+from typing import Optional, Union, List, Dict, Tuple
+from collections import OrderedDict
+import json
+import os
 import time
 
 
+# Vehicles, parameters and row count per telemetry file, keyed by
+# (resolved path, (size, mtime_ns)) so an edited file is rescanned
+_METADATA_CACHE: Dict[
+    Tuple[str, Tuple[int, int]], Tuple[Tuple[int, ...], Tuple[str, ...], int]
+] = {}
+
+# Most recent load_telemetry results with their sizes in bytes, keyed by
+# (resolved path, (size, mtime_ns), vehicle, laps, parameters, wide_format). Bounded
+# by entry count and total bytes; results over a quarter of the byte budget
+# (e.g. a whole unfiltered race) aren't cached, so caching never doubles
+# the peak memory of a large load
+_LOAD_CACHE = OrderedDict()
+_LOAD_CACHE_SIZE = 32
+_LOAD_CACHE_MAX_BYTES = 512 << 20
+
+# Version of the rows in the Parquet sidecar. Bump it whenever the CSV to
+# Parquet conversion changes its output, so sidecars written by older code
+# are rebuilt rather than reused
+_SIDECAR_VERSION = 2
+
+# Parquet schema metadata key holding the sidecar version and the size and
+# mtime of the CSV the sidecar was built from
+_SIDECAR_STAMP = b'motorsport_modeling.sidecar_source'
+
+# Sidecar column holding each row's position in the CSV, restored as the
+# index so sidecar and CSV reads return the same row labels
+_SIDECAR_ROW_COLUMN = '__csv_row__'
+
+# Rows per chunk when a telemetry CSV is filtered without a Parquet sidecar
+_CSV_CHUNK_ROWS = 1_000_000
+
+# Selections up to this size are matched by equality tests rather than isin
+_SMALL_ISIN_SIZE = 4
+
+# GPS coordinates in degrees; float32 spacing there is ~0.4-0.7 m at these
+# tracks, so unlike the other channels they are never downcast
+_GPS_PARAMETERS = ['VBOX_Lat_Min', 'VBOX_Long_Minutes']
+
+
 def load_telemetry(
     file_path: Union[str, Path],
     vehicle: Optional[int] = None,
     lap: Optional[Union[int, List[int]]] = None,
     parameters: Optional[List[str]] = None,
     wide_format: bool = True,
-    verbose: bool = False
+    verbose: bool = False,
+    write_cache: bool = True
 ) -> pd.DataFrame:
     """
     Load telemetry data from CSV file.
@@ -39,11 +82,29 @@ def load_telemetry(
         If False, keep long format (one row per measurement)
     verbose : bool, default=False
         Print loading progress and statistics
+    write_cache : bool, default=True
+        If False, never write the Parquet sidecar next to the CSV (an
+        existing up-to-date sidecar is still read)
 
     Returns
     -------
     pd.DataFrame
-        Telemetry data in requested format
+        Telemetry data in requested format (in long format, telemetry_name
+        is a categorical and rows are labelled by their row in the CSV)
+
+    Notes
+    -----
+    When pyarrow is installed, the first load streams the CSV into a
+    ``<name>.csv.parquet`` sidecar next to it. Loads (and the get_available_*
+    helpers) read from it, decoding only the needed columns and row groups.
+    The sidecar records the CSV's size and mtime and the sidecar format
+    version, and is rebuilt when any of them differ. Otherwise the CSV is
+    read in chunks, keeping only the selected rows, so files larger than
+    memory can still be loaded a vehicle or lap at a time.
+
+    The last 32 results are cached by file path, size, modification time
+    and selection, so repeating a load returns a copy without re-reading or
+    re-pivoting. Editing or replacing the file invalidates its entries.
 
     Examples
     --------
@@ -62,66 +123,124 @@ def load_telemetry(
     if verbose:
         print(f"Loading telemetry from: {file_path}")
 
-    # Load CSV
-    df = pd.read_csv(file_path)
+    if isinstance(lap, int):
+        lap = [lap]
+
+    # Reuse an earlier result for the same file version and selection
+    resolved_path = Path(file_path).resolve()
+    cache_key = (
+        str(resolved_path),
+        _file_version(resolved_path),
+        vehicle,
+        tuple(lap) if lap is not None else None,
+        tuple(sorted(set(parameters))) if parameters is not None else None,
+        wide_format,
+    )
+    cached = _LOAD_CACHE.get(cache_key)
+    if cached is not None:
+        _LOAD_CACHE.move_to_end(cache_key)
+        cached = cached[0]
+        if verbose:
+            print(f"  Reused cached result: {len(cached):,} rows")
+        return cached.copy()
+
+    # Load CSV (via its Parquet sidecar when available, reading only the
+    # columns the wide pivot needs and letting pyarrow skip filtered rows)
+
+    filters = []
+    if vehicle is not None:
+        filters.append(('vehicle_number', '=', vehicle))
+    if lap is not None:
+        filters.append(('lap', 'in', list(lap)))
+    if parameters is not None:
+        filters.append(('telemetry_name', 'in', list(parameters)))
+
+    df = _read_telemetry_table(
+        file_path,
+        columns=(
+            ['vehicle_number', 'lap', 'timestamp', 'telemetry_name', 'telemetry_value']
+            if wide_format else None
+        ),
+        filters=filters or None,
+        write_cache=write_cache
+    )
 
     if verbose:
         print(f"  Loaded {len(df):,} rows in {time.time() - start_time:.2f}s")
 
+    # Combine vehicle/lap/parameter filters into one mask so the frame is
+    # subset once, before timestamp parsing and the pivot
+    mask = np.ones(len(df), dtype=bool)
+
     # Filter by vehicle
     if vehicle is not None:
-        df = df[df['vehicle_number'] == vehicle].copy()
+        mask &= (df['vehicle_number'] == vehicle).to_numpy()
         if verbose:
-            print(f"  Filtered to vehicle #{vehicle}: {len(df):,} rows")
+            print(f"  Filtered to vehicle #{vehicle}: {mask.sum():,} rows")
 
     # Filter by lap
     if lap is not None:
-        if isinstance(lap, int):
-            lap = [lap]
-        df = df[df['lap'].isin(lap)].copy()
+        mask &= _isin(df['lap'], lap)
         if verbose:
-            print(f"  Filtered to lap(s) {lap}: {len(df):,} rows")
+            print(f"  Filtered to lap(s) {lap}: {mask.sum():,} rows")
 
     # Filter by parameters
     if parameters is not None:
-        df = df[df['telemetry_name'].isin(parameters)].copy()
+        mask &= _isin(df['telemetry_name'], parameters)
         if verbose:
-            print(f"  Filtered to {len(parameters)} parameters: {len(df):,} rows")
-
-    # Convert timestamp to datetime
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
+            print(f"  Filtered to {len(parameters)} parameters: {mask.sum():,} rows")
+
+    if not mask.all():
+        df = df.loc[mask]
+
+    # Downcast to the narrowest dtypes the data needs, halving the bytes
+    # every later filter/sort/pivot touches: values are logged at single
+    # precision, car numbers fit int16 and lap numbers (including the 32768
+    # sentinel) int32. Integer columns holding NaNs are left as float64.
+    # GPS coordinates keep float64, so with GPS rows present the values are
+    # only downcast per column after the wide pivot (and not in long format).
+    # astype builds a new frame, so the filtered view is never written to
+    has_gps = bool(_isin(df['telemetry_name'], _GPS_PARAMETERS).any())
+    downcast = {} if has_gps else {'telemetry_value': np.float32}
+    if pd.api.types.is_integer_dtype(df['vehicle_number']):
+        downcast['vehicle_number'] = np.int16
+    if pd.api.types.is_integer_dtype(df['lap']):
+        downcast['lap'] = np.int32
+    df = df.astype(downcast)
+
+    # Convert timestamp to datetime. Telemetry timestamps are always
+    # ISO 8601, so skip per-value format inference
+    df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', cache=True)
 
     if wide_format:
         # Pivot to wide format
         if verbose:
             print("  Pivoting to wide format...")
 
-        # Pivot: rows are timestamps, columns are telemetry parameters
-        df_wide = df.pivot_table(
-            index=['vehicle_number', 'lap', 'timestamp'],
-            columns='telemetry_name',
-            values='telemetry_value',
-            aggfunc='first'  # Take first value if duplicates
-        ).reset_index()
-
-        # Flatten column names
-        df_wide.columns.name = None
-
-        # Sort by timestamp
-        df_wide = df_wide.sort_values(['vehicle_number', 'lap', 'timestamp'])
+        # Pivot: rows are timestamps (already in vehicle/lap/timestamp
+        # order), columns are telemetry parameters
+        df_wide = _pivot_telemetry(df[df['telemetry_value'].notna().to_numpy()])
+        if has_gps:
+            df_wide = df_wide.astype({
+                c: np.float32 for c in df_wide.columns
+                if c not in ('vehicle_number', 'lap', 'timestamp') and c not in _GPS_PARAMETERS
+            })
 
         if verbose:
             print(f"  Wide format: {len(df_wide):,} rows × {len(df_wide.columns)} columns")
             print(f"  Total time: {time.time() - start_time:.2f}s")
 
+        _remember_load(cache_key, df_wide)
         return df_wide
     else:
-        # Return long format
+        # Return long format. telemetry_name is categorical with sorted
+        # categories, so this key sorts on integer codes, not strings
         df = df.sort_values(['vehicle_number', 'lap', 'timestamp', 'telemetry_name'])
 
         if verbose:
             print(f"  Total time: {time.time() - start_time:.2f}s")
 
+        _remember_load(cache_key, df)
         return df
 
 
@@ -158,8 +277,10 @@ def load_gps_data(
     >>> gps = load_gps_data('data.csv', vehicle=55, lap=7)
     >>> plt.plot(gps['VBOX_Long_Minutes'], gps['VBOX_Lat_Min'])
     """
-    gps_params = ['VBOX_Lat_Min', 'VBOX_Long_Minutes', 'Laptrigger_lapdist_dls']
+    gps_params = _GPS_PARAMETERS + ['Laptrigger_lapdist_dls']
 
+    # The parameter filter is pushed down to the Parquet read, so only the
+    # three GPS series are decoded and pivoted
     df = load_telemetry(
         file_path,
         vehicle=vehicle,
@@ -176,12 +297,13 @@ def load_gps_data(
             "This dataset may not include GPS parameters."
         )
 
-    # Rename for convenience
-    df = df.rename(columns={
+    # Rename for convenience (load_telemetry returns a frame of our own, so
+    # relabel it in place rather than copying every column)
+    df.rename(columns={
         'VBOX_Lat_Min': 'latitude',
         'VBOX_Long_Minutes': 'longitude',
         'Laptrigger_lapdist_dls': 'lap_distance'
-    })
+    }, inplace=True)
 
     # Remove rows with missing GPS
     df = df.dropna(subset=['latitude', 'longitude'])
@@ -250,7 +372,7 @@ def load_lap_times(
     if verbose:
         print(f"Loading lap times from: {file_path}")
 
-    df = pd.read_csv(file_path)
+    df = _read_csv(file_path)
 
     if verbose:
         print(f"  Loaded {len(df):,} rows")
@@ -261,8 +383,7 @@ def load_lap_times(
         # vehicle_id can be string like "GR86-002-2" - extract number from middle
         if df['vehicle_id'].dtype == 'object':
             # Extract number from pattern "GR86-XXX-Y"
-            df['vehicle_number'] = df['vehicle_id'].str.extract(r'-(\d+)-', expand=False)
-            df['vehicle_number'] = pd.to_numeric(df['vehicle_number'], errors='coerce')
+            df['vehicle_number'] = _extract_vehicle_number(df['vehicle_id'])
             if verbose:
                 print(f"  Extracted vehicle_number from vehicle_id string")
         else:
@@ -270,21 +391,21 @@ def load_lap_times(
             if verbose:
                 print(f"  Using vehicle_id as vehicle_number")
 
-    # Parse timestamps
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    # Parse timestamps (ISO 8601, as in the telemetry files)
+    df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', cache=True)
 
     # Filter out invalid lap numbers (32768 is a sentinel value)
-    df = df[df['lap'] < 1000].copy()
+    df = df[df['lap'] < 1000]
 
     # Filter by vehicle if specified
     if vehicle is not None:
-        df = df[df['vehicle_number'] == vehicle].copy()
+        df = df[df['vehicle_number'] == vehicle]
         if verbose:
             print(f"  Filtered to vehicle #{vehicle}: {len(df):,} rows")
 
     # Filter to max lap if specified
     if max_lap is not None:
-        df = df[df['lap'] <= max_lap].copy()
+        df = df[df['lap'] <= max_lap]
         if verbose:
             print(f"  Filtered to laps <= {max_lap}")
 
@@ -292,24 +413,20 @@ def load_lap_times(
     # Using 'last' because erroneous early timestamps appear first in duplicates
     df = df.sort_values(['vehicle_number', 'lap', 'timestamp'])
     df = df.drop_duplicates(subset=['vehicle_number', 'lap'], keep='last')
+    df = df.reset_index(drop=True)
 
-    # Calculate lap times as diff between consecutive lap timestamps
-    lap_times = []
-
-    for veh in df['vehicle_number'].unique():
-        vehicle_data = df[df['vehicle_number'] == veh].sort_values('lap').copy()
-
-        # Lap time = timestamp of this lap - timestamp of previous lap
-        vehicle_data['lap_time'] = vehicle_data['timestamp'].diff().dt.total_seconds()
-
-        lap_times.append(vehicle_data)
-
-    result = pd.concat(lap_times, ignore_index=True)
+    # Lap time = timestamp of this lap - timestamp of previous lap, per
+    # vehicle (rows are already in vehicle/lap order)
+    # (float32 keeps sub-millisecond resolution for lap-length durations)
+    df['lap_time'] = (
+        df.groupby('vehicle_number', sort=False)['timestamp'].diff().dt.total_seconds()
+    ).astype(np.float32)
 
     # Remove lap 1 (no prior timestamp to diff from) and invalid times
-    result = result[result['lap'] > 1].copy()
-    result = result[result['lap_time'] > min_lap_time].copy()
-    result = result[result['lap_time'] < max_lap_time].copy()
+    valid = _valid_lap_mask(
+        df['lap'].to_numpy(), df['lap_time'].to_numpy(), min_lap_time, max_lap_time
+    )
+    result = df.loc[valid, ['vehicle_number', 'lap', 'timestamp', 'lap_time']]
 
     if verbose:
         print(f"  Computed lap times: {len(result):,} valid laps")
@@ -317,7 +434,7 @@ def load_lap_times(
         print(f"  Lap range: {result['lap'].min()} - {result['lap'].max()}")
         print(f"  Lap time range: {result['lap_time'].min():.2f}s - {result['lap_time'].max():.2f}s")
 
-    return result[['vehicle_number', 'lap', 'timestamp', 'lap_time']]
+    return result
 
 
 def load_weather(
@@ -350,10 +467,8 @@ def load_weather(
     if verbose:
         print(f"Loading weather from: {file_path}")
 
-    df = pd.read_csv(file_path, sep=';')
-
-    # Rename columns for consistency
-    df = df.rename(columns={
+    # Parse only the relevant columns, renamed for consistency
+    renames = {
         'TIME_UTC_STR': 'timestamp',
         'AIR_TEMP': 'air_temp',
         'TRACK_TEMP': 'track_temp',
@@ -362,16 +477,13 @@ def load_weather(
         'WIND_SPEED': 'wind_speed',
         'WIND_DIRECTION': 'wind_direction',
         'RAIN': 'rain'
-    })
+    }
+    df = _read_csv(file_path, sep=';', columns=list(renames))
+    df = df.rename(columns=renames)[list(renames.values())]
 
     # Parse timestamp
     df['timestamp'] = pd.to_datetime(df['timestamp'])
 
-    # Select relevant columns
-    cols = ['timestamp', 'air_temp', 'track_temp', 'humidity',
-            'pressure', 'wind_speed', 'wind_direction', 'rain']
-    df = df[cols]
-
     if verbose:
         print(f"  Loaded {len(df)} weather readings")
         print(f"  Air temp: {df['air_temp'].mean():.1f}°C (mean)")
@@ -400,16 +512,35 @@ def get_race_weather_summary(
         Dictionary with mean weather values:
         - air_temp, track_temp, humidity, pressure, wind_speed
     """
-    df = load_weather(file_path, verbose=False)
-
-    summary = {
-        'air_temp': df['air_temp'].mean(),
-        'track_temp': df['track_temp'].mean(),
-        'humidity': df['humidity'].mean(),
-        'pressure': df['pressure'].mean(),
-        'wind_speed': df['wind_speed'].mean()
+    columns = {
+        'AIR_TEMP': 'air_temp',
+        'TRACK_TEMP': 'track_temp',
+        'HUMIDITY': 'humidity',
+        'PRESSURE': 'pressure',
+        'WIND_SPEED': 'wind_speed'
     }
 
+    try:
+        import pyarrow.compute as pc
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        pc = None
+
+    if pc is not None:
+        # Means straight off the Arrow columns, without building a DataFrame
+        table = pa_csv.read_csv(
+            file_path,
+            parse_options=pa_csv.ParseOptions(delimiter=';'),
+            convert_options=pa_csv.ConvertOptions(include_columns=list(columns))
+        )
+        summary = {}
+        for column, name in columns.items():
+            mean = pc.mean(table[column]).as_py()
+            summary[name] = np.nan if mean is None else mean
+    else:
+        df = load_weather(file_path, verbose=False)
+        summary = {name: df[name].mean() for name in columns.values()}
+
     if verbose:
         print(f"Weather summary:")
         print(f"  Air temp: {summary['air_temp']:.1f}°C")
@@ -443,14 +574,14 @@ def load_endurance_analysis(
         - vehicle_number, lap, lap_time
         - s1, s2, s3 (sector times in seconds)
         - kph (average speed)
-        - flag_status (GF=green, FCY=full course yellow, FF=finish)
+        - flag_status (categorical: GF=green, FCY=full course yellow, FF=finish)
         - top_speed
         - pit_time (if pitted)
     """
     if verbose:
         print(f"Loading endurance analysis from: {file_path}")
 
-    df = pd.read_csv(file_path, sep=';')
+    df = _read_csv(file_path, sep=';')
 
     # Strip whitespace from column names (CSV has leading spaces)
     df.columns = df.columns.str.strip()
@@ -472,18 +603,28 @@ def load_endurance_analysis(
     # Convert vehicle number to int (handle leading zeros like '03')
     df['vehicle_number'] = pd.to_numeric(df['vehicle_number'], errors='coerce')
 
+    # A handful of flag codes repeat on every lap
+    if 'flag_status' in df.columns:
+        df['flag_status'] = df['flag_status'].astype('category')
+
     # Filter by vehicle if specified
     if vehicle is not None:
-        df = df[df['vehicle_number'] == vehicle].copy()
+        df = df[df['vehicle_number'] == vehicle]
 
     # Select relevant columns
     cols = ['vehicle_number', 'lap', 's1', 's2', 's3', 'kph',
             'flag_status', 'top_speed', 'pit_time']
     df = df[[c for c in cols if c in df.columns]]
 
-    # Create is_under_yellow flag
+    # Single precision is plenty for sector times and speeds
+    df = df.astype({
+        c: np.float32 for c in ['s1', 's2', 's3', 'kph', 'top_speed']
+        if c in df.columns and pd.api.types.is_numeric_dtype(df[c])
+    })
+
+    # Create is_under_yellow flag (compared on the categorical codes)
     if 'flag_status' in df.columns:
-        df['is_under_yellow'] = df['flag_status'].isin(['FCY', 'SC']).astype(int)
+        df['is_under_yellow'] = _isin(df['flag_status'], ['FCY', 'SC']).astype(np.int8)
 
     if verbose:
         print(f"  Loaded {len(df)} lap records")
@@ -513,9 +654,8 @@ def get_available_vehicles(file_path: Union[str, Path]) -> List[int]:
     >>> vehicles = get_available_vehicles('data.csv')
     >>> print(f"Found {len(vehicles)} vehicles: {vehicles}")
     """
-    df = pd.read_csv(file_path, usecols=['vehicle_number'])
-    vehicles = sorted(df['vehicle_number'].dropna().unique())
-    return [int(v) for v in vehicles]
+    vehicles, _, _ = _scan_metadata(file_path)
+    return list(vehicles)
 
 
 def get_available_parameters(file_path: Union[str, Path]) -> List[str]:
@@ -537,9 +677,8 @@ def get_available_parameters(file_path: Union[str, Path]) -> List[str]:
     >>> params = get_available_parameters('data.csv')
     >>> print(f"Found {len(params)} parameters: {params}")
     """
-    df = pd.read_csv(file_path, usecols=['telemetry_name'])
-    parameters = sorted(df['telemetry_name'].dropna().unique())
-    return parameters
+    _, parameters, _ = _scan_metadata(file_path)
+    return list(parameters)
 
 
 def validate_data_completeness(
@@ -583,18 +722,14 @@ def validate_data_completeness(
         print("DATA VALIDATION")
         print("=" * 60)
 
-    # Get vehicles and parameters
-    vehicles = get_available_vehicles(file_path)
-    parameters = get_available_parameters(file_path)
+    # Get vehicles, parameters and row count from a single scan
+    vehicles, parameters, total_rows = _scan_metadata(file_path)
+    vehicles, parameters = list(vehicles), list(parameters)
 
     # Check for GPS
     has_gps = ('VBOX_Lat_Min' in parameters and
                'VBOX_Long_Minutes' in parameters)
 
-    # Count total rows
-    df = pd.read_csv(file_path, usecols=['vehicle_number'])
-    total_rows = len(df)
-
     # Validation checks
     validation_passed = True
 
@@ -638,3 +773,522 @@ def validate_data_completeness(
         'total_rows': total_rows,
         'validation_passed': validation_passed
     }
+
+
+def _extract_vehicle_number(vehicle_id: pd.Series) -> pd.Series:
+    """
+    Extract the car number from vehicle IDs like "GR86-002-2".
+
+    Runs pyarrow's compiled regex over the whole column when available,
+    otherwise the pandas string accessor.
+
+    Parameters
+    ----------
+    vehicle_id : pd.Series
+        Vehicle ID strings
+
+    Returns
+    -------
+    pd.Series
+        Vehicle numbers (NaN where the ID doesn't match the pattern)
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        matches = pc.extract_regex(pa.array(vehicle_id, type=pa.string()), r'-(?P<number>\d+)-')
+        numbers = pc.cast(pc.struct_field(matches, 'number'), pa.int64())
+        return pd.Series(
+            numbers.to_numpy(zero_copy_only=False), index=vehicle_id.index, name=vehicle_id.name
+        )
+    except (ImportError, TypeError, ValueError):
+        # No pyarrow, or values pyarrow can't treat as strings
+        numbers = vehicle_id.str.extract(r'-(\d+)-', expand=False)
+        return pd.to_numeric(numbers, errors='coerce')
+
+
+def _valid_lap_mask(
+    lap: np.ndarray,
+    lap_time: np.ndarray,
+    min_lap_time: float,
+    max_lap_time: float
+) -> np.ndarray:
+    """
+    Boolean mask of laps after lap 1 with min_lap_time < lap_time < max_lap_time.
+
+    Built in a single pass by a Numba kernel when available, otherwise by
+    chained numpy comparisons.
+    """
+    try:
+        from ._numba_kernels import valid_lap_mask
+    except ImportError:
+        return (lap > 1) & (lap_time > min_lap_time) & (lap_time < max_lap_time)
+
+    return valid_lap_mask(lap, lap_time, float(min_lap_time), float(max_lap_time))
+
+
+def _pivot_telemetry(df_long: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pivot long-format telemetry (non-null values only) to one row per
+    vehicle/lap/timestamp and one column per parameter.
+
+    Duplicate keys keep their first value (as pivot_table's aggfunc='first'
+    did) and rows with missing keys are dropped. Rows come out sorted by
+    vehicle, lap and timestamp, parameter columns in name order. Uses Polars'
+    parallel hash pivot when installed, otherwise a single pandas
+    groupby.first() whose sorted group keys give the row order for free.
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        pl = None
+
+    if pl is not None:
+        keys = ['vehicle_number', 'lap', 'timestamp']
+        frame = (
+            pl.from_pandas(df_long[keys + ['telemetry_name', 'telemetry_value']])
+            .with_columns(pl.col('telemetry_name').cast(pl.Utf8))
+            .drop_nulls(keys)
+        )
+        wide = frame.pivot(
+            on='telemetry_name', index=keys, values='telemetry_value',
+            aggregate_function='first'
+        )
+        wide = wide.select(keys + sorted(wide.columns[len(keys):])).sort(keys)
+        return wide.to_pandas()
+
+    # Unstacking a categorical level yields one column per category,
+    # so drop the categories filtered out upstream
+    telemetry_name = df_long['telemetry_name'].cat.remove_unused_categories()
+    first = (
+        df_long['telemetry_value']
+        .groupby(
+            [df_long['vehicle_number'], df_long['lap'], df_long['timestamp'], telemetry_name],
+            observed=True
+        )
+        .first()
+    )
+    # Groups come out sorted by key, so the unstacked rows are already in
+    # vehicle/lap/timestamp order and the columns in name order
+    df_wide = first.unstack('telemetry_name')
+    df_wide.columns = df_wide.columns.astype(object)
+    df_wide = df_wide.reset_index()
+
+    # Flatten column names
+    df_wide.columns.name = None
+    return df_wide
+
+
+def _isin(values: pd.Series, items: List) -> np.ndarray:
+    """
+    Boolean mask of `values` that appear in `items`.
+
+    Short selections (the usual handful of laps or parameters) are matched
+    with a few vectorised equality tests instead of building a hash table
+    as ``Series.isin`` does; categoricals are matched on their integer codes.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.categories.get_indexer(pd.unique(np.asarray(items, dtype=object)))
+        items = codes[codes >= 0]
+        values = values.cat.codes
+    elif len(items) > _SMALL_ISIN_SIZE:
+        return values.isin(items).to_numpy()
+
+    array = values.to_numpy()
+    if len(items) > _SMALL_ISIN_SIZE:
+        return np.isin(array, items)
+
+    mask = np.zeros(len(array), dtype=bool)
+    for item in items:
+        mask |= array == item
+    return mask
+
+
+def _remember_load(key: Tuple, df: pd.DataFrame) -> None:
+    """
+    Store a copy of a load_telemetry result in the LRU cache.
+
+    Results larger than a quarter of _LOAD_CACHE_MAX_BYTES are not stored
+    (nor copied); older entries are evicted until the cache fits both its
+    entry and byte limits.
+
+    Parameters
+    ----------
+    key : tuple
+        Cache key built by load_telemetry
+    df : pd.DataFrame
+        Result to cache (copied, so callers may modify their frame)
+    """
+    n_bytes = int(df.memory_usage(deep=True).sum())
+    if n_bytes > _LOAD_CACHE_MAX_BYTES // 4:
+        return
+
+    _LOAD_CACHE[key] = (df.copy(), n_bytes)
+    _LOAD_CACHE.move_to_end(key)
+    total = sum(size for _, size in _LOAD_CACHE.values())
+    while len(_LOAD_CACHE) > _LOAD_CACHE_SIZE or total > _LOAD_CACHE_MAX_BYTES:
+        _, (_, size) = _LOAD_CACHE.popitem(last=False)
+        total -= size
+
+
+def clear_load_cache() -> None:
+    """
+    Drop all cached load_telemetry results.
+
+    load_telemetry keeps recent results in memory (bounded by count and
+    size) so repeated loads of the same selection skip the file; call this
+    to release that memory.
+    """
+    _LOAD_CACHE.clear()
+
+
+def _scan_metadata(
+    file_path: Union[str, Path]
+) -> Tuple[Tuple[int, ...], Tuple[str, ...], int]:
+    """
+    Scan a telemetry file once for its vehicles, parameters and row count.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path to CSV file
+
+    Returns
+    -------
+    tuple
+        (sorted vehicle numbers, sorted parameter names, total rows)
+    """
+    file_path = Path(file_path).resolve()
+    key = (str(file_path), _file_version(file_path))
+
+    cached = _METADATA_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    df = _read_telemetry_table(file_path, columns=['vehicle_number', 'telemetry_name'])
+    vehicles = tuple(int(v) for v in sorted(df['vehicle_number'].dropna().unique()))
+    parameters = tuple(sorted(df['telemetry_name'].dropna().unique()))
+
+    _METADATA_CACHE[key] = (vehicles, parameters, len(df))
+    return _METADATA_CACHE[key]
+
+
+def _read_telemetry_table(
+    file_path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple]] = None,
+    write_cache: bool = True
+) -> pd.DataFrame:
+    """
+    Read a long-format telemetry CSV, preferring a Parquet sidecar.
+
+    The first read streams the CSV into a ``<name>.csv.parquet`` sidecar
+    next to it; every read then loads only the requested columns from the
+    sidecar, with `filters` pushed down so non-matching row groups are
+    skipped. The sidecar is rebuilt whenever its stamp (see _sidecar_stamp)
+    doesn't match the CSV. Without pyarrow, if the sidecar can't be written,
+    or if it is stale and `write_cache` is False, the CSV is read in chunks
+    and only matching rows are kept, so peak memory follows the selection
+    rather than the file size.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path to CSV file
+    columns : list of str, optional
+        Columns to return (all columns if None)
+    filters : list of tuple, optional
+        pyarrow-style ``(column, op, value)`` predicates with op ``'='`` or
+        ``'in'``. Parquet reads prune on them at row-group level, so callers
+        must still apply their own filters
+    write_cache : bool, default=True
+        Whether a missing or stale sidecar may be (re)written
+
+    Returns
+    -------
+    pd.DataFrame
+        Telemetry table with the same dtypes as ``pd.read_csv`` would give,
+        indexed by each row's position in the CSV
+    """
+    file_path = Path(file_path)
+    parquet_path = file_path.with_name(file_path.name + '.parquet')
+
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        pq = None
+
+    if pq is not None:
+        if _sidecar_is_fresh(file_path, parquet_path) or (
+            write_cache and _write_parquet_sidecar(file_path, parquet_path)
+        ):
+            # telemetry_name is dictionary-encoded in the file, so decode it
+            # straight to a categorical
+            table = pq.read_table(
+                parquet_path,
+                columns=columns + [_SIDECAR_ROW_COLUMN] if columns is not None else None,
+                filters=filters,
+                read_dictionary=['telemetry_name']
+            )
+            rows = table.column(_SIDECAR_ROW_COLUMN).to_numpy()
+            df = table.drop_columns([_SIDECAR_ROW_COLUMN]).to_pandas()
+            df.index = pd.Index(rows)
+            return _categorize_telemetry_name(df)
+
+    # Chunks keep their row positions in the file as index labels
+    chunks = []
+    for chunk in pd.read_csv(file_path, usecols=columns, chunksize=_CSV_CHUNK_ROWS):
+        mask = np.ones(len(chunk), dtype=bool)
+        for column, op, value in filters or []:
+            if op == 'in':
+                mask &= _isin(chunk[column], value)
+            else:
+                mask &= (chunk[column] == value).to_numpy()
+        chunks.append(chunk if mask.all() else chunk.loc[mask])
+
+    df = pd.concat(chunks)
+    if columns is not None:
+        df = df[columns]
+    return _categorize_telemetry_name(df)
+
+
+def _file_version(file_path: Path) -> Tuple[int, int]:
+    """
+    Size and mtime (ns) of a file, identifying the version of its contents.
+
+    Both are compared for equality, so a file replaced by an older copy
+    (``cp -p``, ``rsync -t``, unzip) counts as changed too.
+    """
+    stat = file_path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _sidecar_stamp(file_path: Path) -> bytes:
+    """
+    Identify the CSV and code version a Parquet sidecar is built from.
+    """
+    size, mtime_ns = _file_version(file_path)
+    return json.dumps({
+        'version': _SIDECAR_VERSION,
+        'size': size,
+        'mtime_ns': mtime_ns,
+    }, sort_keys=True).encode()
+
+
+def _sidecar_is_fresh(file_path: Path, parquet_path: Path) -> bool:
+    """
+    Whether the Parquet sidecar exists and its stamp matches the CSV.
+
+    Sidecars that are unreadable or were written without a stamp count as
+    stale.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if not parquet_path.exists():
+        return False
+    try:
+        metadata = pq.read_schema(parquet_path).metadata or {}
+    except (OSError, pa.ArrowException):
+        return False
+    return metadata.get(_SIDECAR_STAMP) == _sidecar_stamp(file_path)
+
+
+def _write_parquet_sidecar(file_path: Path, parquet_path: Path) -> bool:
+    """
+    Convert a telemetry CSV to a Parquet sidecar one block at a time.
+
+    Column types are inferred from the first block with the same rules as
+    `_read_csv`. If a later block doesn't fit them (e.g. a column that is
+    only empty or integer at the start of the file), the whole CSV is parsed
+    at once instead. Each row's position in the CSV is stored alongside
+    (delta-encoded, so it costs a few KB per million rows). The schema
+    metadata carries the CSV's stamp (see
+    _sidecar_stamp), taken before the CSV is read, so a CSV changed while
+    it is converted leaves a stale sidecar rather than a wrongly fresh one.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path to CSV file
+    parquet_path : Path
+        Sidecar to (re)write
+
+    Returns
+    -------
+    bool
+        Whether the sidecar was written
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+
+    # Write to a temporary name first so a concurrent reader never sees
+    # a partial file
+    tmp_path = parquet_path.with_name(parquet_path.name + '.tmp')
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=64 << 20)
+
+    # Row positions are consecutive, so delta encoding (which excludes
+    # dictionary encoding) packs them to almost nothing
+    def write_options(schema):
+        return dict(
+            compression='snappy',
+            use_dictionary=[name for name in schema.names if name != _SIDECAR_ROW_COLUMN],
+            column_encoding={_SIDECAR_ROW_COLUMN: 'DELTA_BINARY_PACKED'},
+        )
+
+    try:
+        stamp = _sidecar_stamp(file_path)
+        try:
+            # Date/time-like columns are read as text and all-empty ones as
+            # float, as in _read_csv; the schema is fixed by the first block
+            column_types = {}
+            while True:
+                reader = pa_csv.open_csv(
+                    file_path,
+                    read_options=read_options,
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types=column_types,
+                        timestamp_parsers=['never'],
+                        strings_can_be_null=True
+                    )
+                )
+                retyped = {
+                    field.name: pa.string() if pa.types.is_temporal(field.type) else pa.float64()
+                    for field in reader.schema
+                    if field.name not in column_types
+                    and (pa.types.is_temporal(field.type) or pa.types.is_null(field.type))
+                }
+                if not retyped:
+                    break
+                reader.close()
+                column_types.update(retyped)
+
+            schema = reader.schema.append(
+                pa.field(_SIDECAR_ROW_COLUMN, pa.int64())
+            ).with_metadata({_SIDECAR_STAMP: stamp})
+            with reader, pq.ParquetWriter(tmp_path, schema, **write_options(schema)) as writer:
+                n_rows = 0
+                for batch in reader:
+                    rows = pa.array(np.arange(n_rows, n_rows + batch.num_rows))
+                    n_rows += batch.num_rows
+                    writer.write_batch(
+                        pa.RecordBatch.from_arrays(batch.columns + [rows], schema=schema),
+                        row_group_size=1_000_000
+                    )
+        except pa.ArrowInvalid:
+            tmp_path.unlink(missing_ok=True)
+            table = pa.Table.from_pandas(_read_csv(file_path), preserve_index=False)
+            table = table.append_column(
+                _SIDECAR_ROW_COLUMN, pa.array(np.arange(table.num_rows))
+            ).replace_schema_metadata(
+                {**(table.schema.metadata or {}), _SIDECAR_STAMP: stamp}
+            )
+            with pq.ParquetWriter(tmp_path, table.schema, **write_options(table.schema)) as writer:
+                writer.write_table(table, row_group_size=1_000_000)
+        os.replace(tmp_path, parquet_path)
+    except (OSError, pa.ArrowException):
+        # Read-only location or columns pyarrow can't represent
+        tmp_path.unlink(missing_ok=True)
+        return False
+
+    return True
+
+
+def _read_csv(
+    file_path: Union[str, Path],
+    sep: str = ',',
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Parse a CSV with pyarrow's multithreaded reader.
+
+    Falls back to ``pd.read_csv`` when pyarrow isn't installed. Inference is
+    kept in line with the pandas C parser so callers see the same dtypes
+    either way: date/time-like text stays as strings (callers parse the
+    columns they need), empty strings are missing values and all-empty
+    columns are float.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path to CSV file
+    sep : str, default=','
+        Field delimiter
+    columns : list of str, optional
+        Columns to parse (all columns if None); the rest are skipped by
+        the tokenizer rather than converted and dropped
+
+    Returns
+    -------
+    pd.DataFrame
+        Parsed file
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return pd.read_csv(file_path, sep=sep, usecols=columns)
+
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=64 << 20)
+    parse_options = pa_csv.ParseOptions(delimiter=sep)
+
+    # A timestamp format that never matches switches off pyarrow's ISO-8601
+    # timestamp inference; any date/time columns it still infers are re-read
+    # as text (rare, so a second parse is cheaper than a schema sniff)
+    column_types = {}
+    while True:
+        convert_options = pa_csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=columns,
+            timestamp_parsers=['never'],
+            strings_can_be_null=True
+        )
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options
+        )
+        temporal = [
+            field.name for field in table.schema
+            if pa.types.is_temporal(field.type) and field.name not in column_types
+        ]
+        if not temporal:
+            break
+        column_types.update({name: pa.string() for name in temporal})
+
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+
+    return table.to_pandas()
+
+
+def _categorize_telemetry_name(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store telemetry_name as a categorical with sorted categories.
+
+    A few dozen parameter names repeat across millions of rows, so
+    filtering and reshaping on integer codes is much cheaper than on
+    strings. Sorted categories keep sort order identical to plain strings.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Telemetry table (modified in place if it has a telemetry_name column)
+
+    Returns
+    -------
+    pd.DataFrame
+        The same frame
+    """
+    if 'telemetry_name' not in df.columns:
+        return df
+
+    names = df['telemetry_name']
+    if isinstance(names.dtype, pd.CategoricalDtype):
+        df['telemetry_name'] = names.cat.reorder_categories(sorted(names.cat.categories))
+    else:
+        df['telemetry_name'] = names.astype('category')
+    return df
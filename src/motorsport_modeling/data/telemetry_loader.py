@@ -18,12 +18,57 @@ Usage:
     df = load_telemetry(race_dir)
 """
 
+import os
 from pathlib import Path
 import pandas as pd
 import numpy as np
 import json
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import itemgetter
 from typing import Optional, Union, List
 
+try:
+    # Rust JSON parser, several times faster than the stdlib on the small
+    # per-row payloads of JSON-format telemetry
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Rows per chunk when streaming a telemetry CSV (bytes per block with pyarrow)
+_CSV_CHUNK_ROWS = 1_000_000
+_ARROW_BLOCK_BYTES = 64 << 20
+
+# Date and time of an ISO 8601 timestamp, e.g. 2025-04-27T14:00:00.123Z
+_ISO_8601 = re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}')
+
+# Car number (last field) and chassis number (middle field) of GR86-XXX-YY
+_CAR_NUMBER = re.compile(r'-(\d+)$')
+_CHASSIS_NUMBER = re.compile(r'-(\d+)-')
+
+# A last vehicle_id field the JSON format reads as a car number
+_ID_NUMBER = re.compile(r'\s*[+-]?\d+\s*')
+
+# GPS coordinates in degrees; float32 spacing there is ~0.4-0.7 m at these
+# tracks, so unlike the other signals they are never downcast
+_GPS_SIGNALS = ('VBOX_Lat_Min', 'VBOX_Long_Minutes')
+
+# Version of the rows in the normalized Parquet cache. Bump it whenever
+# JSON expansion, vehicle identification or _downcast change their output,
+# so caches written by older code are rebuilt rather than reused
+_NORMALIZED_CACHE_VERSION = 2
+
+# Parquet schema metadata key holding the cache version and the size and
+# mtime of the CSV the cache was built from
+_NORMALIZED_CACHE_STAMP = b'motorsport_modeling.normalized_source'
+
+# Most recent load_lap_times results, keyed by (resolved path, mtime) of
+# the file they were read from
+_LAP_TIMES_CACHE = OrderedDict()
+_LAP_TIMES_CACHE_SIZE = 16
+
 
 def load_telemetry(
     race_dir: Union[str, Path],
@@ -31,7 +76,8 @@ def load_telemetry(
     laps: Optional[List[int]] = None,
     pivot_to_wide: bool = True,
     use_meta_time: bool = True,
-    verbose: bool = True
+    verbose: bool = True,
+    write_cache: bool = True
 ) -> pd.DataFrame:
     """
     Load and normalize telemetry data from a race directory.
@@ -50,6 +96,9 @@ def load_telemetry(
         If True, use meta_time for timing (more reliable than ECU timestamp)
     verbose : bool
         Print progress information
+    write_cache : bool
+        If False, never write the normalized Parquet cache into the race
+        directory (an existing up-to-date cache is still read)
 
     Returns
     -------
@@ -60,6 +109,15 @@ def load_telemetry(
         - vehicle_number: car number
         - speed, aps, pbrake_f, pbrake_r, accx_can, accy_can, Steering_Angle, gear, nmot
         - Plus GPS columns if available: gps_lat, gps_lon, lap_distance
+
+    Notes
+    -----
+    When pyarrow is installed, the first load caches the normalized long
+    rows (JSON payloads parsed, vehicle IDs fixed) in a hidden
+    ``.<name>.normalized.parquet`` file next to the CSV. Later loads read
+    only the requested vehicle from it. The cache records the CSV's size
+    and mtime and the cache format version, and is rebuilt when any of
+    them differ.
     """
     race_dir = Path(race_dir)
 
@@ -72,35 +130,15 @@ def load_telemetry(
     if verbose:
         print(f"Loading telemetry from: {telem_file.name}")
 
-    # Load data
-    df = pd.read_csv(telem_file, low_memory=False)
-    df.columns = df.columns.str.strip()
-
-    if verbose:
-        print(f"  Raw rows: {len(df):,}")
-
-    # Detect and handle format
-    if 'telemetry_name' in df.columns:
-        # Standard long format
-        df = _process_long_format(df)
-    elif 'value' in df.columns and df['value'].dtype == object:
-        # Check if JSON format (Sebring R2)
-        sample = str(df['value'].iloc[0])
-        if sample.startswith('[{'):
-            df = _process_json_format(df, verbose)
-        else:
-            df = _process_long_format(df)
-    else:
-        raise ValueError(f"Unknown telemetry format in {telem_file}")
-
-    # Fix vehicle identification
-    df = _fix_vehicle_identification(df)
-
-    # Filter by vehicle if specified
-    if vehicle_number is not None:
-        df = df[df['vehicle_number'] == vehicle_number]
+    # Normalised rows come from the Parquet cache when it is up to date,
+    # otherwise from the CSV (which refreshes the cache)
+    cache_path = telem_file.with_name(f'.{telem_file.stem}.normalized.parquet')
+    df = _read_normalized_cache(cache_path, telem_file, vehicle_number)
+    if df is not None:
         if verbose:
-            print(f"  Filtered to vehicle #{vehicle_number}: {len(df):,} rows")
+            print(f"  Loaded {len(df):,} normalized rows from {cache_path.name}")
+    else:
+        df = _read_telemetry_csv(telem_file, cache_path, vehicle_number, verbose, write_cache)
 
     # Fix lap 32768 corruption
     df = _fix_lap_corruption(df, race_dir, verbose)
@@ -113,9 +151,9 @@ def load_telemetry(
 
     # Select timestamp column
     if use_meta_time and 'meta_time' in df.columns:
-        df['time'] = pd.to_datetime(df['meta_time'], errors='coerce')
+        df['time'] = _parse_times(df['meta_time'])
     else:
-        df['time'] = pd.to_datetime(df['timestamp'], errors='coerce')
+        df['time'] = _parse_times(df['timestamp'])
 
     # Pivot to wide format if requested
     if pivot_to_wide:
@@ -124,9 +162,14 @@ def load_telemetry(
     # Normalize signal names
     df = _normalize_signal_names(df)
 
-    # Sort by time and vehicle
+    # Sort by time and vehicle (single-vehicle loads usually arrive in
+    # order, and checking is far cheaper than re-sorting)
     if 'time' in df.columns:
-        df = df.sort_values(['vehicle_number', 'lap', 'time']).reset_index(drop=True)
+        sort_cols = ['vehicle_number', 'lap', 'time']
+        if _is_sorted(df, sort_cols):
+            df = df.reset_index(drop=True)
+        else:
+            df = df.sort_values(sort_cols, ignore_index=True)
 
     if verbose:
         print(f"  Final shape: {df.shape}")
@@ -139,6 +182,341 @@ def load_telemetry(
     return df
 
 
+def _is_sorted(df: pd.DataFrame, columns: List[str]) -> bool:
+    """
+    Check whether rows are already in ascending order of ``columns``.
+
+    One vectorized pass comparing neighbouring rows. Missing values and
+    non-numeric keys count as unsorted, leaving them to sort_values.
+    """
+    ties = np.ones(max(len(df) - 1, 0), dtype=bool)
+    for col in columns:
+        values = df[col]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            keys = values.array.asi8
+        elif pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            keys = values.to_numpy()
+        else:
+            return False
+        if values.isna().any():
+            return False
+
+        if (ties & (keys[1:] < keys[:-1])).any():
+            return False
+        ties &= keys[1:] == keys[:-1]
+    return True
+
+
+def _read_normalized_cache(
+    cache_path: Path,
+    telem_file: Path,
+    vehicle_number: Optional[int] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Read normalized telemetry rows from the Parquet cache.
+
+    Returns None when pyarrow isn't installed, the cache is missing or
+    unreadable, or its stamp (see _cache_stamp) doesn't match the CSV and
+    the current cache version. The vehicle filter is pushed down to the
+    Parquet reader so row groups of other cars are skipped.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+
+    if not cache_path.exists():
+        return None
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+    except (OSError, pa.ArrowException):
+        return None
+    if metadata.get(_NORMALIZED_CACHE_STAMP) != _cache_stamp(telem_file):
+        return None
+
+    filters = [('vehicle_number', '=', vehicle_number)] if vehicle_number is not None else None
+    df = pq.read_table(cache_path, filters=filters).to_pandas()
+
+    # Row groups carry their own dictionaries; restore the sorted categories
+    # the CSV path produces
+    return df.astype({
+        col: pd.CategoricalDtype(sorted(df[col].cat.categories))
+        for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)
+    }, copy=False)
+
+
+def _cache_stamp(telem_file: Path) -> bytes:
+    """
+    Identify the CSV and code version a normalized cache was built from.
+
+    Size and mtime are compared for equality, so a CSV replaced by an
+    older copy (``cp -p``, ``rsync -t``) also invalidates the cache.
+    """
+    stat = telem_file.stat()
+    return json.dumps({
+        'version': _NORMALIZED_CACHE_VERSION,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }, sort_keys=True).encode()
+
+
+def _read_telemetry_csv(
+    telem_file: Path,
+    cache_path: Path,
+    vehicle_number: Optional[int] = None,
+    verbose: bool = True,
+    write_cache: bool = True
+) -> pd.DataFrame:
+    """
+    Read, normalize and vehicle-filter a telemetry CSV in chunks.
+
+    Chunks come from pyarrow's multithreaded streaming CSV reader when it
+    is installed. If a later block doesn't fit the column types inferred
+    from the first one, the file is re-read with pandas' chunked reader.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+
+    if pa is not None:
+        try:
+            return _normalize_chunks(
+                _arrow_csv_chunks(telem_file), telem_file, cache_path, vehicle_number, verbose,
+                write_cache
+            )
+        except pa.ArrowInvalid:
+            if verbose:
+                print("  Column types changed mid-file - re-reading with pandas")
+
+    # The few distinct signal names and vehicle IDs repeat on every row,
+    # so they are parsed straight to categoricals
+    chunks = pd.read_csv(
+        telem_file, low_memory=False, chunksize=_CSV_CHUNK_ROWS,
+        dtype={'telemetry_name': 'category', 'vehicle_id': 'category'}
+    )
+    return _normalize_chunks(chunks, telem_file, cache_path, vehicle_number, verbose, write_cache)
+
+
+def _arrow_csv_chunks(telem_file: Path):
+    """
+    Stream a telemetry CSV as DataFrames with pyarrow's CSV reader.
+
+    Inference follows `pd.read_csv` (see loaders._read_csv): date/time-like
+    text stays as strings, all-empty columns are float and missing text is
+    NaN. Signal names and vehicle IDs are dictionary-encoded, arriving as
+    categoricals with sorted categories like pandas' 'category' dtype.
+    Column types are fixed by the first block; a later block that doesn't
+    fit raises pyarrow.ArrowInvalid.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=_ARROW_BLOCK_BYTES)
+    column_types = {}
+    while True:
+        reader = pa_csv.open_csv(
+            telem_file,
+            read_options=read_options,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                timestamp_parsers=['never'],
+                strings_can_be_null=True
+            )
+        )
+        retyped = {}
+        for field in reader.schema:
+            if field.name in column_types:
+                continue
+            if pa.types.is_temporal(field.type):
+                retyped[field.name] = pa.string()
+            elif pa.types.is_null(field.type):
+                retyped[field.name] = pa.float64()
+            elif field.name.strip() in ('telemetry_name', 'vehicle_id'):
+                retyped[field.name] = pa.dictionary(pa.int32(), pa.string())
+        if not retyped:
+            break
+        reader.close()
+        column_types.update(retyped)
+
+    with reader:
+        for batch in reader:
+            chunk = batch.to_pandas()
+            for col in chunk.columns:
+                if isinstance(chunk[col].dtype, pd.CategoricalDtype):
+                    chunk[col] = chunk[col].cat.reorder_categories(
+                        chunk[col].cat.categories.sort_values()
+                    )
+                elif chunk[col].dtype == object and batch.column(col).null_count:
+                    # Missing strings arrive as None; pandas reads them as NaN
+                    chunk[col] = chunk[col].where(chunk[col].notna(), np.nan)
+            yield chunk
+
+
+def _normalize_chunks(
+    chunks,
+    telem_file: Path,
+    cache_path: Path,
+    vehicle_number: Optional[int] = None,
+    verbose: bool = True,
+    write_cache: bool = True
+) -> pd.DataFrame:
+    """
+    Normalize and vehicle-filter raw telemetry chunks.
+
+    Each chunk is converted to long format (parsing JSON payloads), gets
+    its vehicle identification fixed and is filtered before it is kept, so
+    peak memory follows the selected vehicle rather than the whole race.
+    When pyarrow is installed and `write_cache` is set, every normalized
+    chunk is also appended to the Parquet cache at `cache_path`, stamped
+    with the CSV's _cache_stamp taken before reading; if a chunk doesn't
+    fit the schema of the first one, or the cache can't be written, the
+    cache is skipped.
+    JSON files read for a single vehicle aren't cached: only that
+    vehicle's payloads are parsed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        pa = None
+
+    # Write to a temporary name first so a concurrent reader never sees
+    # a partial file
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    writer = None
+    caching = pa is not None and write_cache
+    stamp = _cache_stamp(telem_file) if caching else None
+
+    parts = []
+    n_raw = 0
+    n_json = 0
+    telem_format = None
+    completed = False
+    try:
+        for chunk in chunks:
+            chunk.columns = chunk.columns.str.strip()
+            n_raw += len(chunk)
+
+            # Detect format from the first chunk
+            if telem_format is None:
+                telem_format = _detect_format(chunk, telem_file)
+                if verbose and telem_format == 'json':
+                    print("  Detected JSON format - parsing...")
+                if telem_format == 'json' and vehicle_number is not None:
+                    # Caching needs every car's payloads parsed; parsing only
+                    # the selected car's is V times less work
+                    caching = False
+
+            if telem_format == 'json':
+                chunk = _process_json_format(
+                    chunk, verbose=False, vehicle_number=None if caching else vehicle_number
+                )
+                n_json += len(chunk)
+            else:
+                chunk = _process_long_format(chunk)
+
+            # Fix vehicle identification
+            chunk = _fix_vehicle_identification(chunk)
+            chunk = _downcast(chunk)
+
+            if caching:
+                try:
+                    if writer is None:
+                        table = pa.Table.from_pandas(chunk, preserve_index=False)
+                        schema = table.schema.with_metadata(
+                            {**(table.schema.metadata or {}), _NORMALIZED_CACHE_STAMP: stamp}
+                        )
+                        writer = pq.ParquetWriter(tmp_path, schema, compression='zstd')
+                    else:
+                        table = pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+                    writer.write_table(table, row_group_size=_CSV_CHUNK_ROWS)
+                except (OSError, pa.ArrowException):
+                    # Read-only location or columns pyarrow can't represent
+                    caching = False
+
+            # Filter by vehicle if specified
+            if vehicle_number is not None:
+                chunk = chunk[chunk['vehicle_number'] == vehicle_number]
+
+            parts.append(chunk)
+        completed = True
+    finally:
+        if writer is not None:
+            writer.close()
+            if completed and caching:
+                try:
+                    os.replace(tmp_path, cache_path)
+                except OSError:
+                    pass
+            tmp_path.unlink(missing_ok=True)
+
+    df = _concat_chunks(parts)
+
+    if verbose:
+        print(f"  Raw rows: {n_raw:,}")
+        if telem_format == 'json':
+            print(f"  Parsed {n_json:,} signal readings from JSON")
+        if vehicle_number is not None:
+            print(f"  Filtered to vehicle #{vehicle_number}: {len(df):,} rows")
+
+    return df
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink a normalized chunk to the narrowest dtypes its data needs.
+
+    Signal names become categorical, lap numbers int32 (the 32768
+    corruption sentinel overflows int16) and car numbers int16. Integer
+    columns holding NaNs are left alone. Values stay float64, as GPS
+    coordinates share the column; signals are narrowed after the wide
+    pivot instead (see _downcast_signals).
+    """
+    dtypes = {}
+    if 'signal' in df.columns and not isinstance(df['signal'].dtype, pd.CategoricalDtype):
+        dtypes['signal'] = 'category'
+    if 'lap' in df.columns and pd.api.types.is_integer_dtype(df['lap']):
+        dtypes['lap'] = np.int32
+    if 'vehicle_number' in df.columns and pd.api.types.is_integer_dtype(df['vehicle_number']):
+        dtypes['vehicle_number'] = np.int16
+    return df.astype(dtypes, copy=False) if dtypes else df
+
+
+def _concat_chunks(parts: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate normalized chunks, keeping categorical columns categorical.
+
+    Each chunk infers its own categories, and pd.concat falls back to object
+    for mismatched ones, so every chunk is first given the sorted union.
+    Empty chunks are dropped, since they would upcast columns to object too.
+    """
+    parts = [part for part in parts if len(part)] or parts[:1]
+    if len(parts) == 1:
+        return parts[0]
+
+    dtypes = {
+        col: pd.CategoricalDtype(sorted(set().union(*(part[col].cat.categories for part in parts))))
+        for col in parts[0].columns
+        if all(isinstance(part[col].dtype, pd.CategoricalDtype) for part in parts)
+    }
+    parts = [part.astype(dtypes, copy=False) for part in parts]
+    return pd.concat(parts, ignore_index=True)
+
+
+def _detect_format(df: pd.DataFrame, telem_file: Path) -> str:
+    """Detect whether telemetry is in long ('long') or JSON ('json') format."""
+    if 'telemetry_name' in df.columns:
+        # Standard long format
+        return 'long'
+    elif 'value' in df.columns and df['value'].dtype == object:
+        # Check if JSON format (Sebring R2)
+        sample = str(df['value'].iloc[0])
+        return 'json' if sample.startswith('[{') else 'long'
+    raise ValueError(f"Unknown telemetry format in {telem_file}")
+
+
 def _process_long_format(df: pd.DataFrame) -> pd.DataFrame:
     """Process standard long format telemetry."""
     # Rename telemetry columns for consistency
@@ -150,57 +528,81 @@ def _process_long_format(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _process_json_format(df: pd.DataFrame, verbose: bool = True) -> pd.DataFrame:
+def _process_json_format(
+    df: pd.DataFrame,
+    verbose: bool = True,
+    vehicle_number: Optional[int] = None
+) -> pd.DataFrame:
     """
     Process JSON format telemetry (Sebring R2).
 
     The 'value' column contains JSON arrays like:
     [{"name":"accx_can","value":0.5},{"name":"speed","value":145.3}]
+
+    If `vehicle_number` is given, rows of other cars are dropped before
+    their payloads are parsed.
     """
     if verbose:
         print("  Detected JSON format - parsing...")
 
-    rows = []
+    # Extract vehicle_number from vehicle_id (GR86-XXX-YY) where missing,
+    # once per distinct id rather than per row (0 if YY isn't a number)
+    if 'vehicle_number' in df.columns:
+        vehicle_num = df['vehicle_number'].astype(object)
+    else:
+        vehicle_num = pd.Series(None, index=df.index, dtype=object)
+    if 'vehicle_id' in df.columns:
+        codes, uniques = pd.factorize(df['vehicle_id'])
+        # Code -1 (missing id) picks the trailing slot, never used
+        from_id = np.zeros(len(uniques) + 1, dtype=object)
+        has_number = np.zeros(len(uniques) + 1, dtype=bool)
+        for i, vid in enumerate(uniques):
+            parts = str(vid).split('-')
+            if len(parts) >= 3:
+                has_number[i] = True
+                if _ID_NUMBER.fullmatch(parts[-1]):
+                    from_id[i] = parts[-1]
+        use_id = vehicle_num.isna().to_numpy() & has_number[codes]
+        vehicle_num = vehicle_num.where(~use_id, from_id[codes])
+
+    base = pd.DataFrame({
+        col: df[col] if col in df.columns else None
+        for col in ['lap', 'timestamp', 'meta_time', 'vehicle_id']
+    }, index=df.index)
+    base['vehicle_number'] = vehicle_num
+    payloads = df['value']
 
-    for _, row in df.iterrows():
-        try:
-            signals = json.loads(row['value'])
-
-            # Extract vehicle_number from vehicle_id if not present
-            vehicle_num = row.get('vehicle_number')
-            if pd.isna(vehicle_num) and 'vehicle_id' in row:
-                # Extract from GR86-XXX-YY format
-                vid = str(row.get('vehicle_id', ''))
-                if '-' in vid:
-                    parts = vid.split('-')
-                    if len(parts) >= 3:
-                        try:
-                            vehicle_num = int(parts[-1])
-                        except ValueError:
-                            vehicle_num = 0
-
-            base_data = {
-                'lap': row.get('lap'),
-                'timestamp': row.get('timestamp'),
-                'meta_time': row.get('meta_time'),
-                'vehicle_id': row.get('vehicle_id'),
-                'vehicle_number': vehicle_num,
-            }
-
-            for signal in signals:
-                new_row = base_data.copy()
-                new_row['signal'] = signal['name']
-                new_row['value'] = signal['value']
-                rows.append(new_row)
-
-        except (json.JSONDecodeError, KeyError, TypeError):
-            continue
-
-    result = pd.DataFrame(rows)
-
-    # Ensure vehicle_number is numeric
-    if 'vehicle_number' in result.columns:
-        result['vehicle_number'] = pd.to_numeric(result['vehicle_number'], errors='coerce')
+    if vehicle_number is not None:
+        # Resolve each row's car number as the expanded rows will get it
+        resolved = base[['vehicle_id']].assign(
+            vehicle_number=pd.to_numeric(vehicle_num, errors='coerce')
+        )
+        keep = (_fix_vehicle_identification(resolved)['vehicle_number'] == vehicle_number).to_numpy()
+        base = base[keep]
+        payloads = payloads[keep]
+
+    # Parse each payload into (name, value) pairs; unparseable rows give []
+    signals = payloads.map(_parse_signals)
+
+    # Ensure vehicle_number is numeric, converting each row that has
+    # signals before it is repeated (its dtype only depends on the values
+    # that end up in the output)
+    counts = np.fromiter(map(len, signals), dtype=np.int64, count=len(signals))
+    has_signals = counts > 0
+    base = base[has_signals]
+    counts = counts[has_signals]
+    base['vehicle_number'] = pd.to_numeric(base['vehicle_number'], errors='coerce')
+
+    # One output row per signal: repeat each row's fields once per pair
+    # and gather the flattened names and values
+    pairs = list(chain.from_iterable(signals))
+    names = np.fromiter(map(itemgetter(0), pairs), dtype=object, count=len(pairs))
+    values = np.fromiter(map(itemgetter(1), pairs), dtype=object, count=len(pairs))
+
+    result = base.take(np.repeat(np.arange(len(base)), counts)).reset_index(drop=True)
+    result['signal'] = names
+    result['value'] = values
+    result = result.infer_objects()
 
     if verbose:
         print(f"  Parsed {len(result):,} signal readings from JSON")
@@ -208,6 +610,43 @@ def _process_json_format(df: pd.DataFrame, verbose: bool = True) -> pd.DataFrame
     return result
 
 
+def _parse_signals(payload) -> list:
+    """
+    Parse one JSON payload into a list of (name, value) pairs.
+
+    Rows that aren't a JSON array of objects give no pairs; a malformed
+    entry ends the row, keeping the pairs before it.
+    """
+    try:
+        signals = _json_loads(payload)
+    except (json.JSONDecodeError, TypeError):
+        return []
+
+    pairs = []
+    try:
+        for signal in signals:
+            pairs.append((signal['name'], signal['value']))
+    except (KeyError, TypeError):
+        pass
+    return pairs
+
+
+def _json_loads(payload):
+    """
+    json.loads, via orjson when it's installed.
+
+    Payloads orjson rejects but the stdlib accepts (NaN/Infinity literals,
+    integers beyond 64 bits) are re-parsed with the stdlib, so results never
+    depend on which parser is available.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(payload)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(payload)
+
+
 def _fix_vehicle_identification(df: pd.DataFrame) -> pd.DataFrame:
     """
     Fix vehicle identification when car number is 000.
@@ -218,7 +657,7 @@ def _fix_vehicle_identification(df: pd.DataFrame) -> pd.DataFrame:
     if 'vehicle_number' not in df.columns:
         if 'vehicle_id' in df.columns:
             # Extract car number from vehicle_id
-            df['vehicle_number'] = df['vehicle_id'].str.extract(r'-(\d+)$')[0].astype(int)
+            df['vehicle_number'] = _vehicle_id_numbers(df['vehicle_id'], _CAR_NUMBER).astype(int)
         else:
             df['vehicle_number'] = 0
 
@@ -227,12 +666,48 @@ def _fix_vehicle_identification(df: pd.DataFrame) -> pd.DataFrame:
         zero_mask = df['vehicle_number'] == 0
         if zero_mask.any():
             # Extract chassis number (middle part of GR86-XXX-YY)
-            chassis = df.loc[zero_mask, 'vehicle_id'].str.extract(r'-(\d+)-')[0]
-            df.loc[zero_mask, 'vehicle_number'] = pd.to_numeric(chassis, errors='coerce')
+            df.loc[zero_mask, 'vehicle_number'] = _vehicle_id_numbers(
+                df.loc[zero_mask, 'vehicle_id'], _CHASSIS_NUMBER
+            )
 
     return df
 
 
+def _vehicle_id_numbers(vehicle_id: pd.Series, pattern: re.Pattern) -> pd.Series:
+    """
+    Extract the number captured by ``pattern`` from each vehicle_id.
+
+    A race has a few dozen distinct ids across millions of rows, so the
+    regex runs once per distinct id and the results are gathered back by
+    code. Ids without a match give NaN (the result is int64 otherwise).
+    """
+    codes, uniques = pd.factorize(vehicle_id)
+    numbers = np.full(len(uniques) + 1, np.nan)
+    for i, vid in enumerate(uniques):
+        match = pattern.search(vid) if isinstance(vid, str) else None
+        if match:
+            numbers[i] = int(match.group(1))
+
+    # Code -1 (missing id) picks the trailing NaN
+    result = pd.Series(numbers[codes], index=vehicle_id.index)
+    return result if result.isna().any() else result.astype(np.int64)
+
+
+def _parse_times(values: pd.Series, errors: str = 'coerce') -> pd.Series:
+    """
+    Parse a column of timestamp strings.
+
+    Telemetry and timing exports write ISO 8601 ("2025-04-27T14:00:00.123Z"),
+    which is parsed with pandas' dedicated ISO parser instead of guessing a
+    format; it also accepts rows that drop the fractional seconds. Anything
+    else falls back to format inference.
+    """
+    sample = values.dropna().head(1)
+    if len(sample) and _ISO_8601.match(str(sample.iloc[0])):
+        return pd.to_datetime(values, format='ISO8601', errors=errors)
+    return pd.to_datetime(values, errors=errors)
+
+
 def _fix_lap_corruption(
     df: pd.DataFrame,
     race_dir: Path,
@@ -263,50 +738,38 @@ def _fix_lap_corruption(
 
     try:
         lap_starts = pd.read_csv(lap_start_files[0])
-        lap_starts['timestamp'] = pd.to_datetime(lap_starts['timestamp'])
+        lap_starts['timestamp'] = _parse_times(lap_starts['timestamp'], errors='raise')
 
-        # Get time column from telemetry
+        # Get time column from telemetry (kept out of the frame, so it
+        # never needs dropping)
         if 'meta_time' in df.columns:
-            df['_time'] = pd.to_datetime(df['meta_time'], errors='coerce')
+            times = _parse_times(df['meta_time'])
         else:
-            df['_time'] = pd.to_datetime(df['timestamp'], errors='coerce')
-
-        # Recalculate lap numbers
-        # For each row, find which lap it belongs to based on timestamp
-        # This is expensive but necessary for corrupted data
-
-        # Group by vehicle and reassign laps
-        fixed_laps = []
-
-        for veh in df['vehicle_number'].unique():
-            veh_df = df[df['vehicle_number'] == veh].copy()
-            veh_starts = lap_starts[lap_starts['vehicle_number'] == veh].sort_values('timestamp')
-
-            if len(veh_starts) == 0:
-                # Keep original (filtered) laps
-                veh_df = veh_df[veh_df['lap'] < 100]
-                fixed_laps.append(veh_df)
-                continue
-
-            # Create lap boundaries
-            veh_starts_list = veh_starts['timestamp'].tolist()
-            veh_laps_list = veh_starts['lap'].tolist()
-
-            # Assign laps based on timestamp
-            veh_df['lap'] = pd.cut(
-                veh_df['_time'],
-                bins=[pd.Timestamp.min] + veh_starts_list + [pd.Timestamp.max],
-                labels=[0] + veh_laps_list,
-                include_lowest=True
-            )
-
-            fixed_laps.append(veh_df)
-
-        df = pd.concat(fixed_laps, ignore_index=True)
-        df = df.drop(columns=['_time'], errors='ignore')
-
-        # Convert lap to numeric
-        df['lap'] = pd.to_numeric(df['lap'], errors='coerce')
+            times = _parse_times(df['timestamp'])
+
+        # Recalculate lap numbers: each row belongs to the last lap that
+        # started strictly before it (0 before the first start)
+        starts = lap_starts['timestamp']
+        if (times.dt.tz is None) != (starts.dt.tz is None):
+            raise TypeError("Cannot compare tz-naive and tz-aware timestamps")
+        times_i8 = times.dt.as_unit('ns').array.asi8
+        time_missing = times.isna().to_numpy()
+
+        lap_starts = lap_starts.assign(_start=starts.dt.as_unit('ns').array.asi8)
+        lap_starts = lap_starts.sort_values('_start', kind='stable')
+
+        positions, laps = _recalculate_laps(
+            df['vehicle_number'], df['lap'].to_numpy(), times_i8, time_missing, lap_starts
+        )
+
+        # Reorder (and drop) rows with a single copy; when every row stays
+        # in place, only the lap column is replaced
+        if len(positions) == len(df) and (positions == np.arange(len(df))).all():
+            df = df.copy(deep=False)
+        else:
+            df = df.take(positions)
+        df.index = pd.RangeIndex(len(df))
+        df['lap'] = laps
 
         if verbose:
             print(f"  Fixed lap numbers: now {int(df['lap'].min())}-{int(df['lap'].max())}")
@@ -320,6 +783,130 @@ def _fix_lap_corruption(
     return df
 
 
+def _recalculate_laps(
+    vehicle: pd.Series,
+    lap: np.ndarray,
+    times_i8: np.ndarray,
+    time_missing: np.ndarray,
+    lap_starts: pd.DataFrame
+) -> tuple:
+    """
+    Recalculate lap numbers for all vehicles from their lap starts.
+
+    Rows come back grouped by vehicle (in order of first appearance),
+    keeping their order within a vehicle. Uses a parallel Numba kernel
+    when available, otherwise one binary search per vehicle on a thread
+    pool.
+
+    Parameters
+    ----------
+    vehicle : pd.Series
+        Vehicle number of each row
+    lap : np.ndarray
+        Original lap numbers
+    times_i8 : np.ndarray
+        Row timestamps as int64 nanoseconds
+    time_missing : np.ndarray
+        Boolean mask of rows without a timestamp
+    lap_starts : pd.DataFrame
+        Lap starts with vehicle_number, lap and int64 '_start' columns,
+        sorted by '_start'
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (positions, laps): kept row positions and their lap numbers
+    """
+    try:
+        from ._numba_kernels import assign_laps
+    except ImportError:
+        vehicle_starts = {
+            veh: (group['_start'].to_numpy(), group['lap'].to_numpy())
+            for veh, group in lap_starts.groupby('vehicle_number', sort=False)
+        }
+
+        def fix_vehicle(item):
+            veh, rows = item
+            return _fix_one_vehicle(rows, lap, times_i8, time_missing, vehicle_starts.get(veh))
+
+        # Vehicles are independent and the numpy kernels release the GIL,
+        # so threads parallelize without copying the frame to workers
+        groups = vehicle.groupby(vehicle, sort=False).indices.items()
+        with ThreadPoolExecutor(max_workers=min(len(groups), os.cpu_count() or 1) or 1) as pool:
+            positions, laps = zip(*pool.map(fix_vehicle, groups)) if groups else ([], [])
+        return np.concatenate(positions), np.concatenate(laps)
+
+    # Vehicle codes in order of appearance, so grouping rows by code keeps
+    # the vehicle order; starts are laid out CSR-style by code
+    codes, vehicles = pd.factorize(vehicle, sort=False)
+    start_codes = pd.Index(vehicles).get_indexer(lap_starts['vehicle_number'])
+    matched = start_codes >= 0
+    start_order = np.argsort(start_codes[matched], kind='stable')
+    start_ptr = np.zeros(len(vehicles) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(start_codes[matched], minlength=len(vehicles)), out=start_ptr[1:])
+    start_laps = lap_starts['lap'].to_numpy()[matched][start_order]
+
+    positions, laps, counts = assign_laps(
+        codes, times_i8, time_missing, lap,
+        start_ptr, lap_starts['_start'].to_numpy()[matched][start_order],
+        start_laps.astype(np.float64)
+    )
+
+    # Same dtype as concatenating per-vehicle laps: original laps for
+    # vehicles without starts, start laps otherwise, float with NaN
+    has_starts = start_ptr[1:] > start_ptr[:-1]
+    dtypes = []
+    if counts[~has_starts].any():
+        dtypes.append(lap.dtype)
+    if counts[has_starts].any():
+        dtypes.append(np.result_type(np.int64, start_laps.dtype))
+    if np.isnan(laps).any():
+        dtypes.append(np.float64)
+    return positions, laps.astype(np.result_type(*dtypes) if dtypes else lap.dtype)
+
+
+def _fix_one_vehicle(
+    rows: np.ndarray,
+    lap: np.ndarray,
+    times_i8: np.ndarray,
+    time_missing: np.ndarray,
+    starts: Optional[tuple] = None
+) -> tuple:
+    """
+    Recalculate lap numbers for one vehicle's telemetry rows.
+
+    Parameters
+    ----------
+    rows : np.ndarray
+        Positions of the vehicle's rows in the telemetry frame
+    lap : np.ndarray
+        Original lap numbers of the whole frame
+    times_i8 : np.ndarray
+        Row timestamps of the whole frame as int64 nanoseconds
+    time_missing : np.ndarray
+        Boolean mask of rows without a timestamp
+    starts : tuple, optional
+        (start_times_i8, laps) of the vehicle's lap starts, sorted by time.
+        If None, corrupted rows are dropped instead.
+
+    Returns
+    -------
+    tuple
+        (kept_rows, laps) for the vehicle
+    """
+    if starts is None:
+        # Keep original (filtered) laps
+        rows = rows[lap[rows] < 100]
+        return rows, lap[rows]
+
+    start_times, start_laps = starts
+    labels = np.concatenate([[0], start_laps])
+    veh_laps = labels[np.searchsorted(start_times, times_i8[rows], side='left')]
+    if time_missing[rows].any():
+        veh_laps = np.where(time_missing[rows], np.nan, veh_laps)
+    return rows, veh_laps
+
+
 def _pivot_to_wide(df: pd.DataFrame, verbose: bool = True) -> pd.DataFrame:
     """
     Pivot from long format to wide format.
@@ -348,17 +935,27 @@ def _pivot_to_wide(df: pd.DataFrame, verbose: bool = True) -> pd.DataFrame:
     # Remove any duplicate index columns
     index_cols = list(dict.fromkeys(index_cols))
 
-    # Pivot
+    # Pivot: duplicate keys keep their first non-null value and rows with
+    # missing keys are dropped, as pivot_table's aggfunc='first' did.
+    # Signal names are handled as categorical codes rather than strings
     try:
-        wide_df = df.pivot_table(
-            index=index_cols,
-            columns='signal',
-            values='value',
-            aggfunc='first'  # Take first value if duplicates
-        ).reset_index()
+        signal = df['signal']
+        if not isinstance(signal.dtype, pd.CategoricalDtype):
+            signal = signal.astype('category')
+        wide_df = _scatter_to_wide(df, index_cols, signal)
+        if wide_df is None:
+            first = (
+                df['value']
+                .groupby([df[col] for col in index_cols] + [signal], observed=True)
+                .first()
+                .dropna()
+            )
+            wide_df = first.unstack('signal').sort_index().sort_index(axis=1)
+            wide_df = wide_df.loc[:, wide_df.notna().any()].reset_index()
 
         # Flatten column names
         wide_df.columns = [str(c) for c in wide_df.columns]
+        wide_df = _downcast_signals(wide_df, index_cols)
 
         if verbose:
             print(f"  Pivoted to wide format: {len(wide_df):,} rows, {len(wide_df.columns)} columns")
@@ -371,6 +968,70 @@ def _pivot_to_wide(df: pd.DataFrame, verbose: bool = True) -> pd.DataFrame:
         return df
 
 
+def _downcast_signals(wide_df: pd.DataFrame, index_cols: List[str]) -> pd.DataFrame:
+    """
+    Narrow float signal columns of a wide frame to float32.
+
+    Signals are logged at single precision, so this halves their memory.
+    GPS coordinates keep float64 (see _GPS_SIGNALS).
+    """
+    return wide_df.astype({
+        col: np.float32 for col in wide_df.columns
+        if col not in index_cols and col not in _GPS_SIGNALS
+        and pd.api.types.is_float_dtype(wide_df[col])
+    }, copy=False)
+
+
+def _scatter_to_wide(
+    df: pd.DataFrame,
+    index_cols: List[str],
+    signal: pd.Series
+) -> Optional[pd.DataFrame]:
+    """
+    Pivot float readings by scattering them into a preallocated matrix.
+
+    Each key column is factorized with sorted codes, so a combined code
+    per row orders rows by (vehicle_number, lap, time) and one pass writes
+    every reading to its (row, signal) cell, with no groupby or unstack.
+    Readings are written in reverse so the first value of a duplicate key
+    lands last.
+
+    Returns None for non-float values or keys too numerous to combine
+    into an int64 code; the caller then uses groupby.first().
+    """
+    values = df['value'].to_numpy()
+    if values.dtype.kind != 'f':
+        return None
+
+    signal_codes = signal.cat.codes.to_numpy()
+    valid = ~np.isnan(values) & (signal_codes >= 0)
+    key = np.zeros(len(df), dtype=np.int64)
+    n_keys = 1
+    for col in index_cols:
+        codes, uniques = pd.factorize(df[col], sort=True)
+        n_keys *= max(len(uniques), 1)
+        if n_keys >= 2**62:
+            return None
+        valid &= codes >= 0
+        key = key * max(len(uniques), 1) + codes
+
+    readings = np.flatnonzero(valid)[::-1]
+    row_codes, _ = pd.factorize(key[readings], sort=True)
+    n_rows = row_codes.max() + 1 if len(row_codes) else 0
+
+    wide = np.full((n_rows, len(signal.cat.categories)), np.nan, dtype=values.dtype)
+    wide[row_codes, signal_codes[readings]] = values[readings]
+    first_reading = np.empty(n_rows, dtype=np.int64)
+    first_reading[row_codes] = readings
+
+    has_values = ~np.isnan(wide).all(axis=0)
+    wide_df = pd.DataFrame({col: df[col].to_numpy()[first_reading] for col in index_cols})
+    return pd.concat(
+        [wide_df, pd.DataFrame(wide[:, has_values], columns=signal.cat.categories[has_values])],
+        axis=1
+    )
+
+
 def _normalize_signal_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Normalize signal names for consistency.
@@ -424,16 +1085,17 @@ def get_available_signals(race_dir: Union[str, Path]) -> List[str]:
     if not telem_files:
         return []
 
-    # Load small sample
-    df = pd.read_csv(telem_files[0], nrows=10000)
-    df.columns = df.columns.str.strip()
+    # Only the header is needed to tell the formats apart; the sample then
+    # reads just the one column that holds the signal names
+    columns = {c.strip(): c for c in pd.read_csv(telem_files[0], nrows=0).columns}
 
-    if 'telemetry_name' in df.columns:
-        return sorted(df['telemetry_name'].unique())
-    elif 'value' in df.columns:
+    if 'telemetry_name' in columns:
+        names = _read_column_sample(telem_files[0], columns['telemetry_name'], nrows=10000)
+        return sorted(names.unique())
+    elif 'value' in columns:
         # JSON format
         try:
-            sample = json.loads(df['value'].iloc[0])
+            sample = _json_loads(_read_column_sample(telem_files[0], columns['value'], nrows=1).iloc[0])
             return sorted([s['name'] for s in sample])
         except:
             pass
@@ -441,11 +1103,45 @@ def get_available_signals(race_dir: Union[str, Path]) -> List[str]:
     return []
 
 
+def _read_column_sample(file_path: Path, column: str, nrows: int) -> pd.Series:
+    """
+    Read the first rows of a single CSV column.
+
+    Uses pyarrow's streaming CSV reader when available, which only parses
+    the projected column and stops after the blocks covering ``nrows``.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return pd.read_csv(file_path, usecols=[column], nrows=nrows)[column]
+
+    try:
+        reader = pa_csv.open_csv(
+            file_path,
+            convert_options=pa_csv.ConvertOptions(include_columns=[column])
+        )
+        batches = []
+        n_read = 0
+        for batch in reader:
+            batches.append(batch)
+            n_read += batch.num_rows
+            if n_read >= nrows:
+                break
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+    except pa.ArrowInvalid:
+        # Rows pyarrow's parser rejects (e.g. ragged lines)
+        return pd.read_csv(file_path, usecols=[column], nrows=nrows)[column]
+
+    return table.slice(0, nrows).column(column).to_pandas()
+
+
 def load_lap_times(race_dir: Union[str, Path]) -> pd.DataFrame:
     """
     Load lap times from a race directory.
 
     Prefers AnalysisEndurance file (has actual lap times) over lap_time file.
+    Results are cached per file version; every call returns its own copy.
 
     Parameters
     ----------
@@ -459,54 +1155,68 @@ def load_lap_times(race_dir: Union[str, Path]) -> pd.DataFrame:
     """
     race_dir = Path(race_dir)
 
-    # Try AnalysisEndurance file first (has actual lap times)
+    # Try AnalysisEndurance file first (has actual lap times), falling back
+    # to the lap_time file
     endurance_files = list(race_dir.glob('*AnalysisEndurance*.CSV'))
     if endurance_files:
-        df = pd.read_csv(endurance_files[0], sep=';')
-        df.columns = df.columns.str.strip()
-
-        # Parse LAP_TIME (format: "1:40.123" or "100.123")
-        def parse_lap_time(t):
-            if pd.isna(t):
-                return np.nan
-            try:
-                t = str(t).strip()
-                if ':' in t:
-                    parts = t.split(':')
-                    return float(parts[0]) * 60 + float(parts[1])
-                return float(t)
-            except:
-                return np.nan
-
-        if 'LAP_TIME' in df.columns:
-            df['lap_time'] = df['LAP_TIME'].apply(parse_lap_time)
-
-        # Rename columns
-        df = df.rename(columns={
-            'NUMBER': 'vehicle_number',
-            'LAP_NUMBER': 'lap'
-        })
+        lap_file = endurance_files[0]
+    else:
+        lap_files = list(race_dir.glob('*lap_time*.csv'))
+        if not lap_files:
+            raise FileNotFoundError(f"No lap time file found in {race_dir}")
+        lap_file = lap_files[0]
+
+    # Reuse an earlier result for the same file version
+    resolved_path = lap_file.resolve()
+    cache_key = (str(resolved_path), resolved_path.stat().st_mtime)
+    cached = _LAP_TIMES_CACHE.get(cache_key)
+    if cached is not None:
+        _LAP_TIMES_CACHE.move_to_end(cache_key)
+        return cached.copy()
+
+    if endurance_files:
+        df = _read_endurance_lap_times(lap_file)
+    else:
+        df = _read_timestamp_lap_times(lap_file)
+
+    _LAP_TIMES_CACHE[cache_key] = df.copy()
+    _LAP_TIMES_CACHE.move_to_end(cache_key)
+    while len(_LAP_TIMES_CACHE) > _LAP_TIMES_CACHE_SIZE:
+        _LAP_TIMES_CACHE.popitem(last=False)
+
+    return df
+
+
+def _read_endurance_lap_times(lap_file: Path) -> pd.DataFrame:
+    """Read lap times from an AnalysisEndurance file."""
+    df = pd.read_csv(lap_file, sep=';')
+    df.columns = df.columns.str.strip()
+
+    if 'LAP_TIME' in df.columns:
+        df['lap_time'] = _parse_lap_times(df['LAP_TIME'])
 
-        # Keep relevant columns
-        keep_cols = ['vehicle_number', 'lap', 'lap_time']
-        keep_cols = [c for c in keep_cols if c in df.columns]
-        return df[keep_cols]
+    # Rename columns
+    df = df.rename(columns={
+        'NUMBER': 'vehicle_number',
+        'LAP_NUMBER': 'lap'
+    })
 
-    # Fallback to lap_time file and calculate from timestamps
-    lap_files = list(race_dir.glob('*lap_time*.csv'))
-    if not lap_files:
-        raise FileNotFoundError(f"No lap time file found in {race_dir}")
+    # Keep relevant columns
+    keep_cols = ['vehicle_number', 'lap', 'lap_time']
+    keep_cols = [c for c in keep_cols if c in df.columns]
+    return df[keep_cols]
 
-    df = pd.read_csv(lap_files[0])
+
+def _read_timestamp_lap_times(lap_file: Path) -> pd.DataFrame:
+    """Read a lap_time file, calculating lap times from its timestamps."""
+    df = pd.read_csv(lap_file)
     df.columns = df.columns.str.strip()
 
     # Calculate lap time from consecutive timestamps
     if 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        df['timestamp'] = _parse_times(df['timestamp'], errors='raise')
         df = df.sort_values(['vehicle_number', 'lap'])
-
-        # Calculate time diff
-        df['lap_time'] = df.groupby('vehicle_number')['timestamp'].diff().dt.total_seconds()
+        df['lap_time'] = _consecutive_seconds(df['vehicle_number'], df['timestamp'])
 
     # Normalize column names
     df = df.rename(columns={
@@ -519,3 +1229,67 @@ def load_lap_times(race_dir: Union[str, Path]) -> pd.DataFrame:
         df['lap_time'] = df['lap_time_ms'] / 1000
 
     return df
+
+
+def _consecutive_seconds(vehicle: pd.Series, timestamps: pd.Series) -> np.ndarray:
+    """
+    Seconds since each vehicle's previous row, for rows grouped by vehicle.
+
+    Equivalent to ``groupby(vehicle)[timestamps].diff().dt.total_seconds()``
+    in one pass over the int64 nanoseconds. The first row of each vehicle,
+    rows without a vehicle and rows next to a missing timestamp give NaN.
+    """
+    times_i8 = timestamps.dt.as_unit('ns').array.asi8
+    seconds = np.full(len(times_i8), np.nan)
+    seconds[1:] = (times_i8[1:] - times_i8[:-1]) / 1e9
+
+    vehicle_missing = vehicle.isna().to_numpy()
+    time_missing = timestamps.isna().to_numpy()
+    vehicle = vehicle.to_numpy()
+    invalid = vehicle_missing | time_missing
+    invalid[1:] |= (vehicle[1:] != vehicle[:-1]) | time_missing[:-1]
+    seconds[invalid] = np.nan
+    return seconds
+
+
+def _parse_lap_times(lap_times: pd.Series) -> pd.Series:
+    """
+    Parse lap times formatted as "1:40.123" or "100.123" into seconds.
+
+    Splits and casts the whole column in polars when it is installed,
+    otherwise parses value by value. Unparseable values become NaN.
+    """
+    if lap_times.empty or pd.api.types.is_numeric_dtype(lap_times):
+        return lap_times.astype(float)
+
+    try:
+        import polars as pl
+    except ImportError:
+        values = lap_times.to_numpy()
+        return pd.Series(
+            np.fromiter(map(_parse_lap_time, values), dtype=float, count=len(values)),
+            index=lap_times.index
+        )
+
+    parts = pl.Series(lap_times.astype(str).to_numpy(), dtype=pl.String).str.strip_chars().str.split(':')
+    minutes = parts.list.get(0, null_on_oob=True).str.strip_chars().cast(pl.Float64, strict=False)
+    seconds = parts.list.get(1, null_on_oob=True).str.strip_chars().cast(pl.Float64, strict=False)
+    parsed = pl.select(
+        pl.when(parts.list.len() > 1).then(minutes * 60 + seconds).otherwise(minutes)
+    ).to_series()
+
+    return pd.Series(parsed.fill_null(np.nan).to_numpy(), index=lap_times.index).where(lap_times.notna())
+
+
+def _parse_lap_time(t) -> float:
+    """Parse a single lap time; see _parse_lap_times."""
+    if pd.isna(t):
+        return np.nan
+    try:
+        t = str(t).strip()
+        if ':' in t:
+            parts = t.split(':')
+            return float(parts[0]) * 60 + float(parts[1])
+        return float(t)
+    except ValueError:
+        return np.nan
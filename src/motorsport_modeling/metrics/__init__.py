@@ -11,7 +11,8 @@ from .tier1 import (
     calculate_throttle_timing,
     calculate_steering_smoothness,
     calculate_all_tier1_metrics,
-    compare_drivers
+    compare_drivers,
+    compare_drivers_batch
 )
 
 __all__ = [
@@ -21,5 +22,6 @@ __all__ = [
     'calculate_throttle_timing',
     'calculate_steering_smoothness',
     'calculate_all_tier1_metrics',
-    'compare_drivers'
+    'compare_drivers',
+    'compare_drivers_batch'
 ]
@@ -0,0 +1,266 @@
+"""
+Numba kernels for Tier 1 metrics.
+
+Imported lazily by tier1; importing this module raises ImportError when
+Numba isn't installed so callers can fall back to NumPy/Python.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, nogil=True)
+def coasting_counts(throttle, brake, throttle_threshold, brake_threshold):
+    """
+    Classify every sample as on throttle and/or on brake in one pass.
+
+    Samples missing either value (NaN) are skipped. The thresholds are
+    passed in each trace's dtype so float32 traces compare in float32,
+    like NumPy does.
+
+    Parameters
+    ----------
+    throttle, brake : np.ndarray
+        Throttle position and brake pressure, contiguous float32 or float64
+    throttle_threshold, brake_threshold : float
+        Values above which throttle and brake count as on
+
+    Returns
+    -------
+    tuple of int
+        (n_points, n_throttle, n_brake, n_overlap)
+    """
+    n_points = 0
+    n_throttle = 0
+    n_brake = 0
+    n_overlap = 0
+
+    for i in range(throttle.shape[0]):
+        t = throttle[i]
+        b = brake[i]
+        if np.isnan(t) or np.isnan(b):
+            continue
+        n_points += 1
+        throttle_on = t > throttle_threshold
+        brake_on = b > brake_threshold
+        n_throttle += throttle_on
+        n_brake += brake_on
+        n_overlap += throttle_on and brake_on
+
+    return n_points, n_throttle, n_brake, n_overlap
+
+
+@numba.njit(cache=True, nogil=True)
+def brake_stats(brake, min_pressure, drop, rise):
+    """
+    All braking statistics in one pass over a brake trace.
+
+    Missing (NaN) samples are skipped, as if they had been dropped first.
+    Events and pulses follow the same state machine as
+    tier1._count_brake_pulses. The thresholds are passed in the trace's
+    dtype so float32 traces compare in float32, like NumPy does.
+
+    Parameters
+    ----------
+    brake : np.ndarray
+        Brake pressure, contiguous float32 or float64
+    min_pressure : float
+        Pressure above which the driver is braking
+    drop, rise : float
+        Fractions of the zone's level marking a release (0.5) and a
+        reapplication (1.3)
+
+    Returns
+    -------
+    tuple
+        (n_points, max_brake, braking_sum, n_braking, n_braking_events,
+        pulse_count); braking_sum is the float64 sum of the n_braking
+        samples above min_pressure
+    """
+    n_points = 0
+    max_brake = brake.dtype.type(0)
+    braking_sum = 0.0
+    n_braking = 0
+    n_events = 0
+    pulse_count = 0
+    was_braking = False
+    in_zone = False
+    min_in_zone = brake.dtype.type(0)
+
+    for i in range(brake.shape[0]):
+        b = brake[i]
+        if np.isnan(b):
+            continue
+
+        braking = b > min_pressure
+        if braking:
+            braking_sum += b
+            n_braking += 1
+
+        if n_points == 0:
+            # The first sample only sets the starting state
+            max_brake = b
+            was_braking = braking
+            n_points = 1
+            continue
+        n_points += 1
+        if b > max_brake:
+            max_brake = b
+
+        if braking:
+            if not was_braking:
+                n_events += 1
+            if not in_zone:
+                # Started braking
+                in_zone = True
+                min_in_zone = b
+            elif b < min_in_zone * drop:
+                min_in_zone = b
+            elif b > min_in_zone * rise:
+                pulse_count += 1
+                min_in_zone = b
+            else:
+                min_in_zone = max(min_in_zone, b)
+        else:
+            # Stopped braking
+            in_zone = False
+        was_braking = braking
+
+    return n_points, max_brake, braking_sum, n_braking, n_events, pulse_count
+
+
+@numba.njit(parallel=True, cache=True)
+def times_to_full_throttle(throttle, timestamps_ns, apexes, threshold, max_points):
+    """
+    Seconds from each apex to the first full-throttle point after it.
+
+    Apexes are scanned forward in parallel, each at most `max_points`
+    points (the apex included), so the rest of the trace is never read.
+    The threshold is passed in the trace's dtype so float32 traces
+    compare in float32, like NumPy does.
+
+    Parameters
+    ----------
+    throttle : np.ndarray
+        Throttle position sorted by time, contiguous float32 or float64
+    timestamps_ns : np.ndarray
+        Matching int64 nanosecond timestamps
+    apexes : np.ndarray
+        Apex positions (int64)
+    threshold : float
+        Throttle at or above which the driver is at full throttle
+    max_points : int
+        Points to look ahead from each apex
+
+    Returns
+    -------
+    np.ndarray
+        Seconds to full throttle per apex, NaN where it isn't reached
+        within the window
+    """
+    n = throttle.shape[0]
+    times = np.full(apexes.shape[0], np.nan)
+
+    for a in numba.prange(apexes.shape[0]):
+        apex = apexes[a]
+        for i in range(apex, min(apex + max_points, n)):
+            if throttle[i] >= threshold:
+                times[a] = (timestamps_ns[i] - timestamps_ns[apex]) / 1e9
+                break
+
+    return times
+
+
+@numba.njit(cache=True, nogil=True)
+def scan_lift_offs(throttle, on_throttle, lift_off):
+    """
+    Count throttle lift-offs and throttle applications in one pass.
+
+    Same rules as tier1_metrics.compute_throttle_timing: a lift-off is a
+    drop of more than `lift_off` between two consecutive samples that are
+    both above `on_throttle`, and an application is a step from below
+    `on_throttle` to at or above it. The thresholds are passed in the
+    trace's dtype so float32 traces compute in float32, like NumPy does.
+
+    Parameters
+    ----------
+    throttle : np.ndarray
+        Throttle position without NaNs, contiguous float32 or float64
+    on_throttle : float
+        Throttle above which the driver is accelerating (20%)
+    lift_off : float
+        Decrease that counts as a lift-off (5%)
+
+    Returns
+    -------
+    tuple of int
+        (lift_offs, n_applications)
+    """
+    lift_offs = 0
+    n_applications = 0
+
+    for i in range(1, throttle.shape[0]):
+        prev = throttle[i - 1]
+        cur = throttle[i]
+        if prev > on_throttle and cur > on_throttle and cur < prev - lift_off:
+            lift_offs += 1
+        if prev < on_throttle and not cur < on_throttle:
+            n_applications += 1
+
+    return lift_offs, n_applications
+
+
+@numba.njit(cache=True, nogil=True)
+def scan_brake_peaks(brake, braking_pressure, min_peak):
+    """
+    Peak brake pressure of each braking event in one pass.
+
+    Same rules as tier1_metrics.compute_braking_smoothness: an event runs
+    from the last sample at or below `braking_pressure` up to, but not
+    including, the last sample above it; a trace that starts braking or
+    ends mid-event drops that partial event. The thresholds are passed in
+    the trace's dtype so float32 traces compare in float32, like NumPy
+    does.
+
+    Parameters
+    ----------
+    brake : np.ndarray
+        Brake pressure without NaNs, contiguous float32 or float64
+    braking_pressure : float
+        Pressure above which the driver is braking (10 bar)
+    min_peak : float
+        Peaks at or below this aren't significant braking (15 bar)
+
+    Returns
+    -------
+    peaks : np.ndarray
+        Peak pressures above `min_peak`, in event order
+    has_events : bool
+        Whether the trace has both a braking start and a braking end
+    """
+    peaks = np.empty(brake.shape[0] // 2 + 1, dtype=brake.dtype)
+    n_peaks = 0
+    has_start = False
+    has_end = False
+    in_event = False
+    peak = brake.dtype.type(0)
+
+    for i in range(brake.shape[0] - 1):
+        braking = brake[i] > braking_pressure
+        braking_next = brake[i + 1] > braking_pressure
+        if braking and not braking_next:
+            # Event ends here; this last braking sample isn't included
+            has_end = True
+            if in_event:
+                in_event = False
+                if peak > min_peak:
+                    peaks[n_peaks] = peak
+                    n_peaks += 1
+        elif not braking and braking_next:
+            has_start = True
+            in_event = True
+            peak = brake[i]
+        elif in_event and brake[i] > peak:
+            peak = brake[i]
+
+    return peaks[:n_peaks], has_start and has_end
@@ -21,10 +21,20 @@ Usage:
 
 import pandas as pd
 import numpy as np
-from typing import Union, List, Optional, Dict, Any
+from typing import Union, List, Optional, Dict, Any, Tuple
 from pathlib import Path
+from scipy.ndimage import uniform_filter1d
 from scipy.signal import find_peaks
 
+# pandas' int64 value of NaT
+_NAT_NS = np.iinfo(np.int64).min
+
+# Summary scores compared between drivers; higher is better for all
+_CMP_KEYS = (
+    'consistency_score', 'efficiency_score', 'braking_score',
+    'throttle_score', 'throttle_timing_score', 'smoothness_score'
+)
+
 
 def calculate_consistency(
     lap_times: Union[pd.Series, List[float], np.ndarray],
@@ -58,7 +68,10 @@ def calculate_consistency(
         - mean: Mean lap time
         - n_laps: Number of laps analyzed
     """
-    lap_times = np.array(lap_times)
+    # No copy for float arrays; slicing below only takes views
+    lap_times = np.asarray(lap_times)
+    if lap_times.dtype.kind != 'f':
+        lap_times = lap_times.astype(np.float64)
 
     # Exclude specified laps
     if exclude_first_n > 0:
@@ -66,20 +79,31 @@ def calculate_consistency(
     if exclude_last_n > 0:
         lap_times = lap_times[:-exclude_last_n]
 
-    if len(lap_times) < 3:
-        raise ValueError(f"Need at least 3 laps for consistency, got {len(lap_times)}")
+    n_laps = len(lap_times)
+    if n_laps < 3:
+        raise ValueError(f"Need at least 3 laps for consistency, got {n_laps}")
 
-    # Filter extreme outliers (>3 sigma or >10s slower than median)
-    median_time = np.median(lap_times)
-    lap_times = lap_times[lap_times < median_time + 10]  # Max 10s slower than median
+    # Filter extreme outliers (>3 sigma or >10s slower than median); the
+    # middle lap times are found with one partition, as np.median does
+    half = n_laps // 2
+    if n_laps % 2:
+        median_time = np.partition(lap_times, half)[half]
+    else:
+        middle = np.partition(lap_times, [half - 1, half])
+        median_time = (middle[half - 1] + middle[half]) / 2
+    keep = lap_times < median_time + 10  # Max 10s slower than median
+    if not keep.all():
+        lap_times = lap_times[keep]
 
     if len(lap_times) < 3:
         raise ValueError("Too few laps after outlier filtering")
 
-    std = np.std(lap_times)
-    mean = np.mean(lap_times)
+    # Same arithmetic as np.mean/np.std, without their per-call overhead
+    mean = np.add.reduce(lap_times) / len(lap_times)
+    deviation = lap_times - mean
+    std = np.sqrt(np.add.reduce(deviation * deviation) / len(lap_times))
     cv = std / mean
-    range_val = np.max(lap_times) - np.min(lap_times)
+    range_val = lap_times.max() - lap_times.min()
 
     result = {
         'std': std,
@@ -139,34 +163,36 @@ def calculate_coasting_time(
         - overlap_pct: Percentage with both throttle and brake
         - n_points: Number of data points analyzed
     """
-    df = telemetry.copy()
+    return _coasting_core(
+        _column(telemetry, throttle_col, 'Throttle'),
+        _column(telemetry, brake_col, 'Brake'),
+        throttle_threshold, brake_threshold, verbose
+    )
 
-    # Ensure columns exist
-    if throttle_col not in df.columns:
-        raise ValueError(f"Throttle column '{throttle_col}' not found")
-    if brake_col not in df.columns:
-        raise ValueError(f"Brake column '{brake_col}' not found")
 
-    # Get valid rows
-    df = df.dropna(subset=[throttle_col, brake_col])
+def _coasting_core(
+    throttle: np.ndarray,
+    brake: np.ndarray,
+    throttle_threshold: float = 5.0,
+    brake_threshold: float = 2.0,
+    verbose: bool = False
+) -> Dict[str, float]:
+    """Coasting metrics from throttle and brake arrays; see calculate_coasting_time."""
+    n_points, n_throttle, n_brake, n_overlap = _coasting_counts(
+        throttle, brake, throttle_threshold, brake_threshold
+    )
 
-    if len(df) == 0:
+    if n_points == 0:
         raise ValueError("No valid telemetry data after removing NaN")
 
-    # Classify each point
-    throttle_on = df[throttle_col] > throttle_threshold
-    brake_on = df[brake_col] > brake_threshold
-
-    coasting = ~throttle_on & ~brake_on
-    overlap = throttle_on & brake_on
-
-    n_points = len(df)
+    # Coasting follows by inclusion-exclusion
+    n_coasting = n_points - n_throttle - n_brake + n_overlap
 
     result = {
-        'coasting_pct': 100 * coasting.sum() / n_points,
-        'throttle_pct': 100 * throttle_on.sum() / n_points,
-        'brake_pct': 100 * brake_on.sum() / n_points,
-        'overlap_pct': 100 * overlap.sum() / n_points,
+        'coasting_pct': 100 * n_coasting / n_points,
+        'throttle_pct': 100 * n_throttle / n_points,
+        'brake_pct': 100 * n_brake / n_points,
+        'overlap_pct': 100 * n_overlap / n_points,
         'n_points': n_points
     }
 
@@ -181,6 +207,57 @@ def calculate_coasting_time(
     return result
 
 
+def _coasting_counts(
+    throttle: np.ndarray,
+    brake: np.ndarray,
+    throttle_threshold: float,
+    brake_threshold: float
+) -> Tuple[int, int, int, int]:
+    """
+    Count valid samples and those on throttle, on brake and on both.
+
+    Uses a compiled Numba kernel that classifies every sample in one pass
+    when available, otherwise NumPy masks.
+
+    Returns
+    -------
+    tuple of int
+        (n_points, n_throttle, n_brake, n_overlap)
+    """
+    try:
+        from ._numba_kernels import coasting_counts
+    except ImportError:
+        pass
+    else:
+        throttle, brake = (
+            values if np.issubdtype(values.dtype, np.floating) else values.astype(np.float64)
+            for values in (throttle, brake)
+        )
+        # Thresholds in each trace's precision, as NumPy compares float32
+        # arrays with Python floats
+        return coasting_counts(
+            np.ascontiguousarray(throttle), np.ascontiguousarray(brake),
+            throttle.dtype.type(throttle_threshold), brake.dtype.type(brake_threshold)
+        )
+
+    # Get valid rows
+    valid = ~(pd.isna(throttle) | pd.isna(brake))
+    if not valid.all():
+        throttle = throttle[valid]
+        brake = brake[valid]
+
+    # Classify each point
+    throttle_on = throttle > throttle_threshold
+    brake_on = brake > brake_threshold
+
+    return (
+        len(throttle),
+        np.count_nonzero(throttle_on),
+        np.count_nonzero(brake_on),
+        np.count_nonzero(throttle_on & brake_on)
+    )
+
+
 def analyze_braking_performance(
     telemetry: pd.DataFrame,
     brake_col: str = 'pbrake_f',
@@ -214,74 +291,159 @@ def analyze_braking_performance(
         - pulse_count: Number of brake pulses (release and reapply)
         - pulse_per_event: Average pulses per braking event
     """
-    df = telemetry.copy()
+    return _braking_core(_column(telemetry, brake_col, 'Brake'), min_brake_pressure, verbose)
 
-    if brake_col not in df.columns:
-        raise ValueError(f"Brake column '{brake_col}' not found")
 
-    brake = df[brake_col].dropna().values
+def _braking_core(
+    brake: np.ndarray,
+    min_brake_pressure: float = 20.0,
+    verbose: bool = False
+) -> Dict[str, float]:
+    """Braking metrics from a brake array; see analyze_braking_performance."""
+    # Max, mean when braking, braking events (transitions from not-braking
+    # to braking) and pulses within them
+    n_points, max_brake, mean_brake, n_braking_events, pulse_count = _brake_stats(
+        brake, min_brake_pressure
+    )
 
-    if len(brake) == 0:
+    if n_points == 0:
         raise ValueError("No brake data found")
 
+    pulse_per_event = pulse_count / max(n_braking_events, 1)
+
+    result = {
+        'max_brake': max_brake,
+        'mean_brake': mean_brake,
+        'n_braking_events': n_braking_events,
+        'pulse_count': pulse_count,
+        'pulse_per_event': pulse_per_event
+    }
+
+    if verbose:
+        print(f"Braking Performance:")
+        print(f"  Max pressure: {max_brake:.1f} bar")
+        print(f"  Mean (when braking): {mean_brake:.1f} bar")
+        print(f"  Braking events: {n_braking_events}")
+        print(f"  Brake pulses: {pulse_count}")
+        print(f"  Pulses per event: {pulse_per_event:.2f}")
+
+    return result
+
+
+def _brake_stats(brake: np.ndarray, min_pressure: float) -> Tuple[int, Any, Any, int, int]:
+    """
+    Braking statistics of a brake pressure trace, skipping missing samples.
+
+    Uses a compiled Numba kernel that gets everything in one pass when
+    available. Otherwise the statistics come from NumPy and the pulses
+    from _count_brake_pulses. The kernel sums the braking samples in
+    float64, so mean_brake can differ from np.mean in the last bits
+    (float32 traces: in float32 precision).
+
+    Parameters
+    ----------
+    brake : np.ndarray
+        Brake pressure, possibly with NaNs
+    min_pressure : float
+        Pressure above which the driver is braking
+
+    Returns
+    -------
+    tuple
+        (n_points, max_brake, mean_brake, n_braking_events, pulse_count);
+        max_brake is NaN when there are no valid samples and mean_brake
+        is 0 when the driver never brakes
+    """
+    try:
+        from ._numba_kernels import brake_stats
+    except ImportError:
+        pass
+    else:
+        values = brake if np.issubdtype(brake.dtype, np.floating) else brake.astype(np.float64)
+        # Thresholds in the trace's precision, as NumPy compares float32
+        # arrays with Python floats
+        thresholds = (values.dtype.type(v) for v in (min_pressure, 0.5, 1.3))
+        n_points, max_brake, braking_sum, n_braking, n_events, pulse_count = brake_stats(
+            np.ascontiguousarray(values), *thresholds
+        )
+        if n_points == 0:
+            return 0, np.nan, 0, 0, 0
+        mean_brake = values.dtype.type(braking_sum / n_braking) if n_braking > 0 else 0
+        return n_points, brake.dtype.type(max_brake), mean_brake, n_events, pulse_count
+
+    missing = pd.isna(brake)
+    if missing.any():
+        brake = brake[~missing]
+
+    if len(brake) == 0:
+        return 0, np.nan, 0, 0, 0
+
     # Overall max brake
     max_brake = np.max(brake)
 
     # Mean when braking
-    braking_mask = brake > min_brake_pressure
-    if braking_mask.sum() > 0:
+    braking_mask = brake > min_pressure
+    if braking_mask.any():
         mean_brake = np.mean(brake[braking_mask])
     else:
         mean_brake = 0
 
-    # Count braking events (transitions from not-braking to braking)
-    braking = brake > min_brake_pressure
-    braking_diff = np.diff(braking.astype(int))
-    n_braking_events = np.sum(braking_diff == 1)  # 0 -> 1 transitions
+    n_braking_events, pulse_count = _count_brake_pulses(brake, min_pressure)
+    return len(brake), max_brake, mean_brake, n_braking_events, pulse_count
+
+
+def _count_brake_pulses(brake: np.ndarray, min_pressure: float) -> Tuple[int, int]:
+    """
+    Count braking events and brake pulses in a brake pressure trace.
+
+    A pulse is when brake drops significantly and comes back up within a
+    braking zone. Python fallback for the brake_stats Numba kernel.
+
+    Parameters
+    ----------
+    brake : np.ndarray
+        Brake pressure without NaNs
+    min_pressure : float
+        Pressure above which the driver is braking
+
+    Returns
+    -------
+    tuple of int
+        (n_braking_events, pulse_count)
+    """
+    if not np.issubdtype(brake.dtype, np.floating):
+        brake = brake.astype(np.float64)
+
+    # Thresholds in the trace's precision, as NumPy compares float32 arrays
+    # with Python floats
+    min_pressure, drop, rise = (brake.dtype.type(v) for v in (min_pressure, 0.5, 1.3))
+
+    braking = brake > min_pressure
+    n_braking_events = int(np.count_nonzero(braking[1:] & ~braking[:-1]))  # 0 -> 1 transitions
 
-    # Count pulses within braking events
-    # A pulse is when brake drops significantly and comes back up
     pulse_count = 0
     in_braking_zone = False
     min_in_zone = 0
 
     for i in range(1, len(brake)):
-        if brake[i] > min_brake_pressure and not in_braking_zone:
+        if brake[i] > min_pressure and not in_braking_zone:
             # Started braking
             in_braking_zone = True
             min_in_zone = brake[i]
-        elif brake[i] > min_brake_pressure and in_braking_zone:
+        elif brake[i] > min_pressure and in_braking_zone:
             # Still braking - check for pulse
-            if brake[i] < min_in_zone * 0.5:  # Dropped to <50% of previous
+            if brake[i] < min_in_zone * drop:  # Dropped to <50% of previous
                 min_in_zone = brake[i]
-            elif brake[i] > min_in_zone * 1.3:  # Rose >30% after drop
+            elif brake[i] > min_in_zone * rise:  # Rose >30% after drop
                 pulse_count += 1
                 min_in_zone = brake[i]
             else:
                 min_in_zone = max(min_in_zone, brake[i])
-        elif brake[i] <= min_brake_pressure:
+        elif brake[i] <= min_pressure:
             # Stopped braking
             in_braking_zone = False
 
-    pulse_per_event = pulse_count / max(n_braking_events, 1)
-
-    result = {
-        'max_brake': max_brake,
-        'mean_brake': mean_brake,
-        'n_braking_events': n_braking_events,
-        'pulse_count': pulse_count,
-        'pulse_per_event': pulse_per_event
-    }
-
-    if verbose:
-        print(f"Braking Performance:")
-        print(f"  Max pressure: {max_brake:.1f} bar")
-        print(f"  Mean (when braking): {mean_brake:.1f} bar")
-        print(f"  Braking events: {n_braking_events}")
-        print(f"  Brake pulses: {pulse_count}")
-        print(f"  Pulses per event: {pulse_per_event:.2f}")
-
-    return result
+    return n_braking_events, pulse_count
 
 
 def calculate_throttle_timing(
@@ -319,17 +481,35 @@ def calculate_throttle_timing(
         - n_corners: Number of corners analyzed
         - full_throttle_pct: Percentage of time at full throttle
     """
-    df = telemetry.copy()
+    throttle = _column(telemetry, throttle_col, 'Throttle')
+    speed = telemetry[speed_col].to_numpy() if speed_col in telemetry.columns else None
+
+    # Timestamps are only needed when there is speed data to find apexes in
+    timestamps_ns = _timestamps_ns(telemetry) if _has_data(speed) else None
 
-    if throttle_col not in df.columns:
-        raise ValueError(f"Throttle column '{throttle_col}' not found")
+    return _throttle_timing_core(throttle, speed, timestamps_ns, full_throttle_threshold, verbose)
 
+
+def _throttle_timing_core(
+    throttle: np.ndarray,
+    speed: Optional[np.ndarray],
+    timestamps_ns: Optional[np.ndarray],
+    full_throttle_threshold: float = 95.0,
+    verbose: bool = False,
+    time_order: Optional[np.ndarray] = None
+) -> Dict[str, float]:
+    """
+    Throttle timing from throttle, speed and timestamp arrays; see
+    calculate_throttle_timing. `speed` and `timestamps_ns` may be None
+    when there is no speed data; `time_order` is the time order of all
+    rows from _time_order when the caller has already sorted them.
+    """
     # Calculate full throttle percentage regardless of speed data
-    throttle = df[throttle_col].dropna().values
-    full_throttle_pct = 100 * np.sum(throttle >= full_throttle_threshold) / len(throttle)
+    throttle_valid = throttle[~pd.isna(throttle)]
+    full_throttle_pct = 100 * np.sum(throttle_valid >= full_throttle_threshold) / len(throttle_valid)
 
     # If we don't have speed data, return limited metrics
-    if speed_col not in df.columns or df[speed_col].isna().all():
+    if not _has_data(speed):
         result = {
             'mean_time_to_full': np.nan,
             'median_time_to_full': np.nan,
@@ -344,18 +524,24 @@ def calculate_throttle_timing(
 
         return result
 
-    # Get timestamps and ensure proper sorting
-    df = df.dropna(subset=[throttle_col, speed_col, 'timestamp']).copy()
-    df = df.sort_values('timestamp').reset_index(drop=True)
+    # Get rows with throttle, speed and timestamp, in time order
+    order = _time_order(~(pd.isna(throttle) | pd.isna(speed)), timestamps_ns, time_order)
 
-    if len(df) < 100:
-        raise ValueError(f"Insufficient data points: {len(df)}")
+    if len(order) < 100:
+        raise ValueError(f"Insufficient data points: {len(order)}")
+
+    throttle = throttle[order]
+    timestamps_ns = timestamps_ns[order]
 
     # Find speed minima (apexes) using peak finding on inverted speed
-    speed = df[speed_col].values
+    speed = speed[order]
 
-    # Smooth speed for cleaner peaks
-    speed_smooth = pd.Series(speed).rolling(5, center=True).mean().fillna(pd.Series(speed)).values
+    # Smooth speed for cleaner peaks: centred 5-point mean, keeping the raw
+    # speed for the two points at each end that have no full window. The
+    # filter sums in double, so float32 speed is read as is
+    speed_smooth = uniform_filter1d(speed, size=5, output=np.float64)
+    speed_smooth[:2] = speed[:2]
+    speed_smooth[-2:] = speed[-2:]
 
     # Find minima (peaks in inverted speed)
     min_speed = np.min(speed_smooth)
@@ -379,20 +565,10 @@ def calculate_throttle_timing(
     )
 
     # For each minimum, find time to full throttle
-    times_to_full = []
-    timestamps = pd.to_datetime(df['timestamp'])
-
-    for apex_idx in minima_indices:
-        # Look forward from apex
-        found_full_throttle = False
-        for i in range(apex_idx, min(apex_idx + 200, len(df))):
-            if df[throttle_col].iloc[i] >= full_throttle_threshold:
-                # Calculate time delta
-                time_delta = (timestamps.iloc[i] - timestamps.iloc[apex_idx]).total_seconds()
-                if time_delta > 0 and time_delta < 10:  # Sanity check
-                    times_to_full.append(time_delta)
-                found_full_throttle = True
-                break
+    time_deltas = _times_to_full_throttle(
+        throttle, timestamps_ns, minima_indices, full_throttle_threshold
+    )
+    times_to_full = time_deltas[(time_deltas > 0) & (time_deltas < 10)]  # Sanity check
 
     if len(times_to_full) == 0:
         result = {
@@ -420,6 +596,65 @@ def calculate_throttle_timing(
     return result
 
 
+def _times_to_full_throttle(
+    throttle: np.ndarray,
+    timestamps_ns: np.ndarray,
+    apexes: np.ndarray,
+    threshold: float,
+    max_points: int = 200
+) -> np.ndarray:
+    """
+    Seconds from each apex to the first full-throttle point after it.
+
+    Uses a Numba kernel that scans forward from the apexes in parallel
+    when available. Otherwise all apexes are matched with one binary
+    search over the full-throttle points.
+
+    Parameters
+    ----------
+    throttle : np.ndarray
+        Throttle position, sorted by time
+    timestamps_ns : np.ndarray
+        Timestamps as int64 nanoseconds
+    apexes : np.ndarray
+        Row positions of the apexes
+    threshold : float
+        Throttle at or above this is "full throttle"
+    max_points : int, default=200
+        Only look this many points ahead (the apex included)
+
+    Returns
+    -------
+    np.ndarray
+        Time to full throttle for the apexes that reach it in the window
+    """
+    try:
+        from ._numba_kernels import times_to_full_throttle
+    except ImportError:
+        pass
+    else:
+        if not np.issubdtype(throttle.dtype, np.floating):
+            throttle = throttle.astype(np.float64)
+        # Threshold in the trace's precision, as NumPy compares float32
+        # arrays with Python floats
+        times = times_to_full_throttle(
+            np.ascontiguousarray(throttle), np.ascontiguousarray(timestamps_ns),
+            np.ascontiguousarray(apexes, dtype=np.int64), throttle.dtype.type(threshold),
+            int(max_points)
+        )
+        return times[~np.isnan(times)]
+
+    full_indices = np.flatnonzero(throttle >= threshold)
+
+    pos = np.searchsorted(full_indices, apexes, side='left')
+    found = pos < len(full_indices)
+    apexes = apexes[found]
+    first_full = full_indices[pos[found]]
+    within = first_full < apexes + max_points
+
+    return (timestamps_ns[first_full[within]] - timestamps_ns[apexes[within]]) / 1e9
+
+
 def calculate_steering_smoothness(
     telemetry: pd.DataFrame,
     steering_col: str = 'steer_angle',
@@ -449,31 +684,38 @@ def calculate_steering_smoothness(
         - std_jerk: Standard deviation of jerk
         - smoothness_score: 100 - normalized jerk (higher is smoother)
     """
-    df = telemetry.copy()
+    steering = _column(telemetry, steering_col, 'Steering')
+    return _steering_core(steering, _timestamps_ns(telemetry), verbose)
 
-    if steering_col not in df.columns:
-        raise ValueError(f"Steering column '{steering_col}' not found")
 
+def _steering_core(
+    steering: np.ndarray,
+    timestamps_ns: np.ndarray,
+    verbose: bool = False,
+    time_order: Optional[np.ndarray] = None
+) -> Dict[str, float]:
+    """
+    Steering smoothness from steering and timestamp arrays; see
+    calculate_steering_smoothness. `time_order` is the time order of all
+    rows from _time_order when the caller has already sorted them.
+    """
     # Sort by timestamp and get steering angle
-    df = df.dropna(subset=[steering_col, 'timestamp']).copy()
-    df = df.sort_values('timestamp').reset_index(drop=True)
+    order = _time_order(~pd.isna(steering), timestamps_ns, time_order)
 
-    if len(df) < 10:
-        raise ValueError(f"Insufficient data points: {len(df)}")
+    if len(order) < 10:
+        raise ValueError(f"Insufficient data points: {len(order)}")
 
-    steering = df[steering_col].values
-    timestamps = pd.to_datetime(df['timestamp'])
+    steering = steering[order]
+    timestamps_ns = timestamps_ns[order]
 
     # Calculate time deltas in seconds
-    time_deltas = timestamps.diff().dt.total_seconds().values[1:]
+    time_deltas = np.diff(timestamps_ns) / 1e9
 
-    # Calculate steering rate of change (velocity)
+    # Calculate steering rate of change (velocity), in the steering dtype;
+    # zero where time doesn't advance to avoid division by zero
     steering_diff = np.diff(steering)
-
-    # Avoid division by zero
-    valid_mask = time_deltas > 0
     steering_rate = np.zeros_like(steering_diff)
-    steering_rate[valid_mask] = steering_diff[valid_mask] / time_deltas[valid_mask]
+    np.divide(steering_diff, time_deltas, out=steering_rate, where=time_deltas > 0, casting='unsafe')
 
     # Calculate jerk (rate of change of rate)
     jerk = np.abs(np.diff(steering_rate))
@@ -506,6 +748,64 @@ def calculate_steering_smoothness(
     return result
 
 
+def _column(telemetry: pd.DataFrame, column: str, name: str) -> np.ndarray:
+    """
+    Get a required telemetry column as an array, in the column's own dtype.
+
+    Float32 columns stay float32 rather than being widened to float64, and
+    numeric columns are returned without copying.
+    """
+    if column not in telemetry.columns:
+        raise ValueError(f"{name} column '{column}' not found")
+    return telemetry[column].to_numpy()
+
+
+def _has_data(values: Optional[np.ndarray]) -> bool:
+    """Whether an optional column exists and has any non-missing value."""
+    return values is not None and not pd.isna(values).all()
+
+
+def _timestamps_ns(telemetry: pd.DataFrame) -> np.ndarray:
+    """
+    The timestamp column as int64 nanoseconds (UTC for tz-aware columns),
+    with _NAT_NS where missing.
+
+    Datetime columns already in nanoseconds are returned as a view of the
+    column, without parsing or copying.
+    """
+    timestamps = telemetry['timestamp']
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps)
+    values = timestamps.array
+    if values.unit != 'ns':
+        values = values.as_unit('ns')
+    return values.asi8
+
+
+def _time_order(
+    valid: np.ndarray,
+    timestamps_ns: np.ndarray,
+    time_order: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Positions of the valid rows with a timestamp, in time order.
+
+    The sort is stable, so rows with equal timestamps keep their order,
+    and timestamps that are already in order aren't sorted at all. With
+    `time_order`, the time order of all rows from an earlier call, the
+    valid rows are picked out of it instead of sorting again; a stable
+    sort of a subset is the same subsequence.
+    """
+    if time_order is not None:
+        return time_order[valid[time_order]]
+
+    rows = np.flatnonzero(valid & (timestamps_ns != _NAT_NS))
+    times = timestamps_ns[rows]
+    if np.all(times[1:] >= times[:-1]):
+        return rows
+    return rows[np.argsort(times, kind='stable')]
+
+
 def calculate_all_tier1_metrics(
     telemetry: pd.DataFrame,
     lap_times: Optional[Union[pd.Series, List[float]]] = None,
@@ -554,10 +854,30 @@ def calculate_all_tier1_metrics(
     else:
         results['consistency'] = None
 
+    # Pull each column out of the frame once and share it between the
+    # metrics; each metric still drops its own missing rows
+    arrays = {}
+
+    def column(col, name):
+        if col not in arrays:
+            arrays[col] = _column(telemetry, col, name)
+        return arrays[col]
+
+    def timestamps_ns():
+        if 'timestamp' not in arrays:
+            arrays['timestamp'] = _timestamps_ns(telemetry)
+        return arrays['timestamp']
+
+    # Rows are sorted by time once for throttle timing and steering
+    def time_order():
+        if 'time_order' not in arrays:
+            arrays['time_order'] = _time_order(np.ones(len(telemetry), dtype=bool), timestamps_ns())
+        return arrays['time_order']
+
     # 2. Coasting time
     try:
-        results['coasting'] = calculate_coasting_time(
-            telemetry, verbose=verbose
+        results['coasting'] = _coasting_core(
+            column('ath', 'Throttle'), column('pbrake_f', 'Brake'), verbose=verbose
         )
     except (ValueError, KeyError) as e:
         if verbose:
@@ -566,9 +886,7 @@ def calculate_all_tier1_metrics(
 
     # 3. Braking performance
     try:
-        results['braking'] = analyze_braking_performance(
-            telemetry, verbose=verbose
-        )
+        results['braking'] = _braking_core(column('pbrake_f', 'Brake'), verbose=verbose)
     except (ValueError, KeyError) as e:
         if verbose:
             print(f"Braking: SKIPPED - {e}")
@@ -576,9 +894,14 @@ def calculate_all_tier1_metrics(
 
     # 4. Throttle timing
     try:
-        results['throttle'] = calculate_throttle_timing(
-            telemetry, verbose=verbose
-        )
+        throttle = column('ath', 'Throttle')
+        speed = column('speed', 'Speed') if 'speed' in telemetry.columns else None
+        if _has_data(speed):
+            results['throttle'] = _throttle_timing_core(
+                throttle, speed, timestamps_ns(), verbose=verbose, time_order=time_order()
+            )
+        else:
+            results['throttle'] = _throttle_timing_core(throttle, speed, None, verbose=verbose)
     except (ValueError, KeyError) as e:
         if verbose:
             print(f"Throttle: SKIPPED - {e}")
@@ -586,8 +909,9 @@ def calculate_all_tier1_metrics(
 
     # 5. Steering smoothness
     try:
-        results['steering'] = calculate_steering_smoothness(
-            telemetry, verbose=verbose
+        results['steering'] = _steering_core(
+            column('steer_angle', 'Steering'), timestamps_ns(), verbose=verbose,
+            time_order=time_order()
         )
     except (ValueError, KeyError) as e:
         if verbose:
@@ -677,8 +1001,7 @@ def compare_drivers(
 
     # For each summary metric, determine who's better
     # Higher is better for all summary scores
-    for metric in ['consistency_score', 'efficiency_score', 'braking_score',
-                   'throttle_score', 'throttle_timing_score', 'smoothness_score']:
+    for metric in _CMP_KEYS:
         val_a = summary_a.get(metric)
         val_b = summary_b.get(metric)
 
@@ -724,3 +1047,44 @@ def compare_drivers(
         print(f"Winner: Driver {comparison['overall']['overall_winner']}")
 
     return comparison
+
+
+def compare_drivers_batch(metrics_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compare Tier 1 summary scores between every pair of drivers at once.
+
+    Builds one matrix of summary scores and takes all pairwise deltas by
+    broadcasting, instead of calling compare_drivers for each pair.
+
+    Parameters
+    ----------
+    metrics_list : list of dict
+        Tier 1 metrics (from calculate_all_tier1_metrics) for each driver
+
+    Returns
+    -------
+    dict
+        - metrics: Names of the compared summary scores
+        - scores: (n_drivers, n_metrics) scores, NaN where missing
+        - delta: (n_drivers, n_drivers, n_metrics) score of the row
+          driver minus score of the column driver, NaN where either
+          is missing
+        - wins: (n_drivers, n_drivers) number of metrics in which the
+          row driver beats the column driver; wins[i, j] equals the
+          a_wins of compare_drivers(metrics_list[i], metrics_list[j])
+    """
+    scores = np.array([
+        [np.nan if value is None else value
+         for value in map(metrics.get('summary', {}).get, _CMP_KEYS)]
+        for metrics in metrics_list
+    ], dtype=np.float64).reshape(len(metrics_list), len(_CMP_KEYS))
+
+    delta = scores[:, None, :] - scores[None, :, :]
+    wins = np.count_nonzero(delta > 0, axis=2)
+
+    return {
+        'metrics': _CMP_KEYS,
+        'scores': scores,
+        'delta': delta,
+        'wins': wins
+    }
@@ -14,6 +14,9 @@ Usage:
     metrics = compute_all_metrics(telemetry_df, lap_times_df)
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
 from typing import Dict, Optional, Tuple
@@ -46,8 +49,13 @@ def compute_consistency(
         - mean: mean lap time
         - n_laps: number of laps analyzed
     """
-    driver_laps = lap_times[lap_times['vehicle_number'] == vehicle_number].copy()
+    driver_laps = lap_times[lap_times['vehicle_number'] == vehicle_number]
+
+    return _consistency(driver_laps, exclude_first_n)
 
+
+def _consistency(driver_laps: pd.DataFrame, exclude_first_n: int = 2) -> Dict:
+    """compute_consistency on one driver's lap times."""
     # Exclude warmup laps
     driver_laps = driver_laps[driver_laps['lap'] > exclude_first_n]
 
@@ -108,11 +116,17 @@ def compute_coasting_pct(
         - coasting_pct: percentage of time coasting
         - total_samples: number of samples analyzed
     """
-    df = telemetry[telemetry['vehicle_number'] == vehicle_number].copy()
+    return _coasting_pct(
+        _driver_rows(telemetry, vehicle_number, lap), throttle_threshold, brake_threshold
+    )
 
-    if lap is not None:
-        df = df[df['lap'] == lap]
 
+def _coasting_pct(
+    df: pd.DataFrame,
+    throttle_threshold: float = 5.0,
+    brake_threshold: float = 5.0
+) -> Dict:
+    """compute_coasting_pct on one driver's telemetry."""
     if len(df) == 0:
         return {'coasting_pct': np.nan, 'total_samples': 0}
 
@@ -126,22 +140,23 @@ def compute_coasting_pct(
     if throttle_col is None or 'pbrake_f' not in df.columns:
         return {'coasting_pct': np.nan, 'total_samples': 0}
 
-    # Calculate coasting
-    throttle_off = df[throttle_col] < throttle_threshold
-    brake_off = df['pbrake_f'] < brake_threshold
-    coasting = throttle_off & brake_off
+    throttle = df[throttle_col].to_numpy()
+    brake = df['pbrake_f'].to_numpy()
 
     # Only count valid samples (both signals present)
-    valid = df[throttle_col].notna() & df['pbrake_f'].notna()
+    n_valid = len(throttle) - np.count_nonzero(pd.isna(throttle) | pd.isna(brake))
 
-    if valid.sum() == 0:
+    if n_valid == 0:
         return {'coasting_pct': np.nan, 'total_samples': 0}
 
-    coasting_pct = 100 * coasting.sum() / valid.sum()
+    # Calculate coasting; missing samples compare False, so never coast
+    n_coasting = np.count_nonzero((throttle < throttle_threshold) & (brake < brake_threshold))
+
+    coasting_pct = 100 * n_coasting / n_valid
 
     return {
         'coasting_pct': float(coasting_pct),
-        'total_samples': int(valid.sum())
+        'total_samples': int(n_valid)
     }
 
 
@@ -178,11 +193,11 @@ def compute_braking_smoothness(
         - braking_events: number of distinct braking zones
         - oscillations_per_event: (deprecated) kept for compatibility
     """
-    df = telemetry[telemetry['vehicle_number'] == vehicle_number].copy()
+    return _braking_smoothness(_driver_rows(telemetry, vehicle_number, lap))
 
-    if lap is not None:
-        df = df[df['lap'] == lap]
 
+def _braking_smoothness(df: pd.DataFrame) -> Dict:
+    """compute_braking_smoothness on one driver's telemetry."""
     if 'pbrake_f' not in df.columns or len(df) == 0:
         return {
             'peak_brake_cv': np.nan,
@@ -208,12 +223,9 @@ def compute_braking_smoothness(
         }
 
     # Find braking events and their peak pressures
-    braking = brake > 10  # Significant braking threshold
-    braking_starts = np.where(np.diff(braking.astype(int)) == 1)[0]
-    braking_ends = np.where(np.diff(braking.astype(int)) == -1)[0]
+    peak_pressures, has_events = _scan_brake_peaks(brake)
 
-    # Align starts and ends
-    if len(braking_starts) == 0 or len(braking_ends) == 0:
+    if not has_events:
         return {
             'peak_brake_cv': np.nan,
             'mean_peak_brake': np.nan,
@@ -221,20 +233,6 @@ def compute_braking_smoothness(
             'oscillations_per_event': 0
         }
 
-    # Ensure we have complete events
-    if braking_ends[0] < braking_starts[0]:
-        braking_ends = braking_ends[1:]
-    if len(braking_starts) > len(braking_ends):
-        braking_starts = braking_starts[:len(braking_ends)]
-
-    # Get peak pressure for each braking event
-    peak_pressures = []
-    for start, end in zip(braking_starts, braking_ends):
-        if end > start:
-            peak = brake[start:end].max()
-            if peak > 15:  # Must be significant braking
-                peak_pressures.append(peak)
-
     if len(peak_pressures) < 3:
         return {
             'peak_brake_cv': np.nan,
@@ -243,7 +241,6 @@ def compute_braking_smoothness(
             'oscillations_per_event': 0
         }
 
-    peak_pressures = np.array(peak_pressures)
     mean_peak = peak_pressures.mean()
     cv = peak_pressures.std() / mean_peak * 100 if mean_peak > 0 else np.nan
 
@@ -292,11 +289,13 @@ def compute_throttle_timing(
         - mean_apex_to_throttle_ms: lift_off_count (for backward compatibility)
         - corners_detected: number of throttle application events
     """
-    df = telemetry[telemetry['vehicle_number'] == vehicle_number].copy()
+    return _throttle_timing(
+        _driver_rows(telemetry, vehicle_number, lap), full_throttle_threshold
+    )
 
-    if lap is not None:
-        df = df[df['lap'] == lap]
 
+def _throttle_timing(df: pd.DataFrame, full_throttle_threshold: float = 90.0) -> Dict:
+    """compute_throttle_timing on one driver's telemetry."""
     # Get throttle column
     throttle_col = None
     for col in ['throttle', 'ath', 'aps']:
@@ -349,22 +348,10 @@ def compute_throttle_timing(
     # =========================================================================
     # Metric 1: Lift-off count during acceleration phases
     # =========================================================================
-    # Find acceleration phases (throttle > 20% and generally increasing)
-    in_acceleration = throttle > 20
-    throttle_change = np.diff(throttle)
-
-    # Count significant lift-offs (>5% decrease) during acceleration
-    lift_offs = 0
-    for i in range(1, len(throttle)):
-        if in_acceleration[i] and in_acceleration[i-1]:
-            # We're in an acceleration phase
-            if throttle[i] < throttle[i-1] - 5:  # Significant decrease
-                lift_offs += 1
-
-    # Normalize by number of throttle applications
-    low_throttle = throttle < 20
-    applications = np.diff(low_throttle.astype(int)) == -1
-    n_applications = max(1, int(applications.sum()))
+    # Count significant lift-offs (>5% decrease) during acceleration and
+    # throttle applications (rising out of < 20%) to normalize by
+    lift_offs, n_applications = _scan_lift_offs(throttle)
+    n_applications = max(1, n_applications)
 
     lift_off_per_application = lift_offs / n_applications
 
@@ -402,6 +389,114 @@ def compute_throttle_timing(
     }
 
 
+def _scan_lift_offs(throttle: np.ndarray) -> Tuple[int, int]:
+    """
+    Count throttle lift-offs and throttle applications.
+
+    A lift-off is a >5% drop between consecutive samples that are both
+    above 20% throttle (an acceleration phase); an application is a step
+    from below 20% to at or above it. Uses a compiled Numba kernel for a
+    single pass when available, otherwise NumPy masks.
+
+    Parameters
+    ----------
+    throttle : np.ndarray
+        Throttle position without NaNs, sorted by time
+
+    Returns
+    -------
+    tuple of int
+        (lift_offs, n_applications)
+    """
+    if not np.issubdtype(throttle.dtype, np.floating):
+        throttle = throttle.astype(np.float64)
+
+    try:
+        from ._numba_kernels import scan_lift_offs
+    except ImportError:
+        pass
+    else:
+        # Thresholds in the trace's precision, as NumPy computes float32
+        # arrays with Python numbers
+        return scan_lift_offs(
+            np.ascontiguousarray(throttle), throttle.dtype.type(20), throttle.dtype.type(5)
+        )
+
+    # Find acceleration phases (throttle > 20% and generally increasing)
+    in_acceleration = throttle > 20
+
+    # Count significant lift-offs (>5% decrease) between consecutive
+    # samples that are both in an acceleration phase
+    lift_offs = int(np.count_nonzero(
+        in_acceleration[1:] & in_acceleration[:-1] & (throttle[1:] < throttle[:-1] - 5)
+    ))
+
+    low_throttle = throttle < 20
+    n_applications = int(np.count_nonzero(low_throttle[:-1] & ~low_throttle[1:]))
+
+    return lift_offs, n_applications
+
+
+def _scan_brake_peaks(brake: np.ndarray) -> Tuple[np.ndarray, bool]:
+    """
+    Peak pressure of each significant braking event.
+
+    An event runs from the last sample at or below 10 bar up to the last
+    sample above it (exclusive); partial events at either end of the
+    trace are dropped and only peaks above 15 bar are kept. Uses a
+    compiled Numba kernel for a single pass when available, otherwise
+    NumPy transitions and a loop over the events.
+
+    Parameters
+    ----------
+    brake : np.ndarray
+        Brake pressure without NaNs, sorted by time
+
+    Returns
+    -------
+    peaks : np.ndarray
+        Peak pressures of the significant events, in order
+    has_events : bool
+        Whether the trace has both a braking start and a braking end
+    """
+    try:
+        from ._numba_kernels import scan_brake_peaks
+    except ImportError:
+        pass
+    else:
+        values = brake if np.issubdtype(brake.dtype, np.floating) else brake.astype(np.float64)
+        # Thresholds in the trace's precision, as NumPy compares float32
+        # arrays with Python numbers
+        peaks, has_events = scan_brake_peaks(
+            np.ascontiguousarray(values), values.dtype.type(10), values.dtype.type(15)
+        )
+        return peaks.astype(brake.dtype, copy=False), has_events
+
+    braking = brake > 10  # Significant braking threshold
+    braking_starts = np.where(np.diff(braking.astype(int)) == 1)[0]
+    braking_ends = np.where(np.diff(braking.astype(int)) == -1)[0]
+
+    # Align starts and ends
+    if len(braking_starts) == 0 or len(braking_ends) == 0:
+        return np.empty(0, dtype=brake.dtype), False
+
+    # Ensure we have complete events
+    if braking_ends[0] < braking_starts[0]:
+        braking_ends = braking_ends[1:]
+    if len(braking_starts) > len(braking_ends):
+        braking_starts = braking_starts[:len(braking_ends)]
+
+    # Get peak pressure for each braking event
+    peak_pressures = []
+    for start, end in zip(braking_starts, braking_ends):
+        if end > start:
+            peak = brake[start:end].max()
+            if peak > 15:  # Must be significant braking
+                peak_pressures.append(peak)
+
+    return np.array(peak_pressures, dtype=brake.dtype), True
+
+
 def compute_g_force_utilization(
     telemetry: pd.DataFrame,
     vehicle_number: int,
@@ -429,11 +524,11 @@ def compute_g_force_utilization(
         - mean_lateral_g: mean |ay|
         - mean_longitudinal_g: mean |ax|
     """
-    df = telemetry[telemetry['vehicle_number'] == vehicle_number].copy()
+    return _g_force_utilization(_driver_rows(telemetry, vehicle_number, lap))
 
-    if lap is not None:
-        df = df[df['lap'] == lap]
 
+def _g_force_utilization(df: pd.DataFrame) -> Dict:
+    """compute_g_force_utilization on one driver's telemetry."""
     if 'accx_can' not in df.columns or 'accy_can' not in df.columns:
         return {
             'mean_combined_g': np.nan,
@@ -493,31 +588,48 @@ def compute_all_metrics(
     dict
         All Tier 1 metrics
     """
+    consistency = compute_consistency(lap_times, vehicle_number)
+    driver_telemetry = _driver_rows(telemetry, vehicle_number, lap)
+
+    return _all_metrics(driver_telemetry, consistency, vehicle_number, lap)
+
+
+def _all_metrics(
+    driver_telemetry: pd.DataFrame,
+    consistency: Dict,
+    vehicle_number: int,
+    lap: Optional[int] = None
+) -> Dict:
+    """
+    compute_all_metrics on one driver's (or one lap's) telemetry.
+
+    The driver's lap time consistency is passed in as it covers all laps
+    whatever `lap` is.
+    """
     metrics = {
         'vehicle_number': vehicle_number,
         'lap': lap
     }
 
     # 1. Consistency (uses all laps)
-    consistency = compute_consistency(lap_times, vehicle_number)
     metrics['consistency_std'] = consistency['std']
     metrics['consistency_cv'] = consistency['cv']
 
     # 2. Coasting %
-    coasting = compute_coasting_pct(telemetry, vehicle_number, lap)
+    coasting = _coasting_pct(driver_telemetry)
     metrics['coasting_pct'] = coasting['coasting_pct']
 
     # 3. Braking smoothness
-    braking = compute_braking_smoothness(telemetry, vehicle_number, lap)
-    metrics['brake_oscillations'] = braking['oscillation_count']
+    braking = _braking_smoothness(driver_telemetry)
+    metrics['brake_oscillations'] = braking['braking_events']
     metrics['brake_oscillations_per_event'] = braking['oscillations_per_event']
 
     # 4. Throttle timing
-    throttle = compute_throttle_timing(telemetry, vehicle_number, lap)
+    throttle = _throttle_timing(driver_telemetry)
     metrics['apex_to_throttle_ms'] = throttle['mean_apex_to_throttle_ms']
 
     # 5. G-force utilization
-    g_force = compute_g_force_utilization(telemetry, vehicle_number, lap)
+    g_force = _g_force_utilization(driver_telemetry)
     metrics['mean_combined_g'] = g_force['mean_combined_g']
     metrics['max_combined_g'] = g_force['max_combined_g']
 
@@ -532,6 +644,12 @@ def compute_metrics_for_race(
     """
     Compute all metrics for all drivers in a race.
 
+    Telemetry and lap times are split by car (and by lap) in one groupby
+    pass each rather than filtered again for every car and metric. Cars
+    are independent, so they are computed on a thread pool; the NumPy and
+    Numba kernels release the GIL and the groups are shared, not copied to
+    workers.
+
     Parameters
     ----------
     telemetry : pd.DataFrame
@@ -546,18 +664,50 @@ def compute_metrics_for_race(
     pd.DataFrame
         Metrics for all drivers (and laps if per_lap=True)
     """
-    results = []
-
     vehicles = telemetry['vehicle_number'].unique()
-
-    for veh in vehicles:
-        if per_lap:
-            laps = telemetry[telemetry['vehicle_number'] == veh]['lap'].unique()
-            for lap in laps:
-                metrics = compute_all_metrics(telemetry, lap_times, veh, lap)
-                results.append(metrics)
-        else:
-            metrics = compute_all_metrics(telemetry, lap_times, veh, None)
-            results.append(metrics)
+    telemetry_by_car = _split_by(telemetry, 'vehicle_number')
+    laps_by_car = _split_by(lap_times, 'vehicle_number')
+
+    def car_metrics(veh):
+        driver_telemetry = telemetry_by_car.get(veh, telemetry.iloc[:0])
+        consistency = _consistency(laps_by_car.get(veh, lap_times.iloc[:0]))
+        if not per_lap:
+            return [_all_metrics(driver_telemetry, consistency, veh, None)]
+
+        laps = driver_telemetry['lap'].unique()
+        telemetry_by_lap = _split_by(driver_telemetry, 'lap')
+        return [
+            _all_metrics(
+                telemetry_by_lap.get(lap, driver_telemetry.iloc[:0]), consistency, veh, lap
+            )
+            for lap in laps
+        ]
+
+    with ThreadPoolExecutor(max_workers=min(len(vehicles), os.cpu_count() or 1) or 1) as pool:
+        results = [metrics for car in pool.map(car_metrics, vehicles) for metrics in car]
 
     return pd.DataFrame(results)
+
+
+def _driver_rows(
+    telemetry: pd.DataFrame,
+    vehicle_number: int,
+    lap: Optional[int] = None
+) -> pd.DataFrame:
+    """Rows of one car's telemetry, optionally for a single lap."""
+    df = telemetry[telemetry['vehicle_number'] == vehicle_number]
+
+    if lap is not None:
+        df = df[df['lap'] == lap]
+
+    return df
+
+
+def _split_by(df: pd.DataFrame, column: str) -> Dict:
+    """
+    Split a frame into {value: rows} in one groupby pass.
+
+    Rows keep their order and index, as with a boolean filter. Missing
+    keys (NaN) are left out, as comparing with NaN matches no rows.
+    """
+    return dict(list(df.groupby(column, sort=False)))
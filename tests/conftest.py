@@ -2,7 +2,9 @@
 Pytest configuration and fixtures for motorsport_modeling tests.
 """
 
+import sys
 import pytest
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -27,6 +29,28 @@ def sample_telemetry(sample_data_path):
     return None
 
 
+@pytest.fixture
+def brake_trace():
+    """Factory for brake pressure traces with a noisy braking zone every 150 samples."""
+    def make(n_points=2000, seed=0):
+        rng = np.random.default_rng(seed)
+        t = np.arange(n_points)
+        zones = np.maximum(np.sin(2 * np.pi * t / 150), 0) ** 2
+        peaks = rng.uniform(30, 90, n_points // 150 + 1)[t // 150]
+        return np.abs(zones * peaks + rng.normal(0, 4, n_points))
+
+    return make
+
+
+@pytest.fixture
+def no_numba(monkeypatch):
+    """Function that hides the Numba kernels, so later calls run the NumPy fallbacks."""
+    def disable():
+        monkeypatch.setitem(sys.modules, 'motorsport_modeling.metrics._numba_kernels', None)
+
+    return disable
+
+
 # TODO: Add more fixtures as needed
 # - Synthetic telemetry data for unit tests
 # - Mock race data
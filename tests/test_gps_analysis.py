@@ -13,6 +13,7 @@ from motorsport_modeling.data import (
     load_gps_data,
     identify_corners_from_gps,
     get_corner_at_position,
+    get_corners_at_positions,
     extract_corner_telemetry,
     validate_corner_identification
 )
@@ -24,10 +25,17 @@ SAMPLE_DATA = Path(__file__).parent.parent / 'data' / 'samples' / 'indy_telemetr
 class TestGPSCornerIdentification:
     """Tests for corner identification from GPS data."""
 
-    def create_synthetic_gps_data(self, n_laps=3, points_per_lap=200):
+    def create_synthetic_gps_data(self, n_laps=3, points_per_lap=200, seed=0):
         """Create synthetic GPS data with simulated corners for testing."""
         # Indianapolis is approximately a rectangle with rounded corners
         # Simulate 4 corners at roughly equal spacing
+        #
+        # Noise is drawn from a local generator so each call is reproducible
+        # on its own. It stays well below the detector's 5 km/h prominence
+        # floor (speed) and its 22 m clustering radius (~2 m GPS scatter),
+        # so the straights never look like corners and the 4 known corners
+        # are found whatever the seed.
+        rng = np.random.default_rng(seed)
 
         data = []
         base_lat = 39.795
@@ -61,7 +69,7 @@ class TestGPSCornerIdentification:
                             (base_speed - corner_speeds[nearest_corner_idx]) * \
                             (distance_to_corner / 0.05)
                 else:
-                    speed = base_speed + np.random.normal(0, 5)  # Add noise
+                    speed = base_speed + rng.normal(0, 0.5)  # Add noise
 
                 # GPS coordinates: roughly rectangular track
                 if progress < 0.25:  # Straight 1
@@ -78,8 +86,8 @@ class TestGPSCornerIdentification:
                     lon = base_lon + 0.001 - (progress - 0.75) * 0.004
 
                 # Add some noise
-                lat += np.random.normal(0, 0.00005)
-                lon += np.random.normal(0, 0.00005)
+                lat += rng.normal(0, 0.00002)
+                lon += rng.normal(0, 0.00002)
 
                 timestamp = pd.Timestamp('2024-01-01') + pd.Timedelta(seconds=lap*100 + i*0.5)
 
@@ -107,8 +115,11 @@ class TestGPSCornerIdentification:
             verbose=True
         )
 
-        # Should find approximately 4 corners (may find 6 due to noise)
-        assert 3 <= len(corners) <= 7, f"Expected 3-7 corners, found {len(corners)}"
+        # Should find exactly the 4 simulated corners, at their apex speeds
+        assert len(corners) == 4, f"Expected 4 corners, found {len(corners)}"
+        np.testing.assert_allclose(
+            np.sort(corners['min_speed'].values), [50, 55, 80, 120], atol=1
+        )
 
         # Check DataFrame structure
         assert 'corner_id' in corners.columns
@@ -130,6 +141,29 @@ class TestGPSCornerIdentification:
         print(f"\n✓ Found {len(corners)} corners in synthetic data")
         print(corners[['corner_id', 'corner_type', 'min_speed', 'latitude', 'longitude']])
 
+    @pytest.mark.parametrize('seed', range(10))
+    @pytest.mark.parametrize('percentile', [40, 50])
+    def test_shared_threshold_finds_known_corners(self, seed, percentile):
+        """Test that one cross-lap threshold finds the 4 corners for any noise draw."""
+        gps_with_speed = self.create_synthetic_gps_data(n_laps=5, seed=seed)
+        # One lap 10% slower throughout: its straights sit below the other
+        # laps' but must not turn into corners
+        gps_with_speed.loc[gps_with_speed['lap'] == 3, 'speed'] *= 0.9
+
+        corners = identify_corners_from_gps(
+            gps_with_speed,
+            min_corners=3,
+            max_corners=6,
+            speed_threshold_percentile=percentile,
+            verbose=False
+        )
+
+        assert len(corners) == 4, f"Expected 4 corners, found {len(corners)}"
+        # min_speed is the median apex, so the slow lap does not shift it
+        np.testing.assert_allclose(
+            np.sort(corners['min_speed'].values), [50, 55, 80, 120], atol=1
+        )
+
     def test_identify_corners_sample_data(self):
         """Test corner identification with sample data (expected to skip due to sparse data)."""
         # Load GPS data for a vehicle with multiple laps
@@ -176,16 +210,15 @@ class TestGPSCornerIdentification:
         # Create synthetic single lap
         gps_with_speed = self.create_synthetic_gps_data(n_laps=1, points_per_lap=200)
 
-        # Should still work but may find fewer clusters
-        with pytest.warns(UserWarning):  # May warn about single lap
-            corners = identify_corners_from_gps(
-                gps_with_speed,
-                min_corners=2,  # Lower expectation for single lap
-                verbose=False
-            )
-
-        # Should find at least one corner
-        assert len(corners) >= 1
+        # Each corner is seen only once, so no extrema repeat across laps:
+        # the larger-epsilon retry is tried and then the call gives up
+        with pytest.warns(UserWarning, match="Trying larger epsilon"):
+            with pytest.raises(ValueError, match="No consistent corners"):
+                identify_corners_from_gps(
+                    gps_with_speed,
+                    min_corners=2,  # Lower expectation for single lap
+                    verbose=False
+                )
 
     def test_identify_corners_parameters(self):
         """Test corner identification with different parameters."""
@@ -237,12 +270,128 @@ class TestGPSCornerIdentification:
             else:
                 assert corner_type == 'fast', f"Corner at {speed} km/h should be 'fast'"
 
+    def test_cuml_backend_falls_back_to_sklearn(self):
+        """Test that backend='cuml' falls back to scikit-learn without cuML."""
+        try:
+            import cuml  # noqa: F401
+            pytest.skip("cuML installed; fallback path not exercised")
+        except ImportError:
+            pass
+
+        gps_with_speed = self.create_synthetic_gps_data(n_laps=3, points_per_lap=200)
+
+        expected = identify_corners_from_gps(gps_with_speed, min_corners=3, max_corners=6)
+        with pytest.warns(UserWarning, match="cuML not available"):
+            corners = identify_corners_from_gps(
+                gps_with_speed, min_corners=3, max_corners=6, backend='cuml'
+            )
+
+        pd.testing.assert_frame_equal(corners, expected)
+
+        with pytest.raises(ValueError, match="Unknown DBSCAN backend"):
+            identify_corners_from_gps(gps_with_speed, backend='gpu')
+
+    def test_repeated_calls_reuse_cached_corners(self):
+        """Test that identical input hits the corner cache and returns copies."""
+        from motorsport_modeling.data import gps_analysis
+
+        gps_with_speed = self.create_synthetic_gps_data(n_laps=3, points_per_lap=200)
+        gps_analysis._CORNER_CACHE.clear()
+
+        first = identify_corners_from_gps(gps_with_speed, min_corners=3, max_corners=6)
+        first['min_speed'] = -1.0  # Mutating a result must not touch the cache
+        second = identify_corners_from_gps(
+            gps_with_speed.copy(), min_corners=3, max_corners=6
+        )
+
+        assert len(gps_analysis._CORNER_CACHE) == 1
+        assert (second['min_speed'] > 0).all()
+
+        # Any change to the data or parameters is a cache miss
+        changed = gps_with_speed.assign(speed=gps_with_speed['speed'] + 1)
+        identify_corners_from_gps(changed, min_corners=3, max_corners=6)
+        identify_corners_from_gps(gps_with_speed, min_corners=3, max_corners=7)
+        assert len(gps_analysis._CORNER_CACHE) == 3
+
+
+class TestPeakFinding:
+    """Tests for the array helpers behind corner identification."""
+
+    def test_find_peaks_jagged_matches_scipy(self):
+        """Test that jagged peak finding matches scipy find_peaks lap by lap."""
+        from scipy.signal import find_peaks
+        from motorsport_modeling.data.gps_analysis import _find_peaks_jagged
+
+        rng = np.random.default_rng(42)
+        lap_lengths = np.array([200, 350, 60, 500])
+        values = rng.normal(0, 10, lap_lengths.sum()).cumsum()
+        ends = np.cumsum(lap_lengths)
+        starts = ends - lap_lengths
+        distances = np.array([10, 25, 10, 40])
+
+        peaks = _find_peaks_jagged(values, starts, ends, distances, prominence=5)
+
+        expected = np.concatenate([
+            start + find_peaks(values[start:end], distance=d, prominence=5)[0]
+            for start, end, d in zip(starts, ends, distances)
+        ])
+        np.testing.assert_array_equal(peaks, expected)
+
+        # Cut-off is applied after distance/prominence selection
+        min_value = np.percentile(values, 60)
+        peaks = _find_peaks_jagged(
+            values, starts, ends, distances, prominence=5, min_value=min_value
+        )
+        np.testing.assert_array_equal(peaks, expected[values[expected] > min_value])
+
+    def test_percentile_matches_numpy(self):
+        """Test that the partition-based percentile matches np.percentile."""
+        from motorsport_modeling.data.gps_analysis import _percentile
+
+        values = np.random.default_rng(0).normal(50, 20, 1001)
+
+        for q in [0, 12.5, 40, 60, 100]:
+            assert _percentile(values, q) == pytest.approx(np.percentile(values, q))
+        assert np.isnan(_percentile(np.array([]), 40))
+
+    def test_grouped_nanmedian_matches_pandas(self):
+        """Test that per-cluster medians match a NaN-skipping groupby median."""
+        from motorsport_modeling.data.gps_analysis import _grouped_nanmedian
+
+        rng = np.random.default_rng(1)
+        groups = rng.integers(0, 12, 200)
+        values = rng.normal(50, 20, 200)
+        values[rng.random(200) < 0.2] = np.nan
+        values[groups == 3] = np.nan  # group with no valid values
+
+        expected = pd.Series(values).groupby(groups).median().to_numpy()
+        np.testing.assert_allclose(_grouped_nanmedian(values, groups, 12), expected)
+
+    def test_local_projection_matches_haversine(self):
+        """Test that planar distances match great-circle distances over a circuit."""
+        from motorsport_modeling.data.gps_analysis import _local_xy, EARTH_RADIUS_M
+
+        rng = np.random.default_rng(2)
+        lat = 39.795 + rng.uniform(-0.01, 0.01, 300)
+        lon = -86.235 + rng.uniform(-0.01, 0.01, 300)
+
+        xy = _local_xy(lat, lon)
+
+        assert xy.dtype == np.float32 and xy.flags['C_CONTIGUOUS']
+        lat_r, lon_r = np.radians(lat), np.radians(lon)
+        a = (np.sin((lat_r[1:] - lat_r[:-1]) / 2) ** 2
+             + np.cos(lat_r[1:]) * np.cos(lat_r[:-1]) * np.sin((lon_r[1:] - lon_r[:-1]) / 2) ** 2)
+        haversine = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+        planar = np.hypot(*(xy[1:] - xy[:-1]).astype(np.float64).T)
+        np.testing.assert_allclose(planar, haversine, rtol=5e-4)
+
 
 class TestGetCornerAtPosition:
     """Tests for finding corners at GPS positions."""
 
-    def create_synthetic_gps_data(self, n_laps=3, points_per_lap=200):
+    def create_synthetic_gps_data(self, n_laps=3, points_per_lap=200, seed=0):
         """Create synthetic GPS data - same as in TestGPSCornerIdentification."""
+        rng = np.random.default_rng(seed)
         data = []
         base_lat = 39.795
         base_lon = -86.235
@@ -263,7 +412,7 @@ class TestGetCornerAtPosition:
                             (base_speed - corner_speeds[nearest_corner_idx]) * \
                             (distance_to_corner / 0.05)
                 else:
-                    speed = base_speed + np.random.normal(0, 5)
+                    speed = base_speed + rng.normal(0, 0.5)
 
                 if progress < 0.25:
                     lat = base_lat + progress * 0.004
@@ -278,8 +427,8 @@ class TestGetCornerAtPosition:
                     lat = base_lat
                     lon = base_lon + 0.001 - (progress - 0.75) * 0.004
 
-                lat += np.random.normal(0, 0.00005)
-                lon += np.random.normal(0, 0.00005)
+                lat += rng.normal(0, 0.00002)
+                lon += rng.normal(0, 0.00002)
 
                 timestamp = pd.Timestamp('2024-01-01') + pd.Timedelta(seconds=lap*100 + i*0.5)
 
@@ -354,12 +503,57 @@ class TestGetCornerAtPosition:
         )
         assert corner_id_loose is not None  # Should find some corner
 
+    def test_get_corners_at_positions_matches_scalar(self):
+        """Test batched lookup agrees with get_corner_at_position."""
+        gps_with_speed = self.create_synthetic_gps_data(n_laps=3, points_per_lap=200)
+        corners = identify_corners_from_gps(gps_with_speed, verbose=False)
+
+        lats = gps_with_speed['latitude'].to_numpy()
+        lons = gps_with_speed['longitude'].to_numpy()
+
+        corner_ids = get_corners_at_positions(corners, lats, lons)
+
+        assert len(corner_ids) == len(gps_with_speed)
+        for lat, lon, corner_id in zip(lats[::25], lons[::25], corner_ids[::25]):
+            expected = get_corner_at_position(corners, lat, lon)
+            assert corner_id == (expected if expected is not None else -1)
+
+        # Far from every corner
+        assert get_corners_at_positions(corners, [0.0], [0.0])[0] == -1
+
+    def test_lookup_leaves_corners_frame_unchanged(self, tmp_path):
+        """Test that a looked-up corners frame still round-trips through Parquet."""
+        pytest.importorskip('pyarrow')
+        gps_with_speed = self.create_synthetic_gps_data(n_laps=3, points_per_lap=200)
+        corners = identify_corners_from_gps(gps_with_speed, verbose=False)
+
+        corner_ids = get_corners_at_positions(
+            corners, gps_with_speed['latitude'], gps_with_speed['longitude']
+        )
+
+        assert corners.attrs == {}
+        corners.to_parquet(tmp_path / 'corners.parquet')
+        corners[corners['corner_id'] > 1].to_parquet(tmp_path / 'later_corners.parquet')
+        pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / 'corners.parquet'), corners)
+
+        # Corners moved in place aren't matched against the old tree
+        moved = corners.copy()
+        np.testing.assert_array_equal(
+            get_corners_at_positions(moved, gps_with_speed['latitude'], gps_with_speed['longitude']),
+            corner_ids
+        )
+        moved['latitude'] += 1.0
+        assert (get_corners_at_positions(
+            moved, gps_with_speed['latitude'], gps_with_speed['longitude']
+        ) == -1).all()
+
 
 class TestExtractCornerTelemetry:
     """Tests for extracting telemetry near corners."""
 
-    def create_synthetic_gps_data(self, n_laps=3, points_per_lap=200):
+    def create_synthetic_gps_data(self, n_laps=3, points_per_lap=200, seed=0):
         """Create synthetic GPS data - same as in other test classes."""
+        rng = np.random.default_rng(seed)
         data = []
         base_lat = 39.795
         base_lon = -86.235
@@ -380,7 +574,7 @@ class TestExtractCornerTelemetry:
                             (base_speed - corner_speeds[nearest_corner_idx]) * \
                             (distance_to_corner / 0.05)
                 else:
-                    speed = base_speed + np.random.normal(0, 5)
+                    speed = base_speed + rng.normal(0, 0.5)
 
                 if progress < 0.25:
                     lat = base_lat + progress * 0.004
@@ -395,8 +589,8 @@ class TestExtractCornerTelemetry:
                     lat = base_lat
                     lon = base_lon + 0.001 - (progress - 0.75) * 0.004
 
-                lat += np.random.normal(0, 0.00005)
-                lon += np.random.normal(0, 0.00005)
+                lat += rng.normal(0, 0.00002)
+                lon += rng.normal(0, 0.00002)
 
                 timestamp = pd.Timestamp('2024-01-01') + pd.Timedelta(seconds=lap*100 + i*0.5)
 
@@ -459,8 +653,9 @@ class TestExtractCornerTelemetry:
 class TestValidateCornerIdentification:
     """Tests for corner identification validation."""
 
-    def create_synthetic_gps_data(self, n_laps=3, points_per_lap=200):
+    def create_synthetic_gps_data(self, n_laps=3, points_per_lap=200, seed=0):
         """Create synthetic GPS data - same as in other test classes."""
+        rng = np.random.default_rng(seed)
         data = []
         base_lat = 39.795
         base_lon = -86.235
@@ -481,7 +676,7 @@ class TestValidateCornerIdentification:
                             (base_speed - corner_speeds[nearest_corner_idx]) * \
                             (distance_to_corner / 0.05)
                 else:
-                    speed = base_speed + np.random.normal(0, 5)
+                    speed = base_speed + rng.normal(0, 0.5)
 
                 if progress < 0.25:
                     lat = base_lat + progress * 0.004
@@ -496,8 +691,8 @@ class TestValidateCornerIdentification:
                     lat = base_lat
                     lon = base_lon + 0.001 - (progress - 0.75) * 0.004
 
-                lat += np.random.normal(0, 0.00005)
-                lon += np.random.normal(0, 0.00005)
+                lat += rng.normal(0, 0.00002)
+                lon += rng.normal(0, 0.00002)
 
                 timestamp = pd.Timestamp('2024-01-01') + pd.Timedelta(seconds=lap*100 + i*0.5)
 
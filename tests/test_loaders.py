@@ -2,11 +2,14 @@
 Unit tests for data loaders.
 """
 
+import os
 import pytest
+import numpy as np
 import pandas as pd
 import time
 from pathlib import Path
 
+from motorsport_modeling.data import loaders
 from motorsport_modeling.data import (
     load_telemetry,
     load_gps_data,
@@ -125,6 +128,12 @@ class TestDataLoaders:
                          if c not in ['vehicle_number', 'lap', 'timestamp']]
         assert len(telemetry_cols) > 0
 
+        # Rows should come out in vehicle/lap/timestamp order
+        keys = ['vehicle_number', 'lap', 'timestamp']
+        pd.testing.assert_frame_equal(
+            df[keys], df[keys].sort_values(keys).reset_index(drop=True)
+        )
+
     def test_load_telemetry_long_format(self):
         """Test long format (no pivot)."""
         df = load_telemetry(SAMPLE_DATA, wide_format=False, verbose=False)
@@ -247,6 +256,222 @@ class TestDataQuality:
         assert df['latitude'].between(39.78, 39.81).all()
         assert df['longitude'].between(-86.24, -86.22).all()
 
+    def test_gps_coordinates_keep_full_precision(self, tmp_path):
+        """Verify GPS coordinates aren't downcast while other signals are."""
+        csv_path = write_long_format_csv(tmp_path / 'race.csv', vehicles=(55,))
+        raw = pd.read_csv(csv_path)
+        is_lat = (raw['telemetry_name'] == 'VBOX_Lat_Min').to_numpy()
+        raw.loc[is_lat, 'telemetry_value'] = 39.7951234 + np.arange(is_lat.sum()) * 1e-7
+        raw.to_csv(csv_path, index=False)
+
+        gps = load_gps_data(csv_path, verbose=False)
+        wide = load_telemetry(csv_path, verbose=False)
+        long = load_telemetry(csv_path, wide_format=False, verbose=False)
+
+        assert gps['latitude'].dtype == np.float64
+        assert gps['longitude'].dtype == np.float64
+        np.testing.assert_array_equal(
+            np.sort(gps['latitude']), np.sort(raw.loc[is_lat, 'telemetry_value'])
+        )
+        assert wide['VBOX_Lat_Min'].dtype == np.float64
+        assert wide['speed'].dtype == np.float32
+        assert long['telemetry_value'].dtype == np.float64
+        no_gps = load_telemetry(csv_path, parameters=['speed'], wide_format=False)
+        assert no_gps['telemetry_value'].dtype == np.float32
+
+
+def write_long_format_csv(path, vehicles=(13, 55), laps=(1, 2, 3), n_samples=20):
+    """Write a small long-format telemetry CSV and return its path."""
+    params = ['speed', 'ath', 'pbrake_f', 'VBOX_Lat_Min', 'VBOX_Long_Minutes']
+    start = pd.Timestamp('2024-07-20T10:15:00Z')
+    rows = []
+    for vehicle in vehicles:
+        for lap in laps:
+            for i in range(n_samples):
+                ts = start + pd.Timedelta(seconds=lap * 100 + i * 0.1)
+                for j, param in enumerate(params):
+                    rows.append({
+                        'lap': lap,
+                        'vehicle_number': vehicle,
+                        'telemetry_name': param,
+                        'telemetry_value': 100.0 + vehicle + lap + i + j,
+                        'timestamp': ts.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z',
+                        'meta_session': 'R1',
+                    })
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return path
+
+
+class TestLoadCaching:
+    """Test suite for the Parquet sidecar and caches behind repeated loads."""
+
+    def test_sidecar_matches_csv(self, tmp_path):
+        """Test that loads through the sidecar match the first (CSV) load."""
+        pytest.importorskip('pyarrow')
+        csv_path = write_long_format_csv(tmp_path / 'race.csv')
+
+        first = load_telemetry(csv_path, vehicle=55, lap=[1, 2], parameters=['speed', 'ath'])
+        sidecar = tmp_path / 'race.csv.parquet'
+        assert sidecar.exists()
+
+        loaders._LOAD_CACHE.clear()  # Force the second load to read the sidecar
+        second = load_telemetry(csv_path, vehicle=55, lap=[1, 2], parameters=['speed', 'ath'])
+        pd.testing.assert_frame_equal(first, second)
+        assert get_available_vehicles(csv_path) == [13, 55]
+
+        long_first = load_telemetry(csv_path, wide_format=False)
+        assert 'meta_session' in long_first.columns
+
+        # A newer CSV invalidates the sidecar
+        write_long_format_csv(csv_path, vehicles=(7,))
+        os.utime(csv_path, (sidecar.stat().st_mtime + 10,) * 2)
+        assert get_available_vehicles(csv_path) == [7]
+
+    def test_csv_replaced_by_older_copy_is_reloaded(self, tmp_path):
+        """Test that a CSV swapped for an older-dated file isn't served from stale caches."""
+        pytest.importorskip('pyarrow')
+        csv_path = write_long_format_csv(tmp_path / 'race.csv')
+        sidecar = tmp_path / 'race.csv.parquet'
+        loaders.clear_load_cache()
+        assert load_telemetry(csv_path, wide_format=False)['vehicle_number'].max() == 55
+        assert get_available_vehicles(csv_path) == [13, 55]
+
+        # Restored with an older mtime (cp -p, rsync -t, unzip)
+        write_long_format_csv(csv_path, vehicles=(7,))
+        old_mtime = sidecar.stat().st_mtime - 100
+        os.utime(csv_path, (old_mtime, old_mtime))
+
+        assert get_available_vehicles(csv_path) == [7]
+        assert set(load_telemetry(csv_path, wide_format=False)['vehicle_number']) == {7}
+
+        # The sidecar was rebuilt for the new file and is reused from now on
+        rebuilt = sidecar.stat().st_mtime_ns
+        loaders.clear_load_cache()
+        assert set(load_telemetry(csv_path, wide_format=False)['vehicle_number']) == {7}
+        assert sidecar.stat().st_mtime_ns == rebuilt
+
+    def test_write_cache_false_leaves_directory_untouched(self, tmp_path):
+        """Test that write_cache=False reads the CSV without writing a sidecar."""
+        pytest.importorskip('pyarrow')
+        csv_path = write_long_format_csv(tmp_path / 'race.csv')
+        loaders.clear_load_cache()
+
+        df = load_telemetry(csv_path, vehicle=55, lap=[1, 3], write_cache=False)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['race.csv']
+        loaders.clear_load_cache()
+        pd.testing.assert_frame_equal(df, load_telemetry(csv_path, vehicle=55, lap=[1, 3]))
+        assert (tmp_path / 'race.csv.parquet').exists()
+
+    def test_chunked_csv_read_matches_sidecar(self, tmp_path, monkeypatch):
+        """Test that filtering the CSV chunk by chunk matches the sidecar read."""
+        csv_path = write_long_format_csv(tmp_path / 'race.csv')
+        loaders._LOAD_CACHE.clear()
+        from_sidecar = load_telemetry(csv_path, vehicle=55, lap=[1, 3])
+
+        # No sidecar: the CSV is filtered in small chunks instead
+        loaders._LOAD_CACHE.clear()
+        (tmp_path / 'race.csv.parquet').unlink()
+        monkeypatch.setattr(loaders, '_write_parquet_sidecar', lambda *args: False)
+        monkeypatch.setattr(loaders, '_CSV_CHUNK_ROWS', 7)
+        from_chunks = load_telemetry(csv_path, vehicle=55, lap=[1, 3])
+
+        assert not (tmp_path / 'race.csv.parquet').exists()
+        pd.testing.assert_frame_equal(from_chunks, from_sidecar)
+
+    def test_long_format_keeps_csv_row_labels(self, tmp_path, monkeypatch):
+        """Test that long-format rows are labelled by CSV row with or without the sidecar."""
+        pytest.importorskip('pyarrow')
+        csv_path = write_long_format_csv(tmp_path / 'race.csv')
+        raw = pd.read_csv(csv_path)
+        expected = raw.index[(raw['vehicle_number'] == 55) & raw['lap'].isin([1, 3])]
+
+        loaders.clear_load_cache()
+        load_telemetry(csv_path, wide_format=False)  # Writes the sidecar
+        loaders.clear_load_cache()
+        from_sidecar = load_telemetry(csv_path, vehicle=55, lap=[1, 3], wide_format=False)
+        np.testing.assert_array_equal(np.sort(from_sidecar.index), expected)
+        pd.testing.assert_frame_equal(
+            from_sidecar.drop(columns='timestamp'),
+            raw.loc[from_sidecar.index].drop(columns='timestamp'),
+            check_dtype=False, check_categorical=False
+        )
+
+        loaders.clear_load_cache()
+        monkeypatch.setattr(loaders, '_sidecar_is_fresh', lambda *args: False)
+        monkeypatch.setattr(loaders, '_write_parquet_sidecar', lambda *args: False)
+        monkeypatch.setattr(loaders, '_CSV_CHUNK_ROWS', 7)
+        from_chunks = load_telemetry(csv_path, vehicle=55, lap=[1, 3], wide_format=False)
+        pd.testing.assert_frame_equal(from_chunks, from_sidecar)
+
+    def test_repeated_load_returns_cached_copy(self, tmp_path):
+        """Test that repeated loads hit the result cache and return copies."""
+        csv_path = write_long_format_csv(tmp_path / 'race.csv')
+        loaders._LOAD_CACHE.clear()
+
+        first = load_telemetry(csv_path, vehicle=55, lap=2)
+        first['speed'] = -1.0  # Mutating a result must not touch the cache
+        second = load_telemetry(csv_path, vehicle=55, lap=[2])
+
+        assert len(loaders._LOAD_CACHE) == 1
+        assert (second['speed'] > 0).all()
+
+        # Rewriting the file invalidates the cached result
+        write_long_format_csv(csv_path, laps=(2,), n_samples=5)
+        os.utime(csv_path, (csv_path.stat().st_mtime + 10,) * 2)
+        assert len(load_telemetry(csv_path, vehicle=55, lap=2)) == 5
+
+    def test_result_cache_is_bounded_by_bytes(self, tmp_path, monkeypatch):
+        """Test that large results aren't cached and the byte budget evicts old ones."""
+        csv_path = write_long_format_csv(tmp_path / 'race.csv')
+        loaders.clear_load_cache()
+        lap_bytes = int(load_telemetry(csv_path, vehicle=55, lap=1).memory_usage(deep=True).sum())
+        loaders.clear_load_cache()
+        monkeypatch.setattr(loaders, '_LOAD_CACHE_MAX_BYTES', 4 * lap_bytes + 1)
+
+        load_telemetry(csv_path)  # Whole file: over a quarter of the budget
+        assert len(loaders._LOAD_CACHE) == 0
+
+        for lap in (1, 2, 3):
+            for vehicle in (13, 55):
+                load_telemetry(csv_path, vehicle=vehicle, lap=lap)
+        assert len(loaders._LOAD_CACHE) == 4
+        assert sum(size for _, size in loaders._LOAD_CACHE.values()) <= 4 * lap_bytes + 1
+        assert list(loaders._LOAD_CACHE)[-1][2:4] == (55, (3,))
+
+        loaders.clear_load_cache()
+        assert len(loaders._LOAD_CACHE) == 0
+
+
+class TestArrayHelpers:
+    """Tests for the array helpers behind the loaders."""
+
+    def test_valid_lap_mask_matches_numpy(self):
+        """Test that the lap filter matches the chained numpy comparisons."""
+        lap = np.arange(1, 201)
+        lap_time = np.random.default_rng(0).uniform(20, 400, size=200).astype(np.float32)
+        lap_time[::17] = np.nan
+
+        expected = (lap > 1) & (lap_time > 60.0) & (lap_time < 300.0)
+        np.testing.assert_array_equal(
+            loaders._valid_lap_mask(lap, lap_time, 60.0, 300.0), expected
+        )
+
+
+    @pytest.mark.parametrize('items', [[3], [2, 5, 7], [1, 2, 3, 4, 5, 6], [], [99]])
+    def test_isin_matches_series_isin(self, items):
+        """Test membership masks for numeric, string and categorical values."""
+        rng = np.random.default_rng(0)
+        laps = pd.Series(rng.integers(1, 10, size=100))
+        names = pd.Series(rng.choice(['aps', 'pbrake_f', 'speed', 'gear'], size=100))
+        name_items = [['aps', 'pbrake_f', 'speed', 'gear', 'x', 'y'][i % 6] for i in items]
+
+        np.testing.assert_array_equal(loaders._isin(laps, items), laps.isin(items).to_numpy())
+        for values in (names, names.astype('category')):
+            np.testing.assert_array_equal(
+                loaders._isin(values, name_items), names.isin(name_items).to_numpy()
+            )
+
 
 if __name__ == '__main__':
     # Run tests with pytest
@@ -0,0 +1,505 @@
+"""
+Unit tests for the unified telemetry loader.
+"""
+
+import json
+import os
+import pytest
+import numpy as np
+import pandas as pd
+
+from motorsport_modeling.data import telemetry_loader
+from motorsport_modeling.data.telemetry_loader import load_telemetry
+
+
+def write_json_race(race_dir, n_rows=12):
+    """Write a small JSON-format (Sebring R2 style) telemetry file."""
+    race_dir.mkdir(exist_ok=True)
+    rows = []
+    for i in range(n_rows):
+        signals = [
+            {'name': 'speed', 'value': 100.0 + i},
+            {'name': 'aps', 'value': float(i % 5)},
+        ]
+        rows.append({
+            'lap': 1 + i // 6,
+            'timestamp': f'2025-03-15T14:00:{i:02d}.000',
+            'meta_time': f'2025-03-15T14:00:{i:02d}.010',
+            'vehicle_id': 'GR86-010-72' if i % 2 else 'GR86-022-13',
+            'value': json.dumps(signals),
+        })
+    pd.DataFrame(rows).to_csv(race_dir / 'R2_telemetry_data.csv', index=False)
+    return race_dir
+
+
+class TestJsonFormat:
+    """Tests for JSON-format telemetry expansion."""
+
+    def test_json_rows_expand_to_one_row_per_signal(self, tmp_path):
+        """Test that each JSON payload becomes one long-format row per signal."""
+        race_dir = write_json_race(tmp_path / 'race')
+        raw = pd.read_csv(race_dir / 'R2_telemetry_data.csv')
+
+        result = telemetry_loader._process_json_format(raw, verbose=False)
+
+        assert len(result) == 2 * len(raw)
+        assert list(result['signal'][:2]) == ['speed', 'aps']
+        assert set(result['vehicle_number']) == {13, 72}
+        np.testing.assert_array_equal(result['lap'], np.repeat(raw['lap'], 2))
+
+    def test_malformed_payloads_are_skipped(self):
+        """Test that bad rows are dropped and bad entries end their row."""
+        raw = pd.DataFrame({
+            'lap': [1, 1, 1, 1],
+            'timestamp': ['t0', 't1', 't2', 't3'],
+            'vehicle_id': ['GR86-010-72', 'GR86-010-x', 'GR86-010-72', 'GR86-10'],
+            'value': [
+                '[{"name": "speed", "value": 1.0}]',
+                'not json',
+                '[{"name": "speed", "value": 2.0}, {"name": "aps"}, {"name": "gear", "value": 3}]',
+                np.nan,
+            ],
+        })
+
+        result = telemetry_loader._process_json_format(raw, verbose=False)
+
+        assert list(result['timestamp']) == ['t0', 't2']
+        assert list(result['value']) == [1.0, 2.0]
+
+    def test_vehicle_number_from_vehicle_id(self):
+        """Test vehicle number extraction from the last vehicle_id field."""
+        raw = pd.DataFrame({
+            'vehicle_id': ['GR86-010-72', 'GR86-010-x', 'GR86-10', 'GR86-004-78'],
+            'vehicle_number': [np.nan, np.nan, np.nan, 5],
+            'value': ['[{"name": "speed", "value": 1.0}]'] * 4,
+        })
+
+        result = telemetry_loader._process_json_format(raw, verbose=False)
+
+        np.testing.assert_array_equal(result['vehicle_number'], [72, 0, np.nan, 5])
+
+    def test_vehicle_number_from_categorical_vehicle_id(self):
+        """Test that categorical ids, including missing ones, parse like strings."""
+        raw = pd.DataFrame({
+            'vehicle_id': pd.Categorical(['GR86-010-72', np.nan, 'GR86-010-72', 'GR86-004- 7 ']),
+            'value': ['[{"name": "speed", "value": 1.0}]'] * 4,
+        })
+
+        result = telemetry_loader._process_json_format(raw, verbose=False)
+
+        np.testing.assert_array_equal(result['vehicle_number'], [72, np.nan, 72, 7])
+
+    def test_load_telemetry_json_race(self, tmp_path):
+        """Test loading a JSON-format race end to end."""
+        race_dir = write_json_race(tmp_path / 'race')
+
+        df = load_telemetry(race_dir, vehicle_number=72, verbose=False)
+
+        assert (df['vehicle_number'] == 72).all()
+        assert {'speed', 'aps', 'throttle'} <= set(df.columns)
+        assert len(df) == 6
+
+    def test_vehicle_filter_skips_other_payloads(self, monkeypatch):
+        """Test that only the selected car's payloads are parsed."""
+        raw = pd.DataFrame({
+            'lap': [1, 1, 1, 1],
+            'vehicle_id': ['GR86-010-72', 'GR86-022-13', 'GR86-004-000', 'GR86-010-72'],
+            'value': [f'[{{"name": "speed", "value": {i}.0}}]' for i in range(4)],
+        })
+        expected = telemetry_loader._fix_vehicle_identification(
+            telemetry_loader._process_json_format(raw, verbose=False)
+        )
+
+        parsed = []
+        parse_signals = telemetry_loader._parse_signals
+        monkeypatch.setattr(
+            telemetry_loader, '_parse_signals',
+            lambda payload: parsed.append(payload) or parse_signals(payload)
+        )
+        for car in (72, 4):
+            parsed.clear()
+            result = telemetry_loader._process_json_format(raw, verbose=False, vehicle_number=car)
+            result = telemetry_loader._fix_vehicle_identification(result)
+
+            selected = expected[expected['vehicle_number'] == car].reset_index(drop=True)
+            pd.testing.assert_frame_equal(result, selected)
+            assert len(parsed) == len(selected)
+
+
+class TestCsvRead:
+    """Tests for streaming the telemetry CSV."""
+
+    def write_long_race(self, race_dir, n_rows=400):
+        """Write a long-format file whose expire_at only fills in late."""
+        race_dir.mkdir(exist_ok=True)
+        pd.DataFrame({
+            'expire_at': [''] * (n_rows - 10) + ['2025-04-27T15:00:00Z'] * 10,
+            'lap': np.arange(n_rows) // 100 + 1,
+            'meta_time': [f'2025-04-27T14:{i // 60:02d}:{i % 60:02d}.000Z' for i in range(n_rows)],
+            'telemetry_name': np.tile(['speed', 'aps', 'gear', 'ath'], n_rows // 4),
+            'telemetry_value': np.arange(n_rows) * 0.5,
+            'timestamp': [f'2025-04-27T14:{i // 60:02d}:{i % 60:02d}.000Z' for i in range(n_rows)],
+            'vehicle_id': np.where(np.arange(n_rows) % 8 < 4, 'GR86-004-78', 'GR86-010-72'),
+            'vehicle_number': np.where(np.arange(n_rows) % 8 < 4, 78, 72),
+        }).to_csv(race_dir / 'R1_telemetry_data.csv', index=False)
+        return race_dir
+
+    def test_arrow_read_matches_pandas_read(self, tmp_path, monkeypatch):
+        """Test that pyarrow blocks, including a type change mid-file, match pandas."""
+        pa = pytest.importorskip('pyarrow')
+        race_dir = self.write_long_race(tmp_path / 'race')
+        telem_file = race_dir / 'R1_telemetry_data.csv'
+        cache_path = tmp_path / 'cache.parquet'
+
+        expected = telemetry_loader._normalize_chunks(
+            pd.read_csv(telem_file, chunksize=10_000,
+                        dtype={'telemetry_name': 'category', 'vehicle_id': 'category'}),
+            telem_file, cache_path, verbose=False
+        )
+
+        # One block holds the whole file
+        result = telemetry_loader._read_telemetry_csv(telem_file, cache_path, verbose=False)
+        pd.testing.assert_frame_equal(result, expected)
+
+        # Small blocks: expire_at is inferred as empty from the first block
+        monkeypatch.setattr(telemetry_loader, '_ARROW_BLOCK_BYTES', 4096)
+        with pytest.raises(pa.ArrowInvalid):
+            list(telemetry_loader._arrow_csv_chunks(telem_file))
+        result = telemetry_loader._read_telemetry_csv(telem_file, cache_path, verbose=False)
+        pd.testing.assert_frame_equal(result, expected)
+
+
+class TestVehicleIdentification:
+    """Tests for recovering vehicle numbers from vehicle_id."""
+
+    @pytest.mark.parametrize('dtype', [object, 'category'])
+    def test_car_000_uses_chassis_number(self, dtype):
+        """Test that car number 0 falls back to the chassis number."""
+        df = pd.DataFrame({
+            'vehicle_id': pd.Series(['GR86-004-78', 'GR86-010-000', 'GR86-x-000', 'GR86-004-78'], dtype=dtype),
+            'vehicle_number': [78, 0, 0, 78],
+        })
+
+        result = telemetry_loader._fix_vehicle_identification(df)
+
+        np.testing.assert_array_equal(result['vehicle_number'], [78, 10, np.nan, 78])
+
+    def test_car_number_from_vehicle_id(self):
+        """Test that a missing vehicle_number column is filled from the id."""
+        df = pd.DataFrame({'vehicle_id': ['GR86-004-78', 'GR86-010-72', 'GR86-004-78']})
+
+        result = telemetry_loader._fix_vehicle_identification(df)
+
+        assert list(result['vehicle_number']) == [78, 72, 78]
+
+
+class TestAvailableSignals:
+    """Tests for listing the signals in a race directory."""
+
+    def test_long_format_signals_from_sample(self, tmp_path):
+        """Test that signals are read from the first 10000 rows only."""
+        names = ['speed', 'aps', 'gear'] * 3334
+        pd.DataFrame({
+            'lap': 1,
+            ' telemetry_name': names[:10000] + ['late_signal'],
+            'telemetry_value': 1.0,
+        }).to_csv(tmp_path / 'R1_telemetry_data.csv', index=False)
+
+        assert telemetry_loader.get_available_signals(tmp_path) == ['aps', 'gear', 'speed']
+
+    def test_json_format_signals(self, tmp_path):
+        """Test that JSON-format signals come from the first payload."""
+        race_dir = write_json_race(tmp_path / 'race')
+
+        assert telemetry_loader.get_available_signals(race_dir) == ['aps', 'speed']
+
+
+class TestLapTimes:
+    """Tests for loading lap times."""
+
+    def test_endurance_lap_times_parsed_to_seconds(self, tmp_path):
+        """Test that M:SS.sss and plain-second lap times are both parsed."""
+        pd.DataFrame({
+            'NUMBER': [13, 13, 13, 72],
+            ' LAP_NUMBER': [1, 2, 3, 1],
+            ' LAP_TIME': ['1:40.123', ' 99.5', 'bad', np.nan],
+        }).to_csv(tmp_path / 'AnalysisEnduranceWithSections.CSV', sep=';', index=False)
+
+        df = telemetry_loader.load_lap_times(tmp_path)
+
+        assert list(df.columns) == ['vehicle_number', 'lap', 'lap_time']
+        np.testing.assert_allclose(df['lap_time'], [100.123, 99.5, np.nan, np.nan])
+
+    def test_timestamp_lap_times_match_groupby_diff(self, tmp_path):
+        """Test lap times from consecutive timestamps of the same vehicle."""
+        pd.DataFrame({
+            'vehicle_number': [13, 72, 13, 13, np.nan, 72, 13],
+            'lap': [1, 1, 3, 2, 1, 2, 4],
+            'timestamp': ['2025-04-27T14:00:00Z', '2025-04-27T14:00:05Z', '2025-04-27T14:03:20.250Z',
+                          '2025-04-27T14:01:40Z', '2025-04-27T14:00:00Z', '2025-04-27T14:01:50Z', ''],
+        }).to_csv(tmp_path / 'R1_lap_time.csv', index=False)
+
+        df = telemetry_loader.load_lap_times(tmp_path)
+
+        expected = df.groupby('vehicle_number')['timestamp'].diff().dt.total_seconds()
+        np.testing.assert_array_equal(df['lap_time'], expected)
+        np.testing.assert_array_equal(df['lap_time'], [np.nan, 100.0, 100.25, np.nan, np.nan, 105.0, np.nan])
+
+    def test_results_cached_per_file_version(self, tmp_path):
+        """Test that repeat loads are cached copies until the file changes."""
+        lap_file = tmp_path / 'AnalysisEnduranceWithSections.CSV'
+        pd.DataFrame({'NUMBER': [13], 'LAP_NUMBER': [1], 'LAP_TIME': ['1:40.0']}).to_csv(
+            lap_file, sep=';', index=False
+        )
+
+        first = telemetry_loader.load_lap_times(tmp_path)
+        first['lap_time'] = 0.0
+        assert telemetry_loader.load_lap_times(tmp_path)['lap_time'].tolist() == [100.0]
+
+        pd.DataFrame({'NUMBER': [13], 'LAP_NUMBER': [1], 'LAP_TIME': ['1:50.0']}).to_csv(
+            lap_file, sep=';', index=False
+        )
+        mtime = lap_file.stat().st_mtime + 10
+        os.utime(lap_file, (mtime, mtime))
+        assert telemetry_loader.load_lap_times(tmp_path)['lap_time'].tolist() == [110.0]
+
+
+class TestParseTimes:
+    """Tests for timestamp parsing."""
+
+    def test_iso_timestamps_with_and_without_fraction(self):
+        """Test that ISO rows parse whether or not they carry milliseconds."""
+        times = pd.Series(['2025-04-27T14:00:00.123Z', '2025-04-27T14:00:01Z', None, 'junk'])
+
+        result = telemetry_loader._parse_times(times)
+
+        assert list(result[:2]) == [
+            pd.Timestamp('2025-04-27T14:00:00.123Z'),
+            pd.Timestamp('2025-04-27T14:00:01Z'),
+        ]
+        assert result[2:].isna().all()
+
+    def test_non_iso_timestamps_use_inference(self):
+        """Test that other layouts still parse."""
+        result = telemetry_loader._parse_times(pd.Series(['04/27/2025 2:00:00 PM']))
+
+        assert result[0] == pd.Timestamp('2025-04-27 14:00:00')
+
+
+class TestLapCorruption:
+    """Tests for recalculating corrupted lap numbers from lap start times."""
+
+    @pytest.mark.parametrize('tz', ['', 'Z'])
+    def test_laps_recalculated_from_lap_starts(self, tmp_path, tz):
+        """Test that rows take the last lap that started strictly before them."""
+        times = [f'2025-04-27T14:00:{s:02d}.000{tz}' for s in [0, 5, 10, 15, 20, 25]]
+        df = pd.DataFrame({
+            'vehicle_number': [13, 13, 13, 13, 72, 72],
+            'lap': [32768, 1, 32768, 2, 32768, 7],
+            'meta_time': times,
+        })
+        pd.DataFrame({
+            'vehicle_number': [13, 13, 72],
+            'lap': [2, 1, 4],
+            'timestamp': [times[3], times[1], times[4]],
+        }).to_csv(tmp_path / 'R1_lap_start.csv', index=False)
+
+        result = telemetry_loader._fix_lap_corruption(df, tmp_path, verbose=False)
+
+        np.testing.assert_array_equal(result['lap'], [0, 0, 1, 1, 0, 4])
+        np.testing.assert_array_equal(result['vehicle_number'], df['vehicle_number'])
+        assert '_time' not in result.columns
+        assert list(df.columns) == ['vehicle_number', 'lap', 'meta_time']
+
+    def test_vehicles_without_lap_starts_drop_corrupted_rows(self, tmp_path):
+        """Test that vehicles missing from the lap start file keep valid laps only."""
+        df = pd.DataFrame({
+            'vehicle_number': [13, 72, 72, 13],
+            'lap': [32768, 3, 32768, 32768],
+            'meta_time': ['2025-04-27T14:00:00', '2025-04-27T14:00:01',
+                          '2025-04-27T14:00:02', 'bad'],
+        })
+        pd.DataFrame({
+            'vehicle_number': [13],
+            'lap': [1],
+            'timestamp': ['2025-04-27T13:59:59'],
+        }).to_csv(tmp_path / 'R1_lap_start.csv', index=False)
+
+        result = telemetry_loader._fix_lap_corruption(df, tmp_path, verbose=False)
+
+        np.testing.assert_array_equal(result['vehicle_number'], [13, 13, 72])
+        np.testing.assert_array_equal(result['lap'], [1, np.nan, 3])
+
+    def test_lap_kernel_matches_per_vehicle_search(self):
+        """Test that the Numba lap assignment matches per-vehicle searchsorted."""
+        pytest.importorskip('numba')
+        rng = np.random.default_rng(0)
+        n = 500
+        vehicle = pd.Series(rng.choice([4, 13, 72, 99], size=n))
+        lap = np.where(rng.random(n) < 0.3, 32768, rng.integers(1, 10, size=n))
+        times_i8 = rng.integers(0, 1000, size=n).astype(np.int64)
+        time_missing = rng.random(n) < 0.05
+        lap_starts = pd.DataFrame({
+            'vehicle_number': np.repeat([4, 13, 72], 5),
+            'lap': np.tile(np.arange(1, 6), 3),
+            '_start': np.tile(np.arange(1, 6) * 150, 3),
+        })
+
+        positions, laps = telemetry_loader._recalculate_laps(
+            vehicle, lap, times_i8, time_missing, lap_starts
+        )
+
+        expected = [
+            telemetry_loader._fix_one_vehicle(
+                rows, lap, times_i8, time_missing,
+                (np.arange(1, 6) * 150, np.arange(1, 6)) if veh != 99 else None
+            )
+            for veh, rows in vehicle.groupby(vehicle, sort=False).indices.items()
+        ]
+        np.testing.assert_array_equal(positions, np.concatenate([p for p, _ in expected]))
+        np.testing.assert_array_equal(laps, np.concatenate([l for _, l in expected]))
+
+
+class TestPivotToWide:
+    """Tests for pivoting long-format readings to one column per signal."""
+
+    @pytest.mark.parametrize('dtype', [np.float32, object])
+    def test_pivot_sorted_with_first_reading_kept(self, dtype):
+        """Test that rows are sorted by key and duplicate keys keep the first value."""
+        df = pd.DataFrame({
+            'vehicle_number': [72, 13, 13, 13, 72, np.nan],
+            'lap': [1, 2, 1, 1, 1, 1],
+            'meta_time': ['t1', 't0', 't1', 't1', 't0', 't0'],
+            'signal': ['speed', 'aps', 'speed', 'speed', 'aps', 'speed'],
+            'value': np.array([1.0, 2.0, np.nan, 3.0, 4.0, 5.0]).astype(dtype),
+        })
+
+        wide = telemetry_loader._pivot_to_wide(df, verbose=False)
+
+        assert list(wide.columns) == ['vehicle_number', 'lap', 'meta_time', 'aps', 'speed']
+        assert list(wide['vehicle_number']) == [13, 13, 72, 72]
+        assert list(wide['meta_time']) == ['t1', 't0', 't0', 't1']
+        np.testing.assert_array_equal(wide['speed'].astype(float), [3.0, np.nan, np.nan, 1.0])
+        np.testing.assert_array_equal(wide['aps'].astype(float), [np.nan, 2.0, 4.0, np.nan])
+
+    def test_gps_coordinates_keep_full_precision(self, tmp_path):
+        """Test that signals are narrowed to float32 but GPS coordinates aren't."""
+        race_dir = tmp_path / 'race'
+        race_dir.mkdir()
+        n = 30
+        lat = 33.5301234 + np.arange(n) * 1e-7  # Steps far below the float32 grid
+        pd.DataFrame({
+            'lap': 1,
+            'meta_time': np.repeat([f'2025-04-27T14:00:{i:02d}.000Z' for i in range(n)], 2),
+            'telemetry_name': np.tile(['VBOX_Lat_Min', 'speed'], n),
+            'telemetry_value': np.column_stack([lat, np.arange(n) + 0.1]).ravel(),
+            'timestamp': np.repeat([f'2025-04-27T14:00:{i:02d}.000Z' for i in range(n)], 2),
+            'vehicle_id': 'GR86-004-78',
+            'vehicle_number': 78,
+        }).to_csv(race_dir / 'R1_telemetry_data.csv', index=False)
+
+        # First load reads the CSV, the second the normalized cache
+        for _ in range(2):
+            df = load_telemetry(race_dir, verbose=False)
+            assert df['gps_lat'].dtype == np.float64
+            np.testing.assert_array_equal(df['gps_lat'], lat)
+            assert df['speed'].dtype == np.float32
+
+        long = load_telemetry(race_dir, pivot_to_wide=False, verbose=False)
+        assert long['value'].dtype == np.float64
+
+
+class TestIsSorted:
+    """Tests for the already-sorted check before the final sort."""
+
+    @pytest.mark.parametrize('vehicles, laps, seconds, expected', [
+        ([13, 13, 72], [1, 2, 1], [5, 0, 1], True),
+        ([13, 13, 72], [1, 1, 1], [5, 0, 1], False),
+        ([72, 13, 13], [1, 1, 2], [0, 1, 2], False),
+        ([13, 13, np.nan], [1, 1, 1], [0, 1, 2], False),
+    ])
+    def test_is_sorted(self, vehicles, laps, seconds, expected):
+        """Test lexicographic order checks over vehicle, lap and time."""
+        df = pd.DataFrame({
+            'vehicle_number': vehicles,
+            'lap': laps,
+            'time': pd.to_datetime(seconds, unit='s', utc=True),
+        })
+
+        assert telemetry_loader._is_sorted(df, ['vehicle_number', 'lap', 'time']) == expected
+
+
+class TestNormalizedCache:
+    """Tests for the Parquet cache of normalized telemetry rows."""
+
+    def test_cached_load_matches_csv_load(self, tmp_path):
+        """Test that loads served from the cache match the CSV pipeline."""
+        pytest.importorskip('pyarrow')
+        race_dir = write_json_race(tmp_path / 'race')
+        cache_path = race_dir / '.R2_telemetry_data.normalized.parquet'
+
+        from_csv = load_telemetry(race_dir, verbose=False)
+        assert cache_path.exists()
+
+        from_cache = load_telemetry(race_dir, verbose=False)
+        pd.testing.assert_frame_equal(from_cache, from_csv)
+
+        # Vehicle filters are applied when reading the cache too
+        one_car = load_telemetry(race_dir, vehicle_number=13, verbose=False)
+        pd.testing.assert_frame_equal(
+            one_car,
+            from_csv[from_csv['vehicle_number'] == 13].reset_index(drop=True)
+        )
+
+    def test_newer_csv_invalidates_cache(self, tmp_path):
+        """Test that rewriting the CSV bypasses the stale cache."""
+        pytest.importorskip('pyarrow')
+        race_dir = write_json_race(tmp_path / 'race')
+        cache_path = race_dir / '.R2_telemetry_data.normalized.parquet'
+        load_telemetry(race_dir, verbose=False)
+
+        write_json_race(race_dir, n_rows=6)
+        csv_path = race_dir / 'R2_telemetry_data.csv'
+        os.utime(csv_path, (cache_path.stat().st_mtime + 10,) * 2)
+
+        assert len(load_telemetry(race_dir, verbose=False)) == 6
+
+    def test_cache_stamp_must_match(self, tmp_path, monkeypatch):
+        """Test that older CSV copies and older cache versions bypass the cache."""
+        pytest.importorskip('pyarrow')
+        race_dir = write_json_race(tmp_path / 'race')
+        csv_path = race_dir / 'R2_telemetry_data.csv'
+        cache_path = race_dir / '.R2_telemetry_data.normalized.parquet'
+        load_telemetry(race_dir, verbose=False)
+
+        # A matching cache is read without touching the CSV
+        read_csv = telemetry_loader._read_telemetry_csv
+        monkeypatch.setattr(telemetry_loader, '_read_telemetry_csv', None)
+        assert len(load_telemetry(race_dir, verbose=False)) == 12
+        monkeypatch.setattr(telemetry_loader, '_read_telemetry_csv', read_csv)
+
+        # An older copy of a different CSV restored with its own mtime
+        write_json_race(race_dir, n_rows=6)
+        os.utime(csv_path, (cache_path.stat().st_mtime - 100,) * 2)
+        assert len(load_telemetry(race_dir, verbose=False)) == 6
+
+        # Rows cached by an older version of the normalization code
+        version = telemetry_loader._NORMALIZED_CACHE_VERSION
+        monkeypatch.setattr(telemetry_loader, '_NORMALIZED_CACHE_VERSION', version - 1)
+        load_telemetry(race_dir, verbose=False)
+        monkeypatch.setattr(telemetry_loader, '_NORMALIZED_CACHE_VERSION', version)
+        assert telemetry_loader._read_normalized_cache(cache_path, csv_path) is None
+
+    def test_write_cache_false_leaves_directory_untouched(self, tmp_path):
+        """Test that write_cache=False doesn't write into the race directory."""
+        pytest.importorskip('pyarrow')
+        race_dir = write_json_race(tmp_path / 'race')
+
+        df = load_telemetry(race_dir, verbose=False, write_cache=False)
+
+        assert len(df) == 12
+        assert sorted(p.name for p in race_dir.iterdir()) == ['R2_telemetry_data.csv']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,307 @@
+"""
+Unit tests for Tier 1 driver performance metrics.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from motorsport_modeling.metrics import tier1
+
+
+def synthetic_telemetry(n_laps=2, points_per_lap=1500, seed=0):
+    """Create 20 Hz wide-format telemetry with eight corners per lap."""
+    rng = np.random.default_rng(seed)
+    n = n_laps * points_per_lap
+    phase = np.linspace(0, 2 * np.pi * 8 * n_laps, n)
+    speed = 140 + 60 * np.sin(phase) + rng.normal(0, 2, n)
+    accel = np.gradient(speed)
+    return pd.DataFrame({
+        'timestamp': pd.Timestamp('2025-04-27 14:00') + pd.to_timedelta(np.arange(n) * 50, unit='ms'),
+        'lap': np.repeat(np.arange(1, n_laps + 1), points_per_lap),
+        'speed': speed,
+        'ath': np.clip(50 + 60 * np.sign(accel) + rng.normal(0, 15, n), 0, 100),
+        'pbrake_f': np.clip(-accel * 40 + rng.normal(0, 3, n), 0, None),
+        'steer_angle': 30 * np.cos(phase * 1.7) + rng.normal(0, 1.5, n),
+    })
+
+
+class TestTimestamps:
+    """Tests for timestamp extraction."""
+
+    def test_nanosecond_column_is_not_copied(self):
+        """Test that a datetime64[ns] column is used in place."""
+        telemetry = synthetic_telemetry(n_laps=1)
+
+        timestamps_ns = tier1._timestamps_ns(telemetry)
+
+        assert np.shares_memory(timestamps_ns, telemetry['timestamp'].array.asi8)
+
+    def test_other_formats_convert_to_nanoseconds(self):
+        """Test that strings, other units and time zones give the same nanoseconds."""
+        timestamps = synthetic_telemetry(n_laps=1)['timestamp']
+        expected = timestamps.array.asi8
+
+        for column in [
+            timestamps.dt.strftime('%Y-%m-%dT%H:%M:%S.%f'),
+            timestamps.astype('datetime64[ms]'),
+            timestamps.dt.tz_localize('UTC'),
+        ]:
+            result = tier1._timestamps_ns(pd.DataFrame({'timestamp': column}))
+            np.testing.assert_array_equal(result, expected)
+
+
+    def test_shared_time_order_matches_sorting_subset(self):
+        """Test that picking valid rows from the full time order equals sorting them."""
+        rng = np.random.default_rng(0)
+        timestamps_ns = rng.integers(0, 50, 500).astype(np.int64)
+        timestamps_ns[::13] = tier1._NAT_NS
+        valid = rng.random(500) > 0.3
+
+        time_order = tier1._time_order(np.ones(500, dtype=bool), timestamps_ns)
+        shared = tier1._time_order(valid, timestamps_ns, time_order)
+
+        np.testing.assert_array_equal(shared, tier1._time_order(valid, timestamps_ns))
+        np.testing.assert_array_equal(np.diff(timestamps_ns[shared]) >= 0, True)
+
+    def test_sorted_timestamps_keep_row_order(self):
+        """Test that timestamps already in order give the valid rows as they are."""
+        timestamps_ns = np.repeat(np.arange(100, dtype=np.int64), 2)
+        valid = np.arange(200) % 3 > 0
+
+        np.testing.assert_array_equal(
+            tier1._time_order(valid, timestamps_ns), np.flatnonzero(valid)
+        )
+
+
+class TestCoastingTime:
+    """Tests for throttle/brake/coasting classification."""
+
+    def test_percentages_skip_missing_rows(self):
+        """Test the four classes on a trace with missing samples."""
+        telemetry = pd.DataFrame({
+            'ath': [0.0, 50.0, 80.0, 0.0, np.nan, 3.0, 100.0],
+            'pbrake_f': [0.0, 0.0, 10.0, 30.0, 5.0, np.nan, 0.0],
+        })
+
+        result = tier1.calculate_coasting_time(telemetry)
+
+        assert result['n_points'] == 5
+        assert result['coasting_pct'] == 20.0
+        assert result['throttle_pct'] == 60.0
+        assert result['brake_pct'] == 40.0
+        assert result['overlap_pct'] == 20.0
+
+    @pytest.mark.parametrize('dtype', [np.float64, np.float32, np.int64])
+    def test_kernel_matches_numpy_masks(self, dtype, no_numba):
+        """Test that the one-pass Numba kernel and the NumPy fallback agree."""
+        pytest.importorskip('numba')
+        telemetry = synthetic_telemetry().astype({'ath': dtype, 'pbrake_f': dtype})
+        throttle = telemetry['ath'].to_numpy()
+        brake = telemetry['pbrake_f'].to_numpy()
+        if dtype != np.int64:
+            throttle[::13] = np.nan
+            brake[::17] = np.nan
+
+        compiled = tier1._coasting_counts(throttle, brake, 5.1, 2.1)
+        no_numba()
+        fallback = tier1._coasting_counts(throttle, brake, 5.1, 2.1)
+
+        assert compiled == fallback
+        assert 0 < compiled[3] < compiled[0]
+
+    def test_all_missing_raises(self):
+        """Test that a trace without valid rows is rejected."""
+        telemetry = pd.DataFrame({'ath': [np.nan, 1.0], 'pbrake_f': [1.0, np.nan]})
+
+        with pytest.raises(ValueError, match="No valid telemetry"):
+            tier1.calculate_coasting_time(telemetry)
+
+
+class TestBrakingPerformance:
+    """Tests for braking event and pulse counting."""
+
+    def test_counts_events_and_pulses(self):
+        """Test a hand-built trace with two braking zones and one pulse."""
+        brake = pd.DataFrame({'pbrake_f': [0, 50, 60, 25, 40, 10, 0, 30, 30, 0]}, dtype=float)
+
+        result = tier1.analyze_braking_performance(brake)
+
+        assert result['n_braking_events'] == 2
+        assert result['pulse_count'] == 1
+        assert result['max_brake'] == 60
+
+    @pytest.mark.parametrize('dtype', [np.float64, np.float32, np.int64])
+    def test_kernel_matches_numpy_fallback(self, dtype, brake_trace, no_numba):
+        """Test that the one-pass Numba kernel and the NumPy/Python fallback agree."""
+        pytest.importorskip('numba')
+        brake = (brake_trace() * 10).astype(dtype)
+        if dtype != np.int64:
+            brake[::97] = np.nan
+
+        compiled = tier1._brake_stats(brake, 20.1)
+        no_numba()
+        fallback = tier1._brake_stats(brake, 20.1)
+
+        n_points, max_brake, mean_brake, n_events, pulse_count = compiled
+        assert (n_points, max_brake, n_events, pulse_count) == fallback[:2] + fallback[3:]
+        assert type(max_brake) is type(fallback[1])
+        assert mean_brake == pytest.approx(fallback[2], rel=1e-6)
+        assert pulse_count > 0
+
+    def test_all_missing_raises(self):
+        """Test that a trace without brake readings is rejected."""
+        brake = pd.DataFrame({'pbrake_f': [np.nan, np.nan]})
+
+        with pytest.raises(ValueError, match="No brake data"):
+            tier1.analyze_braking_performance(brake)
+
+
+class TestThrottleTiming:
+    """Tests for time to full throttle after apexes."""
+
+    def test_window_and_first_full_throttle(self):
+        """Test that only the first full-throttle point within 200 points counts."""
+        throttle = np.zeros(1000)
+        throttle[[150, 160, 499, 800, 900]] = 100.0
+        timestamps_ns = np.arange(1000, dtype=np.int64) * 50_000_000
+
+        result = tier1._times_to_full_throttle(
+            throttle, timestamps_ns, np.array([100, 300, 600, 950]), 95.0
+        )
+
+        # 100 -> 150; 300 -> 499 (199 ahead); 600 -> 800 is 200 ahead; 950 -> none
+        np.testing.assert_array_equal(result, [2.5, 9.95])
+
+    @pytest.mark.parametrize('dtype', [np.float64, np.float32, np.int64])
+    def test_kernel_matches_binary_search(self, dtype, no_numba):
+        """Test that the parallel Numba scan and the searchsorted fallback agree."""
+        pytest.importorskip('numba')
+        rng = np.random.default_rng(0)
+        throttle = np.where(rng.random(20000) < 0.01, 100, 20).astype(dtype)
+        throttle[::7] = 95
+        timestamps_ns = np.cumsum(rng.integers(40, 60, 20000)).astype(np.int64) * 1_000_000
+        apexes = np.sort(rng.choice(20000, 300, replace=False))
+
+        compiled = tier1._times_to_full_throttle(throttle, timestamps_ns, apexes, 95.0, max_points=5)
+        no_numba()
+        fallback = tier1._times_to_full_throttle(throttle, timestamps_ns, apexes, 95.0, max_points=5)
+
+        np.testing.assert_array_equal(compiled, fallback)
+        assert 0 < len(compiled) < len(apexes)
+
+    def test_corners_detected_on_synthetic_laps(self):
+        """Test that each synthetic corner gives a time to full throttle."""
+        result = tier1.calculate_throttle_timing(synthetic_telemetry())
+
+        assert 0 < result['n_corners'] <= 16
+        assert 0 < result['median_time_to_full'] < 10
+
+
+class TestSteeringSmoothness:
+    """Tests for steering jerk."""
+
+    def test_repeated_timestamp_gives_zero_rate(self):
+        """Test that a step without elapsed time counts as zero steering rate."""
+        seconds = [0, 1, 2, 3, 4, 5, 5, 6, 7, 8, 9, 10]
+        telemetry = pd.DataFrame({
+            'timestamp': pd.Timestamp('2025-04-27 14:00') + pd.to_timedelta(seconds, unit='s'),
+            'steer_angle': [0.0, 2, 4, 6, 8, 10, 10, 12, 14, 16, 18, 20],
+        })
+
+        result = tier1.calculate_steering_smoothness(telemetry)
+
+        # Rates are 2 deg/s except 0 at the repeated timestamp
+        assert result['mean_jerk'] == pytest.approx(0.4)
+        assert result['max_jerk'] == 2.0
+        assert result['smoothness_score'] == pytest.approx(99.96)
+
+
+class TestConsistency:
+    """Tests for lap time consistency."""
+
+    @pytest.mark.parametrize('n_laps', [9, 10])
+    def test_matches_numpy_statistics(self, n_laps):
+        """Test median outlier filtering and statistics on odd and even lap counts."""
+        lap_times = list(np.random.default_rng(n_laps).normal(100, 0.5, n_laps)) + [130.0]
+        clean = np.array(lap_times[:-1])
+
+        result = tier1.calculate_consistency(lap_times, exclude_first_n=0)
+
+        assert result['n_laps'] == n_laps
+        assert result['std'] == np.std(clean)
+        assert result['mean'] == np.mean(clean)
+        assert result['range'] == np.ptp(clean)
+
+    def test_too_few_laps_after_filtering_raises(self):
+        """Test that outlier filtering can leave too few laps."""
+        with pytest.raises(ValueError, match="Too few laps"):
+            tier1.calculate_consistency([100.0, 100.5, 150.0, 160.0], exclude_first_n=0)
+
+
+class TestAllMetrics:
+    """Tests for the combined Tier 1 metrics."""
+
+    def test_input_not_modified(self):
+        """Test that no metric modifies or reorders the caller's frame."""
+        telemetry = synthetic_telemetry().sample(frac=1, random_state=0)
+        telemetry.loc[telemetry.index[::7], 'steer_angle'] = np.nan
+        snapshot = telemetry.copy()
+
+        results = tier1.calculate_all_tier1_metrics(telemetry, lap_times=[101.0, 100.2, 100.5, 100.1])
+
+        pd.testing.assert_frame_equal(telemetry, snapshot)
+        assert all(results[name] is not None for name in ['coasting', 'braking', 'throttle', 'steering'])
+        assert results['throttle']['n_corners'] > 0
+
+    def test_matches_individual_metrics(self):
+        """Test that sharing columns between metrics gives the same results."""
+        telemetry = synthetic_telemetry()
+        telemetry.loc[telemetry.index[::11], 'ath'] = np.nan
+
+        results = tier1.calculate_all_tier1_metrics(telemetry)
+
+        assert results['coasting'] == tier1.calculate_coasting_time(telemetry)
+        assert results['braking'] == tier1.analyze_braking_performance(telemetry)
+        assert results['throttle'] == tier1.calculate_throttle_timing(telemetry)
+        assert results['steering'] == tier1.calculate_steering_smoothness(telemetry)
+
+    def test_missing_timestamps_skip_timing_metrics(self):
+        """Test that metrics needing timestamps are skipped without them."""
+        telemetry = synthetic_telemetry().drop(columns='timestamp')
+
+        results = tier1.calculate_all_tier1_metrics(telemetry)
+
+        assert results['throttle'] is None
+        assert results['steering'] is None
+        assert results['coasting'] is not None
+
+
+class TestCompareDrivers:
+    """Tests for comparing drivers' summary scores."""
+
+    def test_batch_matches_pairwise_comparison(self):
+        """Test that every pair in the batch agrees with compare_drivers."""
+        rng = np.random.default_rng(0)
+        metrics_list = [
+            {'summary': {key: float(np.round(rng.uniform(0, 100))) for key in tier1._CMP_KEYS}}
+            for _ in range(5)
+        ]
+        metrics_list[1]['summary']['throttle_timing_score'] = None
+        metrics_list[2]['summary']['braking_score'] = metrics_list[3]['summary']['braking_score']
+        metrics_list.append({})
+
+        result = tier1.compare_drivers_batch(metrics_list)
+
+        assert result['scores'].shape == (6, len(tier1._CMP_KEYS))
+        for i, metrics_a in enumerate(metrics_list):
+            for j, metrics_b in enumerate(metrics_list):
+                pair = tier1.compare_drivers(metrics_a, metrics_b)
+                assert result['wins'][i, j] == pair['overall']['a_wins']
+                assert result['wins'][j, i] == pair['overall']['b_wins']
+                for k, metric in enumerate(tier1._CMP_KEYS):
+                    delta = pair[metric]['delta']
+                    if delta is None:
+                        assert np.isnan(result['delta'][i, j, k])
+                    else:
+                        assert result['delta'][i, j, k] == delta
@@ -0,0 +1,151 @@
+"""
+Unit tests for the Tier 1 coaching metrics.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from motorsport_modeling.metrics import tier1_metrics
+
+
+def wide_telemetry(vehicle_number=7, **signals):
+    """Build 20 Hz wide-format telemetry for one car from signal arrays."""
+    n = len(next(iter(signals.values())))
+    return pd.DataFrame({
+        'vehicle_number': vehicle_number,
+        'lap': 1,
+        'meta_time': pd.Timestamp('2025-04-27 14:00') + pd.to_timedelta(np.arange(n) * 50, unit='ms'),
+        **signals,
+    })
+
+
+class TestCoastingPct:
+    """Tests for coasting percentage."""
+
+    def test_missing_samples_are_not_counted(self):
+        """Test that coasting is a share of the samples with both signals."""
+        telemetry = wide_telemetry(
+            ath=np.array([0.0, 2.0, 50.0, 0.0, np.nan, 1.0, 3.0]),
+            pbrake_f=np.array([0.0, 1.0, 0.0, 30.0, 0.0, np.nan, 4.0]),
+        )
+
+        result = tier1_metrics.compute_coasting_pct(telemetry, 7)
+
+        assert result['total_samples'] == 5
+        assert result['coasting_pct'] == 60.0
+
+    def test_other_car_gives_no_samples(self):
+        """Test that a car without telemetry gives NaN."""
+        telemetry = wide_telemetry(ath=np.zeros(5), pbrake_f=np.zeros(5))
+
+        result = tier1_metrics.compute_coasting_pct(telemetry, 8)
+
+        assert np.isnan(result['coasting_pct'])
+        assert result['total_samples'] == 0
+
+
+class TestBrakingSmoothness:
+    """Tests for braking event peaks."""
+
+    def test_event_peaks_exclude_last_braking_sample(self):
+        """Test event bounds, partial events and the 15 bar cut-off."""
+        brake = np.array([
+            30.0, 12, 0,          # already braking at the start: dropped
+            0, 20, 30, 12, 0,     # peak 30
+            0, 16, 40, 0,         # ends after 40, which isn't included: peak 16
+            0, 14, 14, 0,         # peak 14 is too light
+            0, 50, 60             # still braking at the end: dropped
+        ])
+
+        peaks, has_events = tier1_metrics._scan_brake_peaks(brake)
+
+        assert has_events
+        np.testing.assert_array_equal(peaks, [30, 16])
+
+    @pytest.mark.parametrize('dtype', [np.float64, np.float32, np.int64])
+    def test_kernel_matches_numpy_fallback(self, dtype, brake_trace, no_numba):
+        """Test that the Numba scan and the NumPy fallback find the same peaks."""
+        pytest.importorskip('numba')
+        brake = brake_trace(3000).astype(dtype)
+
+        compiled, compiled_events = tier1_metrics._scan_brake_peaks(brake)
+        no_numba()
+        fallback, fallback_events = tier1_metrics._scan_brake_peaks(brake)
+
+        assert compiled_events == fallback_events
+        assert compiled.dtype == fallback.dtype
+        np.testing.assert_array_equal(compiled, fallback)
+        assert len(compiled) > 3
+
+
+class TestThrottleTiming:
+    """Tests for throttle lift-offs and full throttle."""
+
+    def test_lift_offs_only_count_during_acceleration(self):
+        """Test that only >5% drops between two samples above 20% count."""
+        # Drops: 60->50 counts, 54->48 counts, 100->10 leaves acceleration,
+        # 30->24.5 is only 5.5% but counts, 25->19 ends below 20%
+        throttle = [0, 30, 60, 50, 54, 48, 100, 10, 0, 30, 24.5, 25, 19] + [0] * 10
+        telemetry = wide_telemetry(ath=np.array(throttle, dtype=float))
+
+        result = tier1_metrics.compute_throttle_timing(telemetry, 7)
+
+        # Two throttle applications (0 -> 30 twice)
+        assert result['corners_detected'] == 2
+        assert result['lift_off_count'] == 1.5
+        assert result['full_throttle_pct'] == pytest.approx(100 / 23)
+
+    @pytest.mark.parametrize('dtype', [np.float64, np.float32, np.int64])
+    def test_kernel_matches_numpy_fallback(self, dtype, brake_trace, no_numba):
+        """Test that the Numba scan and the NumPy fallback count the same."""
+        pytest.importorskip('numba')
+        throttle = np.clip(brake_trace(3000) * 3, 0, 100).astype(dtype)
+
+        compiled = tier1_metrics._scan_lift_offs(throttle)
+        no_numba()
+        fallback = tier1_metrics._scan_lift_offs(throttle)
+
+        assert compiled == fallback
+        assert compiled[0] > 0 and compiled[1] > 0
+
+
+class TestMetricsForRace:
+    """Tests for race-wide metrics."""
+
+    @pytest.fixture
+    def race(self, brake_trace):
+        """Two cars over three laps, and lap times for one of them."""
+        rng = np.random.default_rng(0)
+        telemetry = pd.concat([
+            wide_telemetry(
+                vehicle_number=veh,
+                ath=np.clip(brake_trace(600, seed=veh) * 3, 0, 100),
+                pbrake_f=brake_trace(600, seed=veh + 1),
+                accx_can=rng.normal(0, 0.5, 600),
+                accy_can=rng.normal(0, 1.0, 600),
+            ).assign(lap=np.repeat([1, 2, 3], 200))
+            for veh in (22, 7)
+        ], ignore_index=True)
+        lap_times = pd.DataFrame({
+            'vehicle_number': 7,
+            'lap': np.arange(1, 7),
+            'lap_time': [101.0, 99.5, 99.0, 98.7, 99.2, 98.9],
+        })
+        return telemetry, lap_times
+
+    @pytest.mark.parametrize('per_lap', [False, True])
+    def test_matches_per_driver_metrics(self, race, per_lap):
+        """Test that grouping the race gives the same rows as filtering per car."""
+        telemetry, lap_times = race
+
+        result = tier1_metrics.compute_metrics_for_race(telemetry, lap_times, per_lap=per_lap)
+
+        laps = [1, 2, 3] if per_lap else [None]
+        expected = pd.DataFrame([
+            tier1_metrics.compute_all_metrics(telemetry, lap_times, veh, lap)
+            for veh in (22, 7) for lap in laps
+        ])
+        pd.testing.assert_frame_equal(result, expected)
+        assert np.isnan(result.loc[result['vehicle_number'] == 22, 'consistency_std']).all()
+        assert result.loc[result['vehicle_number'] == 7, 'consistency_std'].notna().all()